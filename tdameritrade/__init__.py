@@ -5,20 +5,54 @@
 ##-------------------------------##
 
 ## Imports
-from .profile import Profile
-from .session import ClientSession
-from .websocket import ClientWebSocket
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .metrics import Metrics
+    from .options import OptionChain
+    from .orders import Order, OrderTemplate, Slot
+    from .profile import Profile
+    from .session import ClientSession
+    from .streamer import Streamer
+    from .websocket import ClientWebSocket
 
 ## Constants
 __author__ = "Ryan Smith"
 __title__ = "TDAmeritrade PyAPI"
 __version__ = (1, 0, 0)
 __all__ = (
-    "ClientSession", "ClientWebSocket", "Profile"
+    "ClientSession", "ClientWebSocket", "Metrics", "OptionChain", "Order", "OrderTemplate",
+    "Profile", "Slot", "Streamer"
 )
+# -Public names are imported from their submodule on first access (aiohttp et al. are slow)
+LAZY: dict[str, str] = {
+    'ClientSession': ".session",
+    'ClientWebSocket': ".websocket",
+    'Metrics': ".metrics",
+    'OptionChain': ".options",
+    'Order': ".orders",
+    'OrderTemplate': ".orders",
+    'Profile': ".profile",
+    'Slot': ".orders",
+    'Streamer': ".streamer",
+}
 
 
 ## Functions
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def __getattr__(name: str) -> Any:
+    module: str | None = LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 def get_version_string() -> str:
     """Project version as a string"""
     return '.'.join(str(i) for i in __version__)
@@ -0,0 +1,345 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Streaming OHLCV Bar Rings     ##
+##-------------------------------##
+## Every bar is written twice (slot, slot + capacity) so the last N bars are always
+## one contiguous, zero-copy slice no matter where the ring wraps
+
+## Imports
+from __future__ import annotations
+
+from array import array
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from inspect import isawaitable
+from math import isfinite
+from typing import Any
+
+import aiohttp
+
+from . import codec
+from .batching import BatchResult, gather_limited
+from .fields import NAN, ColumnBatch, ServiceSchema
+from .session import ClientSession
+from .stream import StreamRouter
+
+## Constants
+COLUMNS: tuple[str, ...] = ("time", "open", "high", "low", "close", "volume", "vwap")
+TIMEFRAMES: tuple[int, ...] = (60, 300, 900)
+Bar = tuple[float, float, float, float, float, float]
+BarHandler = Callable[["BarBuffer"], Awaitable[None] | None]
+
+
+## Classes
+class BarBuffer:
+    """Fixed-size ring of OHLCV + VWAP bars of one symbol and timeframe"""
+
+    # -Constructor
+    def __init__(self, symbol: str, seconds: int = 60, capacity: int = 1024) -> None:
+        self.symbol: str = symbol
+        self.seconds: int = seconds
+        self.step: int = seconds * 1000
+        self.capacity: int = capacity
+        self.columns: dict[str, array[float]] = {
+            name: array('d', [NAN]) * (2 * capacity) for name in COLUMNS
+        }
+        self.count: int = 0
+        self.late: int = 0
+        self.invalid: int = 0
+        self._value: array[float] = array('d', bytes(16 * capacity))
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    # -Instance Methods: Private
+    def _open(self, start: float, bar: Bar, value: float) -> None:
+        '''Append new bar'''
+        slot: int = self.count % self.capacity
+        self.count += 1
+        columns: dict[str, array[float]] = self.columns
+        for mirror in (slot, slot + self.capacity):
+            columns['time'][mirror] = start
+            columns['open'][mirror] = bar[1]
+            columns['high'][mirror] = bar[2]
+            columns['low'][mirror] = bar[3]
+            columns['close'][mirror] = bar[4]
+            columns['volume'][mirror] = bar[5]
+            columns['vwap'][mirror] = value / bar[5] if bar[5] else bar[4]
+            self._value[mirror] = value
+
+    def _slot(self, start: float) -> int:
+        '''Return slot of bar starting at start, or -1 if not buffered'''
+        if not self.count:
+            return -1
+        current: int = (self.count - 1) % self.capacity
+        back: int = int(self.columns['time'][current] - start) // self.step
+        # -Bars only exist for active intervals, so start is at most back bars back
+        slot: int = current
+        times: array[float] = self.columns['time']
+        for _ in range(min(back + 1, len(self))):
+            if times[slot] == start:
+                return slot
+            if times[slot] < start:
+                return -1
+            slot = (slot - 1) % self.capacity
+        return -1
+
+    def _update(
+        self, slot: int, high: float, low: float, close: float | None, volume: float,
+        value: float
+    ) -> None:
+        '''Fold trade/bar into existing slot (close None: late data keeps close)'''
+        columns: dict[str, array[float]] = self.columns
+        for mirror in (slot, slot + self.capacity):
+            if high > columns['high'][mirror]:
+                columns['high'][mirror] = high
+            if low < columns['low'][mirror]:
+                columns['low'][mirror] = low
+            if close is not None:
+                columns['close'][mirror] = close
+            total: float = columns['volume'][mirror] + volume
+            columns['volume'][mirror] = total
+            self._value[mirror] += value
+            if total:
+                columns['vwap'][mirror] = self._value[mirror] / total
+
+    # -Instance Methods: Public
+    def add_bar(self, bar: Bar) -> bool:
+        '''Fold a finer (time, open, high, low, close, volume) bar; return if a bar opened'''
+        if not _finite(bar):
+            self.invalid += 1
+            return False
+        time_: float = bar[0]
+        start: float = time_ - time_ % self.step
+        # -Without trades, approximate bar value with its typical price
+        value: float = (bar[2] + bar[3] + bar[4]) / 3 * bar[5]
+        if not self.count or start > self.columns['time'][(self.count - 1) % self.capacity]:
+            self._open(start, bar, value)
+            return True
+        slot: int = self._slot(start)
+        if slot < 0:
+            self.late += 1
+        else:
+            current: bool = slot == (self.count - 1) % self.capacity
+            self._update(slot, bar[2], bar[3], bar[4] if current else None, bar[5], value)
+        return False
+
+    def add_trade(self, timestamp: float, price: float, size: float) -> bool:
+        '''Fold a trade (epoch ms); return if it opened a new bar'''
+        if not _finite((timestamp, price, size)):
+            self.invalid += 1
+            return False
+        start: float = timestamp - timestamp % self.step
+        if not self.count or start > self.columns['time'][(self.count - 1) % self.capacity]:
+            self._open(start, (start, price, price, price, price, size), price * size)
+            return True
+        slot: int = self._slot(start)
+        if slot < 0:
+            self.late += 1
+        else:
+            current: bool = slot == (self.count - 1) % self.capacity
+            self._update(slot, price, price, price if current else None, size, price * size)
+        return False
+
+    def bars(self) -> list[Bar]:
+        '''Return copies of buffered bars, oldest first'''
+        size: int = len(self)
+        start: int = (self.count - size) % self.capacity
+        columns: list[array[float]] = [self.columns[name] for name in COLUMNS[:6]]
+        return [
+            (
+                columns[0][i], columns[1][i], columns[2][i], columns[3][i], columns[4][i],
+                columns[5][i]
+            )
+            for i in range(start, start + size)
+        ]
+
+    def last(self, name: str, n: int | None = None) -> memoryview:
+        '''Zero-copy view of column over the last n (default: all buffered) bars'''
+        size: int = len(self) if n is None else min(n, len(self))
+        start: int = (self.count - size) % self.capacity
+        return memoryview(self.columns[name])[start:start + size]
+
+    def ndarray(self, name: str, n: int | None = None) -> Any:
+        '''Zero-copy numpy array of column over the last n bars (requires numpy)'''
+        import numpy  #type: ignore
+        return numpy.frombuffer(self.last(name, n), dtype=numpy.float64)
+
+    def prepend(self, bars: Iterable[Bar]) -> None:
+        '''Insert history before buffered bars (overlapping history is dropped)'''
+        existing: list[Bar] = self.bars()
+        values: list[float] = [
+            self._value[(self.count - len(existing) + i) % self.capacity]
+            for i in range(len(existing))
+        ]
+        first: float = existing[0][0] if existing else float('inf')
+        self.count = 0
+        for bar in bars:
+            if bar[0] - bar[0] % self.step < first:
+                self.add_bar(bar)
+            else:
+                break
+        for bar, value in zip(existing, values):
+            self._open(bar[0], bar, value)
+
+
+class BarAggregator:
+    """Per-symbol bar rings of several timeframes fed by CHART/TIMESALE stream data"""
+
+    # -Constructor
+    def __init__(self, timeframes: Sequence[int] = TIMEFRAMES, capacity: int = 1024) -> None:
+        self.timeframes: tuple[int, ...] = tuple(timeframes)
+        self.capacity: int = capacity
+        self.buffers: dict[str, tuple[BarBuffer, ...]] = {}
+        self.handlers: list[BarHandler] = []
+
+    # -Dunder Methods
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.buffers
+
+    # -Instance Methods: Private
+    async def _closed(self, buffers: list[BarBuffer]) -> None:
+        '''Call handlers with every buffer whose previous bar just completed'''
+        for buffer in buffers:
+            for handler in self.handlers:
+                result = handler(buffer)
+                if isawaitable(result):
+                    await result
+
+    def _buffers(self, symbol: str) -> tuple[BarBuffer, ...]:
+        '''Return (creating if needed) buffers of symbol, one per timeframe'''
+        buffers: tuple[BarBuffer, ...] | None = self.buffers.get(symbol)
+        if buffers is None:
+            buffers = self.buffers[symbol] = tuple(
+                BarBuffer(symbol, seconds, self.capacity) for seconds in self.timeframes
+            )
+        return buffers
+
+    async def _history(
+        self, job: tuple[ClientSession, str, int, bool]
+    ) -> list[Bar]:
+        '''Fetch one symbol's minute candles'''
+        session, symbol, days, extended_hours = job
+        response: aiohttp.ClientResponse = await session.get_price_history(
+            symbol, ("minute", 1), period=("day", days), extended_hours=extended_hours
+        )
+        data: dict[str, Any] = await response.json(loads=codec.loads)
+        return [
+            (
+                float(candle['datetime']), candle['open'], candle['high'], candle['low'],
+                candle['close'], candle['volume']
+            )
+            for candle in data.get('candles', ())
+        ]
+
+    # -Instance Methods: Public
+    def add_handler(self, handler: BarHandler) -> None:
+        '''Register handler called with a buffer each time its last bar completes'''
+        self.handlers.append(handler)
+
+    def attach(self, router: StreamRouter, service: str = "TIMESALE_EQUITY") -> None:
+        '''Feed buffers from router data of a TIMESALE_* or CHART_* service'''
+        router.add_data_handler(
+            service, self.apply_chart if service.startswith("CHART") else self.apply_timesale,
+            decode=False
+        )
+
+    async def apply_chart(self, payload: ColumnBatch | dict[str, Any]) -> None:
+        '''Fold CHART_EQUITY/CHART_FUTURES minute bars'''
+        closed: list[BarBuffer] = []
+        if isinstance(payload, ColumnBatch):
+            schema: ServiceSchema = payload.schema
+            fields: list[array[float]] = [
+                payload.columns[schema.column(name)] for name in (
+                    "chart_time", "open_price", "high_price", "low_price", "close_price",
+                    "volume"
+                )
+            ]
+            for row in range(payload.size):
+                bar: Bar = (
+                    fields[0][row], fields[1][row], fields[2][row], fields[3][row],
+                    fields[4][row], fields[5][row]
+                )
+                if not _finite(bar):
+                    continue
+                for buffer in self._buffers(payload.keys[row]):
+                    if buffer.add_bar(bar) and buffer.count > 1:
+                        closed.append(buffer)
+        else:
+            futures: bool = payload.get('service') == "CHART_FUTURES"
+            for content in payload.get('content', ()):
+                bar = tuple(
+                    content.get(key) for key in (
+                        ('1', '2', '3', '4', '5', '6') if futures else
+                        ('7', '1', '2', '3', '4', '5')
+                    )
+                )
+                if not _finite(bar):
+                    continue
+                for buffer in self._buffers(content['key']):
+                    if buffer.add_bar(bar) and buffer.count > 1:
+                        closed.append(buffer)
+        await self._closed(closed)
+
+    async def apply_timesale(self, payload: ColumnBatch | dict[str, Any]) -> None:
+        '''Fold TIMESALE_* trades'''
+        closed: list[BarBuffer] = []
+        if isinstance(payload, ColumnBatch):
+            schema: ServiceSchema = payload.schema
+            times: array[float] = payload.columns[schema.column("trade_time")]
+            prices: array[float] = payload.columns[schema.column("last_price")]
+            sizes: array[float] = payload.columns[schema.column("last_size")]
+            for row in range(payload.size):
+                if not _finite((times[row], prices[row], sizes[row])):
+                    continue
+                for buffer in self._buffers(payload.keys[row]):
+                    opened: bool = buffer.add_trade(times[row], prices[row], sizes[row])
+                    if opened and buffer.count > 1:
+                        closed.append(buffer)
+        else:
+            for content in payload.get('content', ()):
+                timestamp: float = content.get('1')
+                price: float = content.get('2')
+                size: float = content.get('3')
+                if not _finite((timestamp, price, size)):
+                    continue
+                for buffer in self._buffers(content['key']):
+                    if buffer.add_trade(timestamp, price, size) and buffer.count > 1:
+                        closed.append(buffer)
+        await self._closed(closed)
+
+    async def backfill(
+        self, session: ClientSession, symbols: Sequence[str], *, days: int = 1,
+        extended_hours: bool = False, concurrency: int = 8
+    ) -> BatchResult[str, int]:
+        '''Seed buffers with minute price history; return bars loaded per symbol'''
+        jobs: list[tuple[ClientSession, str, int, bool]] = [
+            (session, symbol, days, extended_hours) for symbol in symbols
+        ]
+        result: BatchResult[str, int] = BatchResult()
+        for symbol, history in zip(
+            symbols, await gather_limited(self._history, jobs, concurrency)
+        ):
+            if isinstance(history, BaseException):
+                result.errors[(symbol,)] = history
+                continue
+            for buffer in self._buffers(symbol):
+                buffer.prepend(history)
+            result[symbol] = len(history)
+        return result
+
+    def get(self, symbol: str, seconds: int = 60) -> BarBuffer:
+        '''Return buffer of symbol + timeframe'''
+        return self.buffers[symbol][self.timeframes.index(seconds)]
+
+
+## Functions
+def _finite(values: Iterable[Any]) -> bool:
+    """Return if every value is a finite number (NaN/inf/missing fields poison bars)"""
+    try:
+        return all(isfinite(value) for value in values)
+    except TypeError:
+        return False
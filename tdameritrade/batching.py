@@ -0,0 +1,52 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Request Batching Utils        ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Generic, TypeVar
+
+## Constants
+T = TypeVar('T')
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+## Classes
+class BatchResult(dict[K, V], Generic[K, V]):
+    """Merged results of a chunked request with per-chunk failures"""
+
+    # -Constructor
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: dict[tuple[str, ...], BaseException] = {}
+
+    # -Instance Methods
+    def raise_errors(self) -> None:
+        '''Raise first chunk failure, if any'''
+        for error in self.errors.values():
+            raise error
+
+
+## Functions
+def chunked(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    """Split items into sequences of at most size"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+async def gather_limited(
+    function: Callable[[T], Awaitable[V]], items: Sequence[T], concurrency: int
+) -> list[V | BaseException]:
+    """Run function over items with at most concurrency in flight; failures are returned"""
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: T) -> V:
+        async with semaphore:
+            return await function(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
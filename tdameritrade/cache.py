@@ -0,0 +1,109 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Response Cache                ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+
+import aiohttp
+
+## Constants
+CacheKey = tuple[str, Hashable]
+DEFAULT_TTLS: dict[str, float] = {
+    'accounts': 5.0,
+    'instruments': 86400.0,
+    'market_hours': 3600.0,
+    'preferences': 300.0,
+    'user_principals': 300.0,
+    'watchlists': 60.0,
+}
+
+
+## Classes
+class ResponseCache:
+    """TTL + LRU cache of read HTTP responses with request coalescing"""
+
+    # -Constructor
+    def __init__(
+        self, ttls: dict[str, float] | None = None, maxsize: int = 256
+    ) -> None:
+        self.ttls: dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+        self._entries: OrderedDict[CacheKey, tuple[float, aiohttp.ClientResponse]] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Task[aiohttp.ClientResponse]] = {}
+        # -Bumped by invalidate; loads started under an older generation are not stored
+        self._generations: dict[str, int] = {}
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -Instance Methods: Private
+    async def _load(
+        self, key: CacheKey, fetch: Callable[[], Awaitable[aiohttp.ClientResponse]],
+        generation: int
+    ) -> aiohttp.ClientResponse:
+        '''Fetch, read body and store response unless its kind was invalidated meanwhile'''
+        try:
+            response: aiohttp.ClientResponse = await fetch()
+            await response.read()
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        if self._generations.get(key[0], 0) != generation:
+            return response
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self._entries[key] = (loop.time() + self.ttls[key[0]], response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return response
+
+    # -Instance Methods: Public
+    async def get(
+        self, kind: str, key: Hashable,
+        fetch: Callable[[], Awaitable[aiohttp.ClientResponse]]
+    ) -> aiohttp.ClientResponse:
+        '''Return cached response or fetch it once for all concurrent callers'''
+        if kind not in self.ttls:
+            return await fetch()
+        cache_key: CacheKey = (kind, key)
+        entry: tuple[float, aiohttp.ClientResponse] | None = self._entries.get(cache_key)
+        if entry is not None:
+            if entry[0] > asyncio.get_running_loop().time():
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[cache_key]
+        task: asyncio.Task[aiohttp.ClientResponse] | None = self._inflight.get(cache_key)
+        if task is None:
+            self.misses += 1
+            task = self._inflight[cache_key] = asyncio.create_task(
+                self._load(cache_key, fetch, self._generations.get(kind, 0))
+            )
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        '''Drop every cached (and in-flight) response'''
+        self.invalidate(*self.ttls)
+
+    def invalidate(self, *kinds: str) -> None:
+        '''Drop cached responses of endpoint kinds; reads already in flight are not stored'''
+        for kind in kinds:
+            self._generations[kind] = self._generations.get(kind, 0) + 1
+        for key in [key for key in self._entries if key[0] in kinds]:
+            del self._entries[key]
+        # -Later reads fetch fresh data instead of joining a pre-mutation request
+        for key in [key for key in self._inflight if key[0] in kinds]:
+            del self._inflight[key]
@@ -0,0 +1,41 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## JSON Codec                    ##
+##-------------------------------##
+
+## Imports
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  #type: ignore
+
+## Constants
+__all__ = (
+    "dumps", "loads"
+)
+
+
+## Functions
+if orjson is not None:
+    def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+        """Serialize object to JSON string (orjson)"""
+        return orjson.dumps(obj, default=default).decode()
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON string/bytes (orjson)"""
+        return orjson.loads(data)
+else:
+    def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+        """Serialize object to JSON string"""
+        return json.dumps(obj, default=default, separators=(',', ':'))
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON string/bytes"""
+        return json.loads(data)
@@ -0,0 +1,176 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Streamer Service Fields       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+## Constants
+NAN: float = float('nan')
+
+
+## Classes
+class ServiceSchema:
+    """Streamer service numeric field layout"""
+
+    __slots__ = ("service", "names", "numeric", "index", "_fill")
+
+    # -Constructor
+    def __init__(self, service: str, names: Sequence[str], text: Iterable[int] = ()) -> None:
+        self.service: str = service
+        self.names: tuple[str, ...] = tuple(names)
+        text_ids: frozenset[int] = frozenset(text)
+        self.numeric: tuple[int, ...] = tuple(
+            i for i in range(1, len(self.names)) if i not in text_ids
+        )
+        # -Map raw (string) field keys to column slots; text fields map to -1
+        self.index: dict[str, int] = {
+            str(i): (self.numeric.index(i) if i in self.numeric else -1)
+            for i in range(1, len(self.names))
+        }
+        self._fill: array[float] = array('d')
+
+    # -Instance Methods
+    def blank(self, capacity: int) -> array[float]:
+        '''Return NaN-filled template of at least capacity rows'''
+        if len(self._fill) < capacity:
+            self._fill = array('d', [NAN]) * max(capacity, 2 * len(self._fill))
+        return self._fill
+
+    def column(self, name: str) -> int:
+        '''Return column slot of field name'''
+        return self.numeric.index(self.names.index(name))
+
+    def create_batch(self, capacity: int = 256) -> ColumnBatch:
+        '''Create a preallocated column batch for this service'''
+        return ColumnBatch(self, capacity)
+
+    # -Properties
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(self.names[i] for i in self.numeric)
+
+
+class ColumnBatch:
+    """Reusable array-backed batch of decoded service rows"""
+
+    __slots__ = ("schema", "capacity", "size", "keys", "columns", "text", "timestamp")
+
+    # -Constructor
+    def __init__(self, schema: ServiceSchema, capacity: int = 256) -> None:
+        self.schema: ServiceSchema = schema
+        self.capacity: int = capacity
+        self.size: int = 0
+        self.keys: list[str] = []
+        self.columns: list[array[float]] = [
+            array('d', schema.blank(capacity)[:capacity]) for _ in schema.numeric
+        ]
+        self.text: list[dict[str, Any] | None] = []
+        self.timestamp: int = 0
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return self.size
+
+    # -Instance Methods
+    def _grow(self, capacity: int) -> None:
+        '''Grow columns to hold capacity rows'''
+        fill: array[float] = self.schema.blank(capacity)
+        for column in self.columns:
+            column.extend(fill[:capacity - self.capacity])
+        self.capacity = capacity
+
+    def decode(self, content: Sequence[dict[str, Any]], timestamp: int = 0) -> ColumnBatch:
+        '''Decode raw service content into batch, reusing storage'''
+        count: int = len(content)
+        if count > self.capacity:
+            self._grow(max(count, 2 * self.capacity))
+        # -Reset rows in use to NaN (missing fields stay NaN)
+        fill: array[float] = self.schema.blank(count)
+        columns: list[array[float]] = self.columns
+        for column in columns:
+            column[:count] = fill[:count]
+        keys: list[str] = self.keys
+        keys.clear()
+        text: list[dict[str, Any] | None] = self.text
+        text.clear()
+        index: dict[str, int] = self.schema.index
+        for row, item in enumerate(content):
+            extra: dict[str, Any] | None = None
+            for field, value in item.items():
+                slot: int = index.get(field, -2)
+                if slot >= 0:
+                    columns[slot][row] = value
+                elif slot == -1:
+                    if extra is None:
+                        extra = {}
+                    extra[field] = value
+            keys.append(item['key'])
+            text.append(extra)
+        self.size = count
+        self.timestamp = timestamp
+        return self
+
+    def get(self, row: int, name: str) -> float:
+        '''Return value of field name for row'''
+        return self.columns[self.schema.column(name)][row]
+
+    def view(self, name: str) -> memoryview:
+        '''Return zero-copy view of the rows in use for field name'''
+        return memoryview(self.columns[self.schema.column(name)])[:self.size]
+
+
+## Functions
+def _schema(service: str, names: str, text: Iterable[int] = ()) -> ServiceSchema:
+    '''Build schema from whitespace separated field names'''
+    return ServiceSchema(service, names.split(), text)
+
+
+## Schemas
+QUOTE: ServiceSchema = _schema("QUOTE", """
+    symbol bid_price ask_price last_price bid_size ask_size ask_id bid_id
+    total_volume last_size trade_time quote_time high_price low_price bid_tick
+    close_price exchange_id marginable shortable island_bid island_ask
+    island_volume quote_day trade_day volatility description last_id digits
+    open_price net_change high_52_week low_52_week pe_ratio dividend_amount
+    dividend_yield island_bid_size island_ask_size nav fund_price exchange_name
+    dividend_date regular_market_quote regular_market_trade
+    regular_market_last_price regular_market_last_size regular_market_trade_time
+    regular_market_trade_day regular_market_net_change security_status mark
+    quote_time_long trade_time_long regular_market_trade_time_long
+""", text=(6, 7, 14, 16, 17, 18, 25, 26, 39, 40, 41, 42, 48))
+LEVELONE_FUTURES: ServiceSchema = _schema("LEVELONE_FUTURES", """
+    symbol bid_price ask_price last_price bid_size ask_size ask_id bid_id
+    total_volume last_size quote_time trade_time high_price low_price close_price
+    exchange_id description last_id open_price net_change future_percent_change
+    exchange_name security_status open_interest mark tick tick_amount product
+    future_price_format future_trading_hours future_is_tradable future_multiplier
+    future_is_active future_settlement_price future_active_symbol
+    future_expiration_date
+""", text=(6, 7, 15, 16, 17, 21, 22, 27, 28, 29, 30, 32, 34))
+CHART_EQUITY: ServiceSchema = _schema("CHART_EQUITY", """
+    symbol open_price high_price low_price close_price volume sequence chart_time
+    chart_day
+""")
+CHART_FUTURES: ServiceSchema = _schema("CHART_FUTURES", """
+    symbol chart_time open_price high_price low_price close_price volume
+""")
+TIMESALE: str = "symbol trade_time last_price last_size last_sequence"
+TIMESALE_EQUITY: ServiceSchema = _schema("TIMESALE_EQUITY", TIMESALE)
+TIMESALE_FOREX: ServiceSchema = _schema("TIMESALE_FOREX", TIMESALE)
+TIMESALE_FUTURES: ServiceSchema = _schema("TIMESALE_FUTURES", TIMESALE)
+TIMESALE_OPTIONS: ServiceSchema = _schema("TIMESALE_OPTIONS", TIMESALE)
+SCHEMAS: dict[str, ServiceSchema] = {
+    schema.service: schema for schema in (
+        QUOTE, LEVELONE_FUTURES, CHART_EQUITY, CHART_FUTURES,
+        TIMESALE_EQUITY, TIMESALE_FOREX, TIMESALE_FUTURES, TIMESALE_OPTIONS,
+    )
+}
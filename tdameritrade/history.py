@@ -0,0 +1,235 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Price History + Candle Cache  ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import mmap
+import os
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from . import codec
+from .batching import BatchResult, gather_limited
+from .session import EXCHANGE_TIMEZONE, ClientSession
+
+## Constants
+COLUMNS: tuple[str, ...] = ("datetime", "open", "high", "low", "close", "volume")
+
+
+## Classes
+class CandleSeries:
+    """Columnar candle series backed by arrays or a memory-mapped file"""
+
+    __slots__ = ("datetime", "open", "high", "low", "close", "volume", "_buffer")
+
+    # -Constructor
+    def __init__(self, columns: Sequence[Any], buffer: Any = None) -> None:
+        self.datetime: Any
+        self.open: Any
+        self.high: Any
+        self.low: Any
+        self.close: Any
+        self.volume: Any
+        for name, column in zip(COLUMNS, columns):
+            setattr(self, name, column)
+        self._buffer: Any = buffer
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return len(self.datetime)
+
+    # -Instance Methods
+    def to_bytes(self) -> bytes:
+        '''Serialize as contiguous columns of doubles'''
+        return b''.join(bytes(memoryview(getattr(self, name))) for name in COLUMNS)
+
+    # -Class Methods
+    @classmethod
+    def concat(cls, series: Iterable[CandleSeries]) -> CandleSeries:
+        '''Concatenate series (copies)'''
+        columns: list[array[float]] = [array('d') for _ in COLUMNS]
+        for item in series:
+            for column, name in zip(columns, COLUMNS):
+                column.frombytes(memoryview(getattr(item, name)).tobytes())
+        return cls(columns)
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> CandleSeries:
+        '''Zero-copy series over a columnar buffer'''
+        view = memoryview(buffer).cast('d')
+        size: int = len(view) // len(COLUMNS)
+        return cls([view[i * size:(i + 1) * size] for i in range(len(COLUMNS))], buffer)
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[dict[str, Any]]) -> CandleSeries:
+        '''Build series from price history candle dicts'''
+        columns: list[array[float]] = [array('d') for _ in COLUMNS]
+        for candle in candles:
+            for column, name in zip(columns, COLUMNS):
+                column.append(candle[name])
+        return cls(columns)
+
+
+class CandleCache:
+    """On-disk columnar candle cache keyed by symbol, frequency, session hours + exchange day"""
+
+    # -Constructor
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root: Path = Path(root)
+
+    # -Instance Methods
+    def path(
+        self, symbol: str, frequency: tuple[str, int], day: date, extended_hours: bool = False
+    ) -> Path:
+        '''Return file path of cached day'''
+        kind: str = f"{frequency[0]}-{frequency[1]}" + ("-ext" if extended_hours else "")
+        return self.root / kind / symbol / f"{day.isoformat()}.bin"
+
+    def has(
+        self, symbol: str, frequency: tuple[str, int], day: date, extended_hours: bool = False
+    ) -> bool:
+        '''Return if day is cached'''
+        return self.path(symbol, frequency, day, extended_hours).exists()
+
+    def load(
+        self, symbol: str, frequency: tuple[str, int], day: date, extended_hours: bool = False
+    ) -> CandleSeries | None:
+        '''Return memory-mapped series of cached day'''
+        path: Path = self.path(symbol, frequency, day, extended_hours)
+        try:
+            with open(path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return CandleSeries.from_buffer(b'')
+                return CandleSeries.from_buffer(
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+        except FileNotFoundError:
+            return None
+
+    def store(
+        self, symbol: str, frequency: tuple[str, int], day: date, series: CandleSeries,
+        extended_hours: bool = False
+    ) -> None:
+        '''Atomically write series of day'''
+        path: Path = self.path(symbol, frequency, day, extended_hours)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp: Path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp, 'wb') as file:
+            file.write(series.to_bytes())
+        os.replace(temp, path)
+
+
+class HistoryDownloader:
+    """Concurrent bulk price history fetcher filling a CandleCache"""
+
+    # -Constructor
+    def __init__(
+        self, session: ClientSession, cache: CandleCache, *,
+        concurrency: int = 8, max_days: int = 10
+    ) -> None:
+        self.session: ClientSession = session
+        self.cache: CandleCache = cache
+        self.concurrency: int = concurrency
+        self.max_days: int = max_days
+
+    # -Instance Methods: Private
+    def _missing(
+        self, symbol: str, frequency: tuple[str, int], start: date, end: date,
+        extended_hours: bool
+    ) -> list[tuple[date, date]]:
+        '''Return contiguous uncached day ranges (at most max_days long)'''
+        ranges: list[tuple[date, date]] = []
+        day: date = start
+        while day <= end:
+            if self.cache.has(symbol, frequency, day, extended_hours):
+                day += timedelta(days=1)
+                continue
+            first: date = day
+            while (
+                day + timedelta(days=1) <= end
+                and (day + timedelta(days=1) - first).days < self.max_days
+                and not self.cache.has(
+                    symbol, frequency, day + timedelta(days=1), extended_hours
+                )
+            ):
+                day += timedelta(days=1)
+            ranges.append((first, day))
+            day += timedelta(days=1)
+        return ranges
+
+    async def _download(
+        self, job: tuple[str, tuple[str, int], date, date, bool]
+    ) -> dict[date, CandleSeries]:
+        '''Fetch one symbol range and cache its completed days (empty ones: weekends only)'''
+        symbol, frequency, first, last, extended_hours = job
+        response: aiohttp.ClientResponse = await self.session.get_price_history(
+            symbol, frequency, extended_hours=extended_hours,
+            from_date=first, to_date=last + timedelta(days=1)
+        )
+        data: dict[str, Any] = await response.json(loads=codec.loads)
+        days: dict[date, list[dict[str, Any]]] = {}
+        # -Bucket by exchange day, matching the ET day bounds of get_price_history
+        for candle in data.get('candles', ()):
+            day: date = datetime.fromtimestamp(
+                candle['datetime'] / 1000, EXCHANGE_TIMEZONE
+            ).date()
+            if first <= day <= last:
+                days.setdefault(day, []).append(candle)
+        today: date = datetime.now(EXCHANGE_TIMEZONE).date()
+        result: dict[date, CandleSeries] = {}
+        day = first
+        while day <= last:
+            series: CandleSeries = CandleSeries.from_candles(days.get(day, ()))
+            # -Today may still grow and an empty weekday may be an outage; only persist final
+            # data (empty weekends are stored as empty files so they are never re-fetched)
+            if day < today and (len(series) or day.weekday() >= 5):
+                self.cache.store(symbol, frequency, day, series, extended_hours)
+            result[day] = series
+            day += timedelta(days=1)
+        return result
+
+    # -Instance Methods: Public
+    async def fetch(
+        self, symbols: Sequence[str], frequency: tuple[str, int], start: date, end: date,
+        *, extended_hours: bool = False
+    ) -> BatchResult[str, list[CandleSeries]]:
+        '''Return per-day candle series of symbols, downloading only uncached days'''
+        jobs: list[tuple[str, tuple[str, int], date, date, bool]] = [
+            (symbol, frequency, first, last, extended_hours)
+            for symbol in symbols
+            for first, last in self._missing(symbol, frequency, start, end, extended_hours)
+        ]
+        fetched: dict[tuple[str, date], CandleSeries] = {}
+        result: BatchResult[str, list[CandleSeries]] = BatchResult()
+        for job, days in zip(jobs, await gather_limited(self._download, jobs, self.concurrency)):
+            if isinstance(days, BaseException):
+                result.errors[(job[0], job[2].isoformat(), job[3].isoformat())] = days
+                continue
+            for day, series in days.items():
+                fetched[(job[0], day)] = series
+        failed: set[str] = {key[0] for key in result.errors}
+        for symbol in symbols:
+            if symbol in failed:
+                continue
+            series_list: list[CandleSeries] = []
+            day = start
+            while day <= end:
+                cached: CandleSeries | None = fetched.get((symbol, day))
+                if cached is None:
+                    cached = self.cache.load(symbol, frequency, day, extended_hours)
+                if cached is not None and len(cached):
+                    series_list.append(cached)
+                day += timedelta(days=1)
+            result[symbol] = series_list
+        return result
@@ -0,0 +1,154 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Local Instrument Index        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import os
+import sqlite3
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from . import codec
+from .batching import BatchResult, chunked, gather_limited
+from .session import ClientSession
+
+
+## Classes
+class InstrumentIndex:
+    """Persistent SQLite instrument index mirrored in memory for symbol/CUSIP lookups"""
+
+    # -Constructor
+    def __init__(self, path: str | os.PathLike[str], timeout: float = 30.0) -> None:
+        self.path: Path = Path(path)
+        self.timeout: float = timeout
+        self.instruments: dict[str, dict[str, Any]] = {}
+        self.cusips: dict[str, str] = {}
+        self.symbols: list[str] = []
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS instruments ("
+                "symbol TEXT PRIMARY KEY, cusip TEXT, description TEXT, "
+                "exchange TEXT, asset_type TEXT, data TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS instruments_cusip ON instruments (cusip)"
+            )
+            for (data,) in connection.execute("SELECT data FROM instruments"):
+                self._add(codec.loads(data))
+        self.symbols = sorted(self.instruments)
+
+    # -Dunder Methods
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.instruments
+
+    def __len__(self) -> int:
+        return len(self.instruments)
+
+    # -Instance Methods: Private
+    def _add(self, instrument: dict[str, Any]) -> bool:
+        '''Add instrument to memory; return if its symbol is new'''
+        symbol: str = instrument['symbol']
+        new: bool = symbol not in self.instruments
+        self.instruments[symbol] = instrument
+        if instrument.get('cusip'):
+            self.cusips[instrument['cusip']] = symbol
+        return new
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection: sqlite3.Connection = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    async def _search(
+        self, session: ClientSession, symbols: Sequence[str]
+    ) -> list[dict[str, Any]]:
+        '''Fetch instruments of one symbol chunk'''
+        response: aiohttp.ClientResponse = await session.search_instruments(symbols)
+        found: dict[str, dict[str, Any]] = await response.json(loads=codec.loads)
+        return list(found.values())
+
+    # -Instance Methods: Public
+    def get(self, symbol: str) -> dict[str, Any] | None:
+        '''Return indexed instrument of symbol'''
+        return self.instruments.get(symbol)
+
+    def resolve(self, cusip: str) -> dict[str, Any] | None:
+        '''Return indexed instrument of CUSIP'''
+        symbol: str | None = self.cusips.get(cusip)
+        return None if symbol is None else self.instruments[symbol]
+
+    def search(self, prefix: str, limit: int = 50) -> list[dict[str, Any]]:
+        '''Return instruments whose symbol starts with prefix, in symbol order'''
+        prefix = prefix.upper()
+        start: int = bisect_left(self.symbols, prefix)
+        found: list[dict[str, Any]] = []
+        for symbol in self.symbols[start:start + limit]:
+            if not symbol.startswith(prefix):
+                break
+            found.append(self.instruments[symbol])
+        return found
+
+    def store(self, instruments: Iterable[dict[str, Any]]) -> int:
+        '''Upsert instruments into memory + disk; return number of new symbols'''
+        rows: list[tuple[Any, ...]] = []
+        added: list[str] = []
+        for instrument in instruments:
+            if self._add(instrument):
+                added.append(instrument['symbol'])
+            rows.append((
+                instrument['symbol'], instrument.get('cusip'), instrument.get('description'),
+                instrument.get('exchange'), instrument.get('assetType'), codec.dumps(instrument)
+            ))
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO instruments VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        if added:
+            # -Timsort merges the sorted runs in linear time
+            self.symbols.extend(sorted(added))
+            self.symbols.sort()
+        return len(added)
+
+    def validate(self, symbols: Iterable[str]) -> tuple[list[str], list[str]]:
+        '''Split symbols into (indexed, unknown) without any I/O'''
+        known: list[str] = []
+        unknown: list[str] = []
+        for symbol in symbols:
+            (known if symbol in self.instruments else unknown).append(symbol)
+        return known, unknown
+
+    async def warm(
+        self, session: ClientSession, symbols: Sequence[str], *, refresh: bool = False,
+        chunk_size: int = 250, concurrency: int = 4
+    ) -> BatchResult[str, bool]:
+        '''Bulk fetch symbols missing from the index; return whether each was found (failed
+        chunks land in errors, keyed by their symbols)'''
+        missing: list[str] = list(symbols) if refresh else self.validate(symbols)[1]
+        chunks: list[Sequence[str]] = chunked(missing, chunk_size)
+        result: BatchResult[str, bool] = BatchResult()
+        for chunk, found in zip(chunks, await gather_limited(
+            lambda chunk: self._search(session, chunk), chunks, concurrency
+        )):
+            if isinstance(found, BaseException):
+                result.errors[tuple(chunk)] = found
+                continue
+            self.store(found)
+            for symbol in chunk:
+                result[symbol] = symbol in self.instruments
+        return result
@@ -0,0 +1,257 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Transaction + Order History   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from . import codec
+from .batching import gather_limited
+from .session import ClientSession
+from .tracker import FINAL_STATUSES
+
+## Constants
+KINDS: dict[str, tuple[str, str, bool]] = {
+    # -kind: (id field, date field, mutable: later copies replace stored ones)
+    'transactions': ("transactionId", "transactionDate", False),
+    'orders': ("orderId", "enteredTime", True),
+}
+Window = tuple[date, date]
+WindowFetch = Callable[[date, date], Awaitable[list[dict[str, Any]]]]
+
+
+## Classes
+class LedgerStore:
+    """Append-only SQLite history of transactions/orders with per-account high-water marks"""
+
+    # -Constructor
+    def __init__(self, path: str | os.PathLike[str], timeout: float = 30.0) -> None:
+        self.path: Path = Path(path)
+        self.timeout: float = timeout
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "kind TEXT NOT NULL, account_id INTEGER NOT NULL, id INTEGER NOT NULL, "
+                "date TEXT, data TEXT NOT NULL, PRIMARY KEY (kind, account_id, id))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS marks ("
+                "kind TEXT NOT NULL, account_id INTEGER NOT NULL, date TEXT NOT NULL, "
+                "PRIMARY KEY (kind, account_id))"
+            )
+
+    # -Instance Methods: Private
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection: sqlite3.Connection = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # -Instance Methods: Public
+    def append(self, kind: str, account_id: int, records: Iterable[dict[str, Any]]) -> int:
+        '''Insert records not stored yet (orders: or changed); return number written'''
+        id_field, date_field, mutable = KINDS[kind]
+        conflict: str = "REPLACE" if mutable else "IGNORE"
+        with self._connect() as connection:
+            before: int = connection.total_changes
+            connection.executemany(
+                f"INSERT OR {conflict} INTO records VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        kind, account_id, record[id_field], record.get(date_field),
+                        codec.dumps(record)
+                    )
+                    for record in records
+                )
+            )
+            return connection.total_changes - before
+
+    def count(self, kind: str, account_id: int) -> int:
+        '''Return number of stored records'''
+        with self._connect() as connection:
+            row: tuple[int] = connection.execute(
+                "SELECT COUNT(*) FROM records WHERE kind = ? AND account_id = ?",
+                (kind, account_id)
+            ).fetchone()
+        return row[0]
+
+    def mark(self, kind: str, account_id: int) -> date | None:
+        '''Return last fully synced day'''
+        with self._connect() as connection:
+            row: tuple[str] | None = connection.execute(
+                "SELECT date FROM marks WHERE kind = ? AND account_id = ?", (kind, account_id)
+            ).fetchone()
+        return None if row is None else date.fromisoformat(row[0])
+
+    def open_orders(self, account_id: int, before: date) -> list[int]:
+        '''Return ids of stored orders entered before day that were not final when stored'''
+        statuses: list[str] = sorted(FINAL_STATUSES)
+        with self._connect() as connection:
+            rows: list[tuple[int]] = connection.execute(
+                "SELECT id FROM records WHERE kind = 'orders' AND account_id = ? AND date < ? "
+                f"AND json_extract(data, '$.status') NOT IN ({', '.join('?' * len(statuses))})",
+                (account_id, before.isoformat(), *statuses)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def records(self, kind: str, account_id: int) -> Iterator[dict[str, Any]]:
+        '''Yield stored records in date order without loading them all'''
+        with self._connect() as connection:
+            cursor: sqlite3.Cursor = connection.execute(
+                "SELECT data FROM records WHERE kind = ? AND account_id = ? ORDER BY date, id",
+                (kind, account_id)
+            )
+            for (data,) in cursor:
+                yield codec.loads(data)
+
+    def set_mark(self, kind: str, account_id: int, day: date) -> None:
+        '''Record day as fully synced'''
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO marks VALUES (?, ?, ?) ON CONFLICT(kind, account_id) "
+                "DO UPDATE SET date = excluded.date", (kind, account_id, day.isoformat())
+            )
+
+    async def sync(
+        self, session: ClientSession, account_id: int, kind: str = "transactions", *,
+        start: date | None = None, window: int = 30, concurrency: int = 4
+    ) -> int:
+        '''Fetch records since the high-water mark (or start) + still open orders; return
+        number of records written'''
+        today: date = datetime.now(timezone.utc).date()
+        mark: date | None = self.mark(kind, account_id)
+        # -Re-read the mark day itself; records landing after the last sync are deduplicated
+        first: date = mark if mark is not None else start or today - timedelta(days=365)
+        fetch: WindowFetch = (
+            _order_fetch if kind == "orders" else _transaction_fetch
+        )(session, account_id)
+        added: int = 0
+        async for (_, last), records in fetch_windows(
+            fetch, date_windows(first, today, window), concurrency
+        ):
+            added += self.append(kind, account_id, records)
+            # -Today may still gain records; never mark past yesterday
+            self.set_mark(kind, account_id, min(last, today - timedelta(days=1)))
+        if kind == "orders":
+            # -Working/GTC orders entered before the windows can still change; re-fetch them
+            open_ids: list[int] = self.open_orders(account_id, first)
+            fetch_order: Callable[[int], Awaitable[dict[str, Any]]] = _single_order_fetch(
+                session, account_id
+            )
+            refreshed: list[dict[str, Any] | BaseException] = await gather_limited(
+                fetch_order, open_ids, concurrency
+            )
+            # -Failed fetches stay open and are retried by the next sync
+            added += self.append(kind, account_id, (
+                order for order in refreshed if not isinstance(order, BaseException)
+            ))
+        return added
+
+
+## Functions
+def date_windows(start: date, end: date, days: int) -> Iterator[Window]:
+    """Yield consecutive inclusive (first, last) windows of at most days covering start..end"""
+    step: timedelta = timedelta(days=days - 1)
+    while start <= end:
+        last: date = min(start + step, end)
+        yield (start, last)
+        start = last + timedelta(days=1)
+
+
+async def fetch_windows(
+    fetch: WindowFetch, windows: Iterable[Window], concurrency: int = 4
+) -> AsyncIterator[tuple[Window, list[dict[str, Any]]]]:
+    """Yield (window, records) in window order with at most concurrency windows in flight"""
+    iterator: Iterator[Window] = iter(windows)
+    pending: deque[tuple[Window, asyncio.Task[list[dict[str, Any]]]]] = deque(
+        (window, asyncio.ensure_future(fetch(*window)))
+        for window in islice(iterator, concurrency)
+    )
+    try:
+        while pending:
+            window, task = pending.popleft()
+            records: list[dict[str, Any]] = await task
+            following: Window | None = next(iterator, None)
+            if following is not None:
+                pending.append((following, asyncio.ensure_future(fetch(*following))))
+            yield window, records
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+def _order_fetch(session: ClientSession, account_id: int) -> WindowFetch:
+    async def fetch(first: date, last: date) -> list[dict[str, Any]]:
+        response: aiohttp.ClientResponse = await session.get_orders(
+            account_id=account_id, from_date=first, to_date=last
+        )
+        orders: list[dict[str, Any]] = await response.json(loads=codec.loads)
+        return orders
+    return fetch
+
+
+def _single_order_fetch(
+    session: ClientSession, account_id: int
+) -> Callable[[int], Awaitable[dict[str, Any]]]:
+    async def fetch(order_id: int) -> dict[str, Any]:
+        response: aiohttp.ClientResponse = await session.get_order(account_id, order_id)
+        order: dict[str, Any] = await response.json(loads=codec.loads)
+        return order
+    return fetch
+
+
+def _transaction_fetch(session: ClientSession, account_id: int) -> WindowFetch:
+    async def fetch(first: date, last: date) -> list[dict[str, Any]]:
+        response: aiohttp.ClientResponse = await session.get_transactions(
+            account_id, from_date=first, to_date=last
+        )
+        transactions: list[dict[str, Any]] = await response.json(loads=codec.loads)
+        return transactions
+    return fetch
+
+
+async def iter_orders(
+    session: ClientSession, account_id: int, start: date, end: date | None = None, *,
+    window: int = 30, concurrency: int = 4
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield order history of start..end, fetching date windows concurrently"""
+    end = end or datetime.now(timezone.utc).date()
+    async for _, orders in fetch_windows(
+        _order_fetch(session, account_id), date_windows(start, end, window), concurrency
+    ):
+        for order in orders:
+            yield order
+
+
+async def iter_transactions(
+    session: ClientSession, account_id: int, start: date, end: date | None = None, *,
+    window: int = 30, concurrency: int = 4
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield transaction history of start..end, fetching date windows concurrently"""
+    end = end or datetime.now(timezone.utc).date()
+    async for _, transactions in fetch_windows(
+        _transaction_fetch(session, account_id), date_windows(start, end, window), concurrency
+    ):
+        for transaction in transactions:
+            yield transaction
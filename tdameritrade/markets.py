@@ -0,0 +1,248 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Market Calendar + Movers      ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import aiohttp
+
+from . import codec
+from .batching import gather_limited
+from .session import ClientSession
+
+## Constants
+log: logging.Logger = logging.getLogger(__name__)
+MARKETS: tuple[str, ...] = ("EQUITY", "OPTION", "FUTURE", "BOND", "FOREX")
+INDEXES: tuple[str, ...] = ("$COMPX", "$DJI", "$SPX.X")
+SessionKey = tuple[str, str, str]
+
+
+## Classes
+class MarketCalendar:
+    """Session boundaries of every market, fetched once per day and checked by bisect"""
+
+    # -Constructor
+    def __init__(
+        self, session: ClientSession, markets: Sequence[str] = MARKETS, *, days: int = 2
+    ) -> None:
+        self.session: ClientSession = session
+        self.markets: tuple[str, ...] = tuple(markets)
+        self.days: int = days
+        self.products: dict[str, list[str]] = {}
+        self.boundaries: dict[SessionKey, array[float]] = {}
+        self.loaded: set[date] = set()
+        self.refresher: asyncio.Task[None] | None = None
+        self._intervals: dict[SessionKey, dict[date, list[tuple[float, float]]]] = {}
+
+    # -Instance Methods: Private
+    def _boundaries(self, market: str, session: str, product: str | None) -> array[float]:
+        '''Return boundary array of (market, product, session); empty if unknown'''
+        market = market.upper()
+        if product is None:
+            products: list[str] | None = self.products.get(market)
+            if not products:
+                return array('d')
+            product = products[0]
+        return self.boundaries.get((market, product, session)) or array('d')
+
+    def _rebuild(self) -> None:
+        '''Rebuild boundary arrays from the intervals of every loaded day'''
+        for key, days in self._intervals.items():
+            boundaries: array[float] = array('d')
+            for start, end in sorted(span for spans in days.values() for span in spans):
+                if boundaries and start <= boundaries[-1]:
+                    # -Merge overlapping/adjacent sessions
+                    boundaries[-1] = max(boundaries[-1], end)
+                else:
+                    boundaries.extend((start, end))
+            self.boundaries[key] = boundaries
+
+    async def _refresh_daily(self, interval: float) -> None:
+        '''Reload whenever the (UTC) day rolls over; failures retry with backoff'''
+        failures: int = 0
+        while True:
+            if datetime.now(timezone.utc).date() not in self.loaded:
+                try:
+                    await self.refresh()
+                except Exception as error:
+                    failures += 1
+                    delay: float = min(interval, 2.0 ** failures)
+                    log.warning("market hours refresh failed (retry in %.1fs): %r", delay, error)
+                    await asyncio.sleep(delay)
+                    continue
+                failures = 0
+            await asyncio.sleep(interval)
+
+    def _store(self, day: date, data: dict[str, Any]) -> None:
+        '''Replace intervals of day with hours response and rebuild boundary arrays'''
+        for days in self._intervals.values():
+            days.pop(day, None)
+        for market, products in data.items():
+            for product, hours in (products or {}).items():
+                market_type: str = hours.get('marketType') or market.upper()
+                known: list[str] = self.products.setdefault(market_type, [])
+                if product not in known:
+                    known.append(product)
+                for name, spans in (hours.get('sessionHours') or {}).items():
+                    self._intervals.setdefault((market_type, product, name), {})[day] = [
+                        (
+                            datetime.fromisoformat(span['start']).timestamp(),
+                            datetime.fromisoformat(span['end']).timestamp(),
+                        )
+                        for span in spans
+                    ]
+        self._rebuild()
+
+    # -Instance Methods: Public
+    def is_open(
+        self, market: str = "EQUITY", session: str = "regularMarket",
+        product: str | None = None, at: float | None = None
+    ) -> bool:
+        '''Return if market session is open at epoch seconds (default: now); no I/O'''
+        boundaries: array[float] = self._boundaries(market, session, product)
+        return bisect_right(boundaries, time.time() if at is None else at) % 2 == 1
+
+    def next_close(
+        self, market: str = "EQUITY", session: str = "regularMarket",
+        product: str | None = None, at: float | None = None
+    ) -> datetime | None:
+        '''Return end of the open session at (or next session after) at'''
+        boundaries: array[float] = self._boundaries(market, session, product)
+        position: int = bisect_right(boundaries, time.time() if at is None else at)
+        position += 1 - position % 2
+        if position >= len(boundaries):
+            return None
+        return datetime.fromtimestamp(boundaries[position], timezone.utc)
+
+    def next_open(
+        self, market: str = "EQUITY", session: str = "regularMarket",
+        product: str | None = None, at: float | None = None
+    ) -> datetime | None:
+        '''Return start of the next session after at'''
+        boundaries: array[float] = self._boundaries(market, session, product)
+        position: int = bisect_right(boundaries, time.time() if at is None else at)
+        position += position % 2
+        if position >= len(boundaries):
+            return None
+        return datetime.fromtimestamp(boundaries[position], timezone.utc)
+
+    async def refresh(self, day: date | None = None) -> None:
+        '''Load hours of every market for day + the following days in one call per day'''
+        first: date = day or datetime.now(timezone.utc).date()
+        days: list[date] = [first + timedelta(days=offset) for offset in range(self.days)]
+
+        async def load(day: date) -> dict[str, Any]:
+            response: aiohttp.ClientResponse = await self.session.get_market_hours(
+                self.markets, day
+            )
+            hours: dict[str, Any] = await response.json(loads=codec.loads)
+            return hours
+
+        for day, hours in zip(days, await gather_limited(load, days, self.days)):
+            if isinstance(hours, BaseException):
+                raise hours
+            self._store(day, hours)
+            self.loaded.add(day)
+        # -Drop days that can no longer matter
+        for stale in [loaded for loaded in self.loaded if loaded < first - timedelta(days=1)]:
+            self.loaded.discard(stale)
+            for intervals in self._intervals.values():
+                intervals.pop(stale, None)
+        self._rebuild()
+
+    def start_refresher(self, interval: float = 300.0) -> asyncio.Task[None]:
+        '''Start background task reloading hours after every day rollover'''
+        if self.refresher is None or self.refresher.done():
+            self.refresher = asyncio.create_task(self._refresh_daily(interval))
+        return self.refresher
+
+    def stop_refresher(self) -> None:
+        '''Cancel background refresher'''
+        if self.refresher is not None:
+            self.refresher.cancel()
+            self.refresher = None
+
+
+class MoversBoard:
+    """Periodically refreshed movers snapshots of market indexes; reads hit memory"""
+
+    # -Constructor
+    def __init__(
+        self, session: ClientSession, indexes: Sequence[str] = INDEXES, *,
+        calendar: MarketCalendar | None = None, change: str = "percent"
+    ) -> None:
+        self.session: ClientSession = session
+        self.indexes: tuple[str, ...] = tuple(indexes)
+        self.calendar: MarketCalendar | None = calendar
+        self.change: str = change
+        self.movers: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        self.errors: dict[tuple[str, str], BaseException] = {}
+        self.updated: float | None = None
+        self.refresher: asyncio.Task[None] | None = None
+
+    # -Instance Methods: Private
+    async def _refresh_periodically(self, interval: float) -> None:
+        '''Refresh every interval while the equity market is open (always without calendar)'''
+        while True:
+            if self.updated is None or self.calendar is None or self.calendar.is_open(
+                "EQUITY", "regularMarket"
+            ):
+                await self.refresh()
+            await asyncio.sleep(interval)
+
+    # -Instance Methods: Public
+    def get(self, index: str, direction: str = "up") -> list[dict[str, Any]]:
+        '''Return latest movers snapshot of index'''
+        return self.movers.get((index, direction), [])
+
+    async def refresh(self) -> None:
+        '''Fetch up + down movers of every index concurrently and swap in the snapshot;
+        failed (index, direction) keys are kept in errors until they succeed'''
+        keys: list[tuple[str, str]] = [
+            (index, direction) for index in self.indexes for direction in ("up", "down")
+        ]
+
+        async def load(key: tuple[str, str]) -> list[dict[str, Any]]:
+            response: aiohttp.ClientResponse = await self.session.get_movers(
+                key[0], direction=key[1], change=self.change
+            )
+            movers: list[dict[str, Any]] = await response.json(loads=codec.loads)
+            return movers
+
+        movers: dict[tuple[str, str], list[dict[str, Any]]] = dict(self.movers)
+        errors: dict[tuple[str, str], BaseException] = {}
+        for key, snapshot in zip(keys, await gather_limited(load, keys, len(keys))):
+            if isinstance(snapshot, BaseException):
+                # -Keep serving the previous snapshot of key
+                errors[key] = snapshot
+            else:
+                movers[key] = snapshot
+        self.movers = movers
+        self.errors = errors
+        self.updated = time.time()
+
+    def start_refresher(self, interval: float = 60.0) -> asyncio.Task[None]:
+        '''Start background task refreshing movers every interval seconds'''
+        if self.refresher is None or self.refresher.done():
+            self.refresher = asyncio.create_task(self._refresh_periodically(interval))
+        return self.refresher
+
+    def stop_refresher(self) -> None:
+        '''Cancel background refresher'''
+        if self.refresher is not None:
+            self.refresher.cancel()
+            self.refresher = None
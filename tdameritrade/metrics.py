@@ -0,0 +1,249 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Instrumentation + Export      ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Sequence
+from inspect import isawaitable
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+## Constants
+BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+ENDPOINT_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"/\d+(?=/|$)"), "/{id}"),
+    (
+        re.compile(r"/marketdata/[^/]+/(quotes|pricehistory|movers|hours)$"),
+        r"/marketdata/{symbol}/\1"
+    ),
+    (re.compile(r"/instruments/[^/]+$"), "/instruments/{cusip}"),
+)
+LABEL_ESCAPES: dict[int, str] = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n'})
+Labels = tuple[tuple[str, str], ...]
+Exporter = Callable[["Metrics"], Awaitable[None] | None]
+
+
+## Classes
+class Histogram:
+    """Fixed-bucket histogram (Prometheus 'le' semantics)"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    # -Constructor
+    def __init__(self, bounds: Sequence[float] = BUCKETS) -> None:
+        self.bounds: tuple[float, ...] = tuple(bounds)
+        self.counts: list[int] = [0] * (len(self.bounds) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    # -Instance Methods
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float) -> float:
+        '''Upper bound of the bucket containing the fraction'th observation'''
+        rank: float = fraction * self.count
+        seen: int = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank and seen:
+                return bound
+        return float('inf')
+
+
+class Metrics:
+    """In-process counters, gauges and histograms with Prometheus/callback export"""
+
+    # -Constructor
+    def __init__(self, buckets: Sequence[float] = BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        self.counters: dict[tuple[str, Labels], float] = {}
+        self.gauges: dict[tuple[str, Labels], float] = {}
+        self.histograms: dict[tuple[str, Labels], Histogram] = {}
+        self.exporters: list[Exporter] = []
+        self._exporter: asyncio.Task[None] | None = None
+
+    # -Instance Methods: Private
+    async def _export_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.export()
+
+    # -Instance Methods: Public
+    def add_exporter(self, exporter: Exporter) -> None:
+        '''Register callback receiving this registry on every export'''
+        self.exporters.append(exporter)
+
+    async def export(self) -> None:
+        '''Call every exporter'''
+        for exporter in self.exporters:
+            result = exporter(self)
+            if isawaitable(result):
+                await result
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key: tuple[str, Labels] = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key: tuple[str, Labels] = (name, tuple(sorted(labels.items())))
+        histogram: Histogram | None = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def prometheus(self) -> str:
+        '''Render every metric in Prometheus text exposition format'''
+        lines: list[str] = []
+        typed: set[str] = set()
+
+        def header(name: str, kind: str) -> None:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(self.counters.items()):
+            header(name, "counter")
+            lines.append(f"{name}{_labels(labels)} {value}")
+        for (name, labels), value in sorted(self.gauges.items()):
+            header(name, "gauge")
+            lines.append(f"{name}{_labels(labels)} {value}")
+        for (name, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0]):
+            header(name, "histogram")
+            cumulative: int = 0
+            bounds: list[str] = [repr(bound) for bound in histogram.bounds] + ["+Inf"]
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def start_exporter(self, interval: float = 15.0) -> asyncio.Task[None]:
+        '''Start background task calling exporters every interval seconds'''
+        if self._exporter is None or self._exporter.done():
+            self._exporter = asyncio.create_task(self._export_loop(interval))
+        return self._exporter
+
+    def stop_exporter(self) -> None:
+        '''Cancel background exporter'''
+        if self._exporter is not None:
+            self._exporter.cancel()
+            self._exporter = None
+
+
+## Functions
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return '{' + ','.join(
+        f'{key}="{value.translate(LABEL_ESCAPES)}"' for key, value in labels
+    ) + '}'
+
+
+def endpoint(path: str) -> str:
+    """Collapse ids/symbols of a urls.v1 path into a low-cardinality endpoint label"""
+    for pattern, replacement in ENDPOINT_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def create_trace_config(metrics: Metrics) -> aiohttp.TraceConfig:
+    """aiohttp TraceConfig recording DNS/connect/TTFB time + status per endpoint (total time,
+    body included, is recorded by ClientSession)"""
+    trace: aiohttp.TraceConfig = aiohttp.TraceConfig()
+
+    async def on_request_start(
+        session: aiohttp.ClientSession, context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams
+    ) -> None:
+        context.sent = time.perf_counter()
+        context.endpoint = endpoint(params.url.path)
+
+    async def on_dns_resolvehost_start(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        context.dns = time.perf_counter()
+
+    async def on_dns_resolvehost_end(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.observe(
+            "tdameritrade_rest_dns_seconds", time.perf_counter() - context.dns,
+            endpoint=context.endpoint
+        )
+
+    async def on_connection_create_start(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        context.connect = time.perf_counter()
+
+    async def on_connection_create_end(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.observe(
+            "tdameritrade_rest_connect_seconds", time.perf_counter() - context.connect,
+            endpoint=context.endpoint
+        )
+
+    async def on_connection_reuseconn(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        metrics.increment("tdameritrade_rest_connections_reused_total", endpoint=context.endpoint)
+
+    async def on_request_headers_sent(
+        session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        context.sent = time.perf_counter()
+
+    async def on_request_end(
+        session: aiohttp.ClientSession, context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams
+    ) -> None:
+        metrics.observe(
+            "tdameritrade_rest_ttfb_seconds", time.perf_counter() - context.sent,
+            endpoint=context.endpoint
+        )
+        metrics.increment(
+            "tdameritrade_rest_responses_total", endpoint=context.endpoint,
+            status=str(params.response.status)
+        )
+
+    async def on_request_exception(
+        session: aiohttp.ClientSession, context: SimpleNamespace,
+        params: aiohttp.TraceRequestExceptionParams
+    ) -> None:
+        metrics.increment(
+            "tdameritrade_rest_errors_total", endpoint=context.endpoint,
+            error=type(params.exception).__name__
+        )
+
+    trace.on_request_start.append(on_request_start)
+    trace.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace.on_connection_create_start.append(on_connection_create_start)
+    trace.on_connection_create_end.append(on_connection_create_end)
+    trace.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace.on_request_headers_sent.append(on_request_headers_sent)
+    trace.on_request_end.append(on_request_end)
+    trace.on_request_exception.append(on_request_exception)
+    return trace
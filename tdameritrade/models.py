@@ -0,0 +1,223 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Typed Response Models         ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Generic, TypeVar, overload
+
+import aiohttp
+
+from . import codec
+from .history import CandleSeries
+
+## Constants
+M = TypeVar('M', bound="Model")
+T = TypeVar('T')
+FORMAT_TIMESTAMP: str = "%Y-%m-%dT%H:%M:%S%z"
+
+
+## Classes
+class Field(Generic[T]):
+    """Lazily read (and optionally converted + cached) model field of type T"""
+
+    __slots__ = ("path", "convert", "name")
+
+    # -Constructor
+    def __init__(self, *path: str, convert: Callable[[Any], Any] | None = None) -> None:
+        self.path: tuple[str, ...] = path
+        self.convert: Callable[[Any], Any] | None = convert
+        self.name: str = path[-1]
+
+    # -Dunder Methods
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Field[T]: ...
+    @overload
+    def __get__(self, instance: Model, owner: type | None = None) -> T: ...
+    def __get__(self, instance: Model | None, owner: type | None = None) -> Field[T] | T:
+        if instance is None:
+            return self
+        if self.convert is not None and self.name in instance._cache:
+            cached: T = instance._cache[self.name]
+            return cached
+        value: Any = instance._data
+        for key in self.path:
+            value = value.get(key) if value is not None else None
+        if self.convert is not None:
+            value = instance._cache[self.name] = (
+                None if value is None else self.convert(value)
+            )
+        field: T = value
+        return field
+
+
+class Model:
+    """Base response model wrapping the raw decoded JSON"""
+
+    __slots__ = ("_data", "_cache")
+
+    # -Constructor
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data: dict[str, Any] = data
+        self._cache: dict[str, Any] = {}
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    # -Class Methods
+    @classmethod
+    def from_list(cls: type[M], items: list[dict[str, Any]]) -> list[M]:
+        '''Wrap list of raw items'''
+        return [cls(item) for item in items]
+
+    @classmethod
+    async def from_response(cls: type[M], response: aiohttp.ClientResponse) -> M:
+        '''Decode response into model'''
+        return cls(await response.json(loads=codec.loads))
+
+    @classmethod
+    async def from_response_list(
+        cls: type[M], response: aiohttp.ClientResponse
+    ) -> list[M]:
+        '''Decode list response into models'''
+        return cls.from_list(await response.json(loads=codec.loads))
+
+    # -Properties
+    @property
+    def raw(self) -> dict[str, Any]:
+        return self._data
+
+
+class Quote(Model):
+    """Market quote"""
+
+    __slots__ = ()
+    symbol: Field[str | None] = Field('symbol')
+    description: Field[str | None] = Field('description')
+    asset_type: Field[str | None] = Field('assetType')
+    bid_price: Field[float | None] = Field('bidPrice')
+    bid_size: Field[float | None] = Field('bidSize')
+    ask_price: Field[float | None] = Field('askPrice')
+    ask_size: Field[float | None] = Field('askSize')
+    last_price: Field[float | None] = Field('lastPrice')
+    last_size: Field[float | None] = Field('lastSize')
+    mark: Field[float | None] = Field('mark')
+    open_price: Field[float | None] = Field('openPrice')
+    high_price: Field[float | None] = Field('highPrice')
+    low_price: Field[float | None] = Field('lowPrice')
+    close_price: Field[float | None] = Field('closePrice')
+    net_change: Field[float | None] = Field('netChange')
+    total_volume: Field[float | None] = Field('totalVolume')
+    quote_time: Field[int | None] = Field('quoteTimeInLong')
+    trade_time: Field[int | None] = Field('tradeTimeInLong')
+
+    # -Class Methods
+    @classmethod
+    def from_mapping(cls, data: dict[str, dict[str, Any]]) -> dict[str, Quote]:
+        '''Wrap symbol keyed quotes response'''
+        return {symbol: cls(quote) for symbol, quote in data.items()}
+
+
+class Position(Model):
+    """Account position"""
+
+    __slots__ = ()
+    symbol: Field[str | None] = Field('instrument', 'symbol')
+    cusip: Field[str | None] = Field('instrument', 'cusip')
+    asset_type: Field[str | None] = Field('instrument', 'assetType')
+    long_quantity: Field[float | None] = Field('longQuantity')
+    short_quantity: Field[float | None] = Field('shortQuantity')
+    average_price: Field[float | None] = Field('averagePrice')
+    market_value: Field[float | None] = Field('marketValue')
+    current_day_profit_loss: Field[float | None] = Field('currentDayProfitLoss')
+
+
+class AccountOrder(Model):
+    """Account order (REST response; see orders.Order to build one)"""
+
+    __slots__ = ()
+    order_id: Field[int | None] = Field('orderId')
+    account_id: Field[int | None] = Field('accountId')
+    status: Field[str | None] = Field('status')
+    order_type: Field[str | None] = Field('orderType')
+    session: Field[str | None] = Field('session')
+    duration: Field[str | None] = Field('duration')
+    strategy: Field[str | None] = Field('orderStrategyType')
+    price: Field[float | None] = Field('price')
+    stop_price: Field[float | None] = Field('stopPrice')
+    quantity: Field[float | None] = Field('quantity')
+    filled_quantity: Field[float | None] = Field('filledQuantity')
+    remaining_quantity: Field[float | None] = Field('remainingQuantity')
+    legs: Field[list[dict[str, Any]] | None] = Field('orderLegCollection')
+    entered_time: Field[datetime | None] = Field(
+        'enteredTime', convert=lambda value: datetime.strptime(value, FORMAT_TIMESTAMP)
+    )
+    close_time: Field[datetime | None] = Field(
+        'closeTime', convert=lambda value: datetime.strptime(value, FORMAT_TIMESTAMP)
+    )
+    child_orders: Field[list[AccountOrder] | None] = Field(
+        'childOrderStrategies', convert=lambda value: AccountOrder.from_list(value)
+    )
+
+
+class Account(Model):
+    """Securities account"""
+
+    __slots__ = ()
+    account_id: Field[str | None] = Field('accountId')
+    type: Field[str | None] = Field('type')
+    round_trips: Field[int | None] = Field('roundTrips')
+    is_day_trader: Field[bool | None] = Field('isDayTrader')
+    current_balances: Field[dict[str, Any] | None] = Field('currentBalances')
+    initial_balances: Field[dict[str, Any] | None] = Field('initialBalances')
+    projected_balances: Field[dict[str, Any] | None] = Field('projectedBalances')
+    positions: Field[list[Position] | None] = Field(
+        'positions', convert=lambda value: Position.from_list(value)
+    )
+    orders: Field[list[AccountOrder] | None] = Field(
+        'orderStrategies', convert=lambda value: AccountOrder.from_list(value)
+    )
+
+    # -Class Methods
+    @classmethod
+    def from_list(cls, items: list[dict[str, Any]]) -> list[Account]:
+        '''Wrap list of raw (securitiesAccount enveloped) accounts'''
+        return [cls(item.get('securitiesAccount', item)) for item in items]
+
+    @classmethod
+    async def from_response(cls, response: aiohttp.ClientResponse) -> Account:
+        '''Decode (securitiesAccount enveloped) account response'''
+        data: dict[str, Any] = await response.json(loads=codec.loads)
+        return cls(data.get('securitiesAccount', data))
+
+
+class UserPrincipals(Model):
+    """User principals with optional streamer info + keys"""
+
+    __slots__ = ()
+    user_id: Field[str | None] = Field('userId')
+    primary_account_id: Field[str | None] = Field('primaryAccountId')
+    accounts: Field[list[dict[str, Any]] | None] = Field('accounts')
+    streamer_info: Field[dict[str, Any] | None] = Field('streamerInfo')
+    streamer_keys: Field[list[dict[str, Any]] | None] = Field('streamerSubscriptionKeys', 'keys')
+    token_expiration: Field[datetime | None] = Field(
+        'tokenExpirationTime', convert=lambda value: datetime.strptime(value, FORMAT_TIMESTAMP)
+    )
+
+
+## Functions
+async def candles_from_response(response: aiohttp.ClientResponse) -> CandleSeries:
+    """Decode price history response into a columnar candle series"""
+    data: dict[str, Any] = await response.json(loads=codec.loads)
+    return CandleSeries.from_candles(data.get('candles', ()))
@@ -0,0 +1,169 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Columnar Option Chains        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Any
+
+import aiohttp
+
+from . import codec
+from .fields import NAN
+
+## Constants
+COLUMNS: tuple[str, ...] = (
+    "strikePrice", "bid", "ask", "last", "mark", "bidSize", "askSize", "totalVolume",
+    "openInterest", "volatility", "delta", "gamma", "theta", "vega", "rho",
+    "theoreticalOptionValue", "timeValue", "expirationDate", "daysToExpiration",
+)
+CALL: int = 0
+PUT: int = 1
+
+
+## Classes
+class OptionChain:
+    """Option chain flattened into one row per contract with numeric columns"""
+
+    # -Constructor
+    def __init__(self, symbol: str, underlying_price: float = NAN) -> None:
+        self.symbol: str = symbol
+        self.underlying_price: float = underlying_price
+        self.columns: dict[str, array[float]] = {name: array('d') for name in COLUMNS}
+        self.put_call: array[int] = array('b')
+        self.symbols: list[str] = []
+        self.expiration_rows: dict[str, list[int]] = {}
+        self.strike_rows: dict[float, list[int]] = {}
+        self.index: dict[str, int] = {}
+
+    # -Dunder Methods
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    # -Instance Methods: Private
+    def _extend(self, side: dict[str, dict[str, list[dict[str, Any]]]], put_call: int) -> None:
+        '''Append every contract of one exp date map; columns filled per field, not per row'''
+        contracts: list[dict[str, Any]] = []
+        expiration_rows: dict[str, list[int]] = self.expiration_rows
+        strike_rows: dict[float, list[int]] = self.strike_rows
+        row: int = len(self.symbols)
+        for expiration, strikes in side.items():
+            # -Keys are "YYYY-MM-DD:days"
+            rows: list[int] = expiration_rows.setdefault(expiration.partition(':')[0], [])
+            for strike, entries in strikes.items():
+                strike_row: list[int] = strike_rows.setdefault(float(strike), [])
+                for contract in entries:
+                    contracts.append(contract)
+                    rows.append(row)
+                    strike_row.append(row)
+                    row += 1
+        for name, column in self.columns.items():
+            values: array[float]
+            try:
+                values = array('d', [contract[name] for contract in contracts])
+            except (KeyError, TypeError):
+                values = array('d', [_number(contract.get(name)) for contract in contracts])
+            column.extend(values)
+        self.put_call.extend([put_call] * len(contracts))
+        start: int = len(self.symbols)
+        self.symbols.extend([contract.get('symbol', "") for contract in contracts])
+        self.index.update(zip(self.symbols[start:], range(start, row)))
+
+    # -Instance Methods: Public
+    def get(self, symbol: str) -> dict[str, Any]:
+        '''Return contract row of option symbol'''
+        row: int = self.index[symbol]
+        contract: dict[str, Any] = {
+            name: column[row] for name, column in self.columns.items()
+        }
+        contract['symbol'] = symbol
+        contract['putCall'] = "PUT" if self.put_call[row] == PUT else "CALL"
+        return contract
+
+    def nearest_strike(self, price: float | None = None) -> float:
+        '''Return listed strike closest to price (default: underlying price)'''
+        strikes: list[float] = self.strikes
+        if not strikes:
+            raise LookupError(f"option chain of {self.symbol} is empty")
+        if price is None:
+            price = self.underlying_price
+        position: int = bisect_left(strikes, price)
+        candidates: list[float] = strikes[max(0, position - 1):position + 1]
+        return min(candidates, key=lambda strike: abs(strike - price))
+
+    def ndarray(self, name: str) -> Any:
+        '''Zero-copy numpy array of column (requires numpy)'''
+        import numpy  #type: ignore
+        return numpy.frombuffer(self.view(name), dtype=numpy.float64)
+
+    def rows(
+        self, expiration: str | None = None, strike: float | None = None,
+        put_call: str | None = None
+    ) -> list[int]:
+        '''Return rows matching expiration (YYYY-MM-DD), strike and CALL/PUT as a new list'''
+        rows: list[int] | None = None
+        if expiration is not None:
+            # -Copy; callers may mutate the result without corrupting the index
+            rows = list(self.expiration_rows.get(expiration, ()))
+        if strike is not None:
+            strike_rows: list[int] = self.strike_rows.get(strike, [])
+            if rows is None:
+                rows = list(strike_rows)
+            else:
+                matched: set[int] = set(strike_rows)
+                rows = [row for row in rows if row in matched]
+        if rows is None:
+            rows = list(range(len(self.symbols)))
+        if put_call is not None:
+            side: int = PUT if put_call.upper() == "PUT" else CALL
+            flags: array[int] = self.put_call
+            rows = [row for row in rows if flags[row] == side]
+        return rows
+
+    def view(self, name: str) -> memoryview:
+        '''Zero-copy view of column'''
+        return memoryview(self.columns[name])
+
+    # -Class Methods
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OptionChain:
+        '''Flatten chains response (callExpDateMap/putExpDateMap)'''
+        chain: OptionChain = cls(
+            data.get('symbol', ""), _number(data.get('underlyingPrice'))
+        )
+        chain._extend(data.get('callExpDateMap') or {}, CALL)
+        chain._extend(data.get('putExpDateMap') or {}, PUT)
+        return chain
+
+    @classmethod
+    async def from_response(cls, response: aiohttp.ClientResponse) -> OptionChain:
+        '''Decode chains response'''
+        return cls.from_dict(codec.loads(await response.read()))
+
+    # -Properties
+    @property
+    def expirations(self) -> list[str]:
+        return sorted(self.expiration_rows)
+
+    @property
+    def strikes(self) -> list[float]:
+        return sorted(self.strike_rows)
+
+
+## Functions
+def _number(value: Any) -> float:
+    """Coerce possibly missing/"NaN" field to float"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
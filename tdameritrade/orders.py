@@ -0,0 +1,234 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Order Builders + Templates    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Sequence
+from math import isfinite
+from typing import Any
+
+from . import codec
+
+## Constants
+INSTRUCTIONS: dict[str, frozenset[str]] = {
+    'EQUITY': frozenset({"BUY", "SELL", "BUY_TO_COVER", "SELL_SHORT"}),
+    'OPTION': frozenset({"BUY_TO_OPEN", "BUY_TO_CLOSE", "SELL_TO_OPEN", "SELL_TO_CLOSE"}),
+}
+ORDER_TYPES: frozenset[str] = frozenset({
+    "MARKET", "LIMIT", "STOP", "STOP_LIMIT", "TRAILING_STOP", "MARKET_ON_CLOSE",
+    "LIMIT_ON_CLOSE", "NET_DEBIT", "NET_CREDIT", "NET_ZERO",
+})
+SLOT_PATTERN: re.Pattern[str] = re.compile(r'"@@slot:(\w+)@@"')
+
+
+## Classes
+class Slot:
+    """Named placeholder patched into a pre-serialized OrderTemplate"""
+
+    __slots__ = ("name",)
+
+    # -Constructor
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+
+class OrderLeg:
+    """Single instrument leg of an order"""
+
+    __slots__ = ("instruction", "symbol", "quantity", "asset_type")
+
+    # -Constructor
+    def __init__(
+        self, instruction: str, symbol: str, quantity: float | Slot,
+        asset_type: str = "EQUITY"
+    ) -> None:
+        self.instruction: str = instruction
+        self.symbol: str = symbol
+        self.quantity: float | Slot = quantity
+        self.asset_type: str = asset_type
+
+    # -Instance Methods
+    def to_dict(self) -> dict[str, Any]:
+        '''Return order leg JSON structure'''
+        return {
+            'instruction': self.instruction,
+            'quantity': self.quantity,
+            'instrument': {'symbol': self.symbol, 'assetType': self.asset_type},
+        }
+
+    def validate(self) -> None:
+        '''Raise ValueError if leg is malformed'''
+        if self.asset_type not in INSTRUCTIONS:
+            raise ValueError(f"unsupported asset type: {self.asset_type}")
+        if self.instruction not in INSTRUCTIONS[self.asset_type]:
+            raise ValueError(f"invalid {self.asset_type} instruction: {self.instruction}")
+        if not isinstance(self.quantity, Slot) and not (
+            isfinite(self.quantity) and self.quantity > 0
+        ):
+            raise ValueError(f"invalid quantity: {self.quantity}")
+
+
+class Order:
+    """Order (single, OCO or TRIGGER strategy) builder"""
+
+    # -Constructor
+    def __init__(
+        self, order_type: str, legs: Sequence[OrderLeg], *,
+        price: float | Slot | None = None, stop_price: float | Slot | None = None,
+        session: str = "NORMAL", duration: str = "DAY", strategy: str = "SINGLE",
+        children: Sequence[Order] = ()
+    ) -> None:
+        self.order_type: str = order_type
+        self.legs: list[OrderLeg] = list(legs)
+        self.price: float | Slot | None = price
+        self.stop_price: float | Slot | None = stop_price
+        self.session: str = session
+        self.duration: str = duration
+        self.strategy: str = strategy
+        self.children: list[Order] = list(children)
+
+    # -Instance Methods
+    def quantity_slots(self) -> Iterator[str]:
+        '''Yield names of Slot leg quantities, children included'''
+        for leg in self.legs:
+            if isinstance(leg.quantity, Slot):
+                yield leg.quantity.name
+        for child in self.children:
+            yield from child.quantity_slots()
+
+    def to_bytes(self) -> bytes:
+        '''Validate and serialize order'''
+        self.validate()
+        return codec.dumps(self.to_dict()).encode()
+
+    def to_dict(self) -> dict[str, Any]:
+        '''Return order JSON structure'''
+        data: dict[str, Any] = {'orderStrategyType': self.strategy}
+        if self.strategy != "OCO":
+            data.update({
+                'orderType': self.order_type,
+                'session': self.session,
+                'duration': self.duration,
+                'orderLegCollection': [leg.to_dict() for leg in self.legs],
+            })
+        if self.price is not None:
+            data['price'] = self.price
+        if self.stop_price is not None:
+            data['stopPrice'] = self.stop_price
+        if self.children:
+            data['childOrderStrategies'] = [child.to_dict() for child in self.children]
+        return data
+
+    def validate(self) -> None:
+        '''Raise ValueError if order is malformed'''
+        if self.strategy == "OCO":
+            if len(self.children) < 2:
+                raise ValueError("OCO order requires at least two child orders")
+        else:
+            if self.order_type not in ORDER_TYPES:
+                raise ValueError(f"invalid order type: {self.order_type}")
+            if not self.legs:
+                raise ValueError("order requires at least one leg")
+            for leg in self.legs:
+                leg.validate()
+            if self.order_type in ("LIMIT", "STOP_LIMIT", "LIMIT_ON_CLOSE") and self.price is None:
+                raise ValueError(f"{self.order_type} order requires a price")
+            if self.order_type in ("STOP", "STOP_LIMIT") and self.stop_price is None:
+                raise ValueError(f"{self.order_type} order requires a stop price")
+            for price in (self.price, self.stop_price):
+                if isinstance(price, (int, float)) and not isfinite(price):
+                    raise ValueError(f"invalid price: {price}")
+        if self.strategy == "TRIGGER" and not self.children:
+            raise ValueError("TRIGGER order requires at least one child order")
+        for child in self.children:
+            child.validate()
+
+    # -Class Methods
+    @classmethod
+    def equity(
+        cls, instruction: str, symbol: str, quantity: float | Slot,
+        price: float | Slot | None = None, **kwargs: Any
+    ) -> Order:
+        '''Single-leg equity order; LIMIT when price is given else MARKET'''
+        order_type: str = kwargs.pop('order_type', "MARKET" if price is None else "LIMIT")
+        return cls(order_type, [OrderLeg(instruction, symbol, quantity)], price=price, **kwargs)
+
+    @classmethod
+    def option(
+        cls, instruction: str, symbol: str, quantity: float | Slot,
+        price: float | Slot | None = None, **kwargs: Any
+    ) -> Order:
+        '''Single-leg option order; LIMIT when price is given else MARKET'''
+        order_type: str = kwargs.pop('order_type', "MARKET" if price is None else "LIMIT")
+        return cls(
+            order_type, [OrderLeg(instruction, symbol, quantity, "OPTION")],
+            price=price, **kwargs
+        )
+
+    @classmethod
+    def oco(cls, *orders: Order) -> Order:
+        '''One-cancels-other order group'''
+        return cls("", [], strategy="OCO", children=orders)
+
+    @classmethod
+    def trigger(cls, parent: Order, *children: Order) -> Order:
+        '''Order whose fill triggers children'''
+        return cls(
+            parent.order_type, parent.legs, price=parent.price,
+            stop_price=parent.stop_price, session=parent.session,
+            duration=parent.duration, strategy="TRIGGER",
+            children=[*parent.children, *children]
+        )
+
+
+class OrderTemplate:
+    """Validated, pre-serialized order with patchable Slot values"""
+
+    __slots__ = ("_parts", "_quantities", "slots")
+
+    # -Constructor
+    def __init__(self, order: Order) -> None:
+        order.validate()
+        text: str = codec.dumps(order.to_dict(), default=_encode_slot)
+        pieces: list[str] = SLOT_PATTERN.split(text)
+        self._parts: list[bytes] = [piece.encode() for piece in pieces[0::2]]
+        self._quantities: frozenset[str] = frozenset(order.quantity_slots())
+        self.slots: tuple[str, ...] = tuple(pieces[1::2])
+
+    # -Instance Methods
+    def render(self, **values: float) -> bytes:
+        '''Return order body with slot values patched in; raise like Order.validate'''
+        parts: list[bytes] = self._parts
+        body: list[bytes] = [parts[0]]
+        for i, name in enumerate(self.slots):
+            if name not in values:
+                raise TypeError(f"missing value of slot {name}")
+            value: float = values[name]
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise TypeError(f"slot {name} requires a number, got {value!r}")
+            if not isfinite(value):
+                raise ValueError(f"slot {name} requires a finite number, got {value!r}")
+            if name in self._quantities and value <= 0:
+                raise ValueError(f"invalid quantity of slot {name}: {value}")
+            body.append(repr(value).encode())
+            body.append(parts[i + 1])
+        return b''.join(body)
+
+
+## Functions
+def _encode_slot(obj: Any) -> str:
+    '''JSON default hook serializing Slot placeholders as markers'''
+    if isinstance(obj, Slot):
+        return f"@@slot:{obj.name}@@"
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
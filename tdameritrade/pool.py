@@ -0,0 +1,148 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Multi-Account Session Pool    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from itertools import count
+from typing import Any
+
+import aiohttp
+
+from .models import Account
+from .profile import Profile
+from .ratelimit import RateLimiter
+from .session import ClientSession
+from .streamer import Streamer
+
+
+## Classes
+class SessionPool:
+    """Authenticated sessions of many accounts/app keys over one shared connector"""
+
+    # -Constructor
+    def __init__(
+        self, *, limit: int = 100, limit_per_host: int = 32,
+        ttl_dns_cache: int = 300, keepalive_timeout: float = 30.0
+    ) -> None:
+        self.connector_options: dict[str, Any] = {
+            'limit': limit, 'limit_per_host': limit_per_host,
+            'ttl_dns_cache': ttl_dns_cache, 'keepalive_timeout': keepalive_timeout,
+        }
+        self.connector: aiohttp.TCPConnector | None = None
+        self.apps: dict[str, list[ClientSession]] = {}
+        self.accounts: dict[int, ClientSession] = {}
+        self.limiters: dict[str, RateLimiter] = {}
+        self.streamers: dict[str, Streamer] = {}
+        self._runners: dict[str, asyncio.Task[None]] = {}
+        self._cursor: count[int] = count()
+
+    # -Dunder Methods
+    async def __aenter__(self) -> SessionPool:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    # -Instance Methods: Private
+    def _load(self, app: str) -> tuple[bool, int]:
+        '''Sort key of app key: paused (429 Retry-After), then queued requests'''
+        limiter: RateLimiter | None = self.limiters.get(app)
+        if limiter is None:
+            return (False, 0)
+        now: float = asyncio.get_running_loop().time()
+        return (limiter.paused_until > now, limiter.queue_depth)
+
+    # -Instance Methods: Public
+    async def add(
+        self, session: ClientSession, account_ids: Iterable[int] | None = None
+    ) -> None:
+        '''Register authenticated session; fetches its account ids if not given'''
+        sessions: list[ClientSession] = self.apps.setdefault(session.id, [])
+        if session not in sessions:
+            sessions.append(session)
+        if session.id in self.limiters:
+            session.rate_limiter = self.limiters[session.id]
+        elif session.rate_limiter is not None:
+            self.limiters[session.id] = session.rate_limiter
+        if account_ids is None:
+            response: aiohttp.ClientResponse = await session.get_accounts()
+            account_ids = [
+                int(account.account_id)
+                for account in await Account.from_response_list(response)
+                if account.account_id is not None
+            ]
+        for account_id in account_ids:
+            self.accounts[account_id] = session
+
+    async def close(self) -> None:
+        '''Close streamers, sessions and the shared connector'''
+        for streamer in self.streamers.values():
+            await streamer.close()
+        for runner in self._runners.values():
+            runner.cancel()
+        self.streamers.clear()
+        self._runners.clear()
+        for sessions in self.apps.values():
+            for session in sessions:
+                await session.close()
+        if self.connector is not None:
+            await self.connector.close()
+            self.connector = None
+
+    def create_session(
+        self, id_: str, callback_address: tuple[str, int], **kwargs: Any
+    ) -> ClientSession:
+        '''Create session on the shared connector + its app key's shared rate limiter'''
+        if self.connector is None or self.connector.closed:
+            self.connector = aiohttp.TCPConnector(**self.connector_options)
+        if 'rate_limiter' not in kwargs:
+            if id_ not in self.limiters:
+                self.limiters[id_] = RateLimiter()
+            kwargs['rate_limiter'] = self.limiters[id_]
+        elif kwargs['rate_limiter'] is not None and id_ not in self.limiters:
+            self.limiters[id_] = kwargs['rate_limiter']
+        session: ClientSession = ClientSession(
+            id_, callback_address, connector=self.connector, connector_owner=False,
+            **kwargs
+        )
+        self.apps.setdefault(id_, []).append(session)
+        return session
+
+    def least_loaded(self) -> ClientSession:
+        '''Return a session of the least loaded app key; ties rotate round-robin'''
+        if not self.apps:
+            raise LookupError("session pool is empty")
+        apps: list[str] = list(self.apps)
+        turn: int = next(self._cursor)
+        start: int = turn % len(apps)
+        app: str = min(apps[start:] + apps[:start], key=self._load)
+        sessions: list[ClientSession] = self.apps[app]
+        return sessions[turn // len(apps) % len(sessions)]
+
+    def session(self, account_id: int) -> ClientSession:
+        '''Return session authorized for account id'''
+        try:
+            return self.accounts[account_id]
+        except KeyError:
+            raise LookupError(f"no session for account {account_id}") from None
+
+    def streamer(self, app: str, quality_of_service: int = 2, **kwargs: Any) -> Streamer:
+        '''Return (starting if needed) the single streamer of app key'''
+        if app not in self.streamers:
+            profile: Profile = Profile(self.apps[app][0])
+            streamer: Streamer = Streamer(profile, quality_of_service, **kwargs)
+            self.streamers[app] = streamer
+            self._runners[app] = asyncio.create_task(streamer.run())
+        return self.streamers[app]
+
+    def streamer_for(self, account_id: int) -> Streamer:
+        '''Return streamer multiplexing account id's subscriptions'''
+        return self.streamer(self.session(account_id).id)
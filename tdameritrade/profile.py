@@ -7,15 +7,21 @@
 ##-------------------------------##
 
 ## Imports
-from datetime import datetime
-from typing import cast
+from datetime import datetime, timezone
+from typing import Any, cast
 
 import aiohttp
 
 from . import urls
+from .models import UserPrincipals
 from .session import ClientSession
+from .stream import StreamRouter
+from .typing import Response_WebSocketDict
 from .websocket import ClientWebSocket
 
+## Constants
+FORMAT_TIMESTAMP: str = "%Y-%m-%dT%H:%M:%S%z"
+
 
 ## Classes
 class Profile:
@@ -25,24 +31,59 @@ class Profile:
     def __init__(self, session: ClientSession) -> None:
         assert(issubclass(session._ws_response_class, ClientWebSocket))
         self._session: ClientSession = session
+        self._principals: UserPrincipals | None = None
+        self.streamer_scheme: str = "wss"
+        self._principals_expiration: datetime = datetime.min.replace(tzinfo=timezone.utc)
 
     # -Instance Methods
-    async def create_websocket(self, quality_of_service: int = 2) -> ClientWebSocket:
-        '''Create and authenticate a websocket object'''
-        response: aiohttp.ClientResponse = await self._session.get_user_principals(
-            streamer_keys=True, streamer_info=True
+    async def get_streamer_info(self, *, refresh: bool = False) -> UserPrincipals:
+        '''Return user principals with streamer info, cached until the streamer token expires'''
+        now: datetime = datetime.now(timezone.utc)
+        if refresh or self._principals is None or self._principals_expiration <= now:
+            response: aiohttp.ClientResponse = await self._session.get_user_principals(
+                streamer_keys=True, streamer_info=True
+            )
+            principals: UserPrincipals = await UserPrincipals.from_response(response)
+            self._principals = principals
+            self._principals_expiration = principals.token_expiration or now
+        return self._principals
+
+    async def create_websocket(
+        self, quality_of_service: int = 2, router: StreamRouter | None = None,
+        account_id: int | None = None
+    ) -> ClientWebSocket:
+        '''Create and authenticate a websocket object (as account id, default: first account)'''
+        principals: UserPrincipals = await self.get_streamer_info()
+        accounts: list[dict[str, Any]] = principals.accounts or []
+        account: dict[str, Any] | None = next(
+            (
+                item for item in accounts
+                if account_id is None or int(item['accountId']) == account_id
+            ), None
         )
-        data: dict = await response.json()
-        account: dict = data['accounts'][0]
-        stream_info: dict = data['streamerInfo']
-        url: str = "wss://" + stream_info['streamerSocketUrl']  + "/ws"
+        if account is None:
+            raise LookupError(
+                "user principals list no accounts" if account_id is None else
+                f"unknown account {account_id}"
+            )
+        stream_info: dict[str, Any] | None = principals.streamer_info
+        if stream_info is None:
+            raise LookupError("user principals lack streamer info")
+        url: str = f"{self.streamer_scheme}://" + stream_info['streamerSocketUrl']  + "/ws"
         websocket: ClientWebSocket = cast(ClientWebSocket, await self._session.ws_connect(url))
         assert isinstance(websocket, ClientWebSocket)
-        await websocket.login(
+        if router is not None:
+            websocket.router = router
+        websocket.start_receiving()
+        login: Response_WebSocketDict = await (await websocket.login(
             stream_info['appId'], account['accountId'], stream_info['token'],
             account['company'], account['segment'], account['accountCdDomainId'],
             stream_info['userGroup'], stream_info['accessLevel'],
-            datetime.strptime(stream_info['tokenTimestamp'], "%Y-%m-%dT%H:%M:%S%z"),
+            datetime.strptime(stream_info['tokenTimestamp'], FORMAT_TIMESTAMP),
             stream_info['acl'], quality_of_service
-        )
+        ))
+        if login['content']['code'] != 0:
+            self._principals = None
+            await websocket.close()
+            raise ConnectionRefusedError(login['content']['msg'])
         return websocket
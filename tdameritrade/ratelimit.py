@@ -0,0 +1,124 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Request Rate Limiter          ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import heapq
+from enum import IntEnum
+from itertools import count
+
+
+## Classes
+class Priority(IntEnum):
+    """Request scheduling class; lower values are served first"""
+    ORDER = 0
+    ACCOUNT = 1
+    DEFAULT = 2
+    BULK = 3
+
+
+class RateLimiter:
+    """Token bucket limiter with priority ordered waiters"""
+
+    # -Constructor
+    def __init__(self, rate: float = 2.0, capacity: float = 120.0) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+        self.paused_until: float = 0.0
+        self.acquired: int = 0
+        self.wait_time: float = 0.0
+        self._updated: float | None = None
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence: count[int] = count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    # -Instance Methods: Private
+    def _refill(self, now: float) -> None:
+        '''Add tokens accrued since last update'''
+        if self._updated is None:
+            self._updated = now
+        elif now > self._updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        '''Arm timer for when the next waiter can be served'''
+        if self._timer is not None or not self._waiters:
+            return
+        now: float = loop.time()
+        delay: float = max(self.paused_until - now, (1.0 - self.tokens) / self.rate, 0.0)
+        self._timer = loop.call_later(delay, self._wake, loop)
+
+    def _wake(self, loop: asyncio.AbstractEventLoop) -> None:
+        '''Serve waiters in priority order while tokens remain'''
+        self._timer = None
+        now: float = loop.time()
+        self._refill(now)
+        waiters = self._waiters
+        while waiters and self.tokens >= 1.0 and now >= self.paused_until:
+            future: asyncio.Future[None] = heapq.heappop(waiters)[2]
+            if future.done():
+                continue
+            self.tokens -= 1.0
+            future.set_result(None)
+        self._schedule(loop)
+
+    # -Instance Methods: Public
+    async def acquire(self, priority: int = Priority.DEFAULT) -> None:
+        '''Wait for a request slot'''
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        now: float = loop.time()
+        self._refill(now)
+        if not self._waiters and self.tokens >= 1.0 and now >= self.paused_until:
+            self.tokens -= 1.0
+            self.acquired += 1
+            return
+        future: asyncio.Future[None] = loop.create_future()
+        waiter: tuple[int, int, asyncio.Future[None]] = (priority, next(self._sequence), future)
+        heapq.heappush(self._waiters, waiter)
+        self._schedule(loop)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # -Drop the waiter so the fast path works again without waiting for _wake
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+            else:
+                # -Served just before cancellation; hand the slot to the next waiter
+                self.tokens += 1.0
+                self._schedule(loop)
+            raise
+        self.acquired += 1
+        self.wait_time += loop.time() - now
+
+    def pause(self, seconds: float) -> None:
+        '''Hold every request for seconds (eg: server Retry-After)'''
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.paused_until = max(self.paused_until, loop.time() + seconds)
+        # -Allow a single probe request once the pause ends
+        self.tokens = 1.0
+        self._updated = self.paused_until
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._schedule(loop)
+
+    def queue_depths(self) -> dict[Priority, int]:
+        '''Return number of waiting requests per priority'''
+        depths: dict[Priority, int] = {priority: 0 for priority in Priority}
+        for priority, _, future in self._waiters:
+            if not future.done():
+                depths[Priority(priority)] += 1
+        return depths
+
+    # -Properties
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
@@ -0,0 +1,215 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Stream Recorder + Replay      ##
+##-------------------------------##
+## Segment: MAGIC, then records of RECORD header (timestamp, length, flags) + payload
+## Index:   INDEX entries (timestamp, offset) of every index_interval'th record
+
+## Imports
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+import struct
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .stream import StreamRouter
+
+## Constants
+MAGIC: bytes = b"TDSTREAM\x01"
+RECORD: struct.Struct = struct.Struct("<dIB")
+INDEX: struct.Struct = struct.Struct("<dQ")
+FLAG_TEXT: int = 0x01
+FLAG_ZLIB: int = 0x02
+
+
+## Classes
+class StreamRecorder:
+    """Appends raw streamer frames + receive timestamps to rotating, indexed segments"""
+
+    # -Constructor
+    def __init__(
+        self, directory: str | os.PathLike[str], name: str = "stream", *,
+        max_bytes: int = 256 << 20, compress: bool = False, compress_min: int = 512,
+        index_interval: int = 1000
+    ) -> None:
+        self.directory: Path = Path(directory)
+        self.name: str = name
+        self.max_bytes: int = max_bytes
+        self.compress: bool = compress
+        self.compress_min: int = compress_min
+        self.index_interval: int = index_interval
+        self.records: int = 0
+        self.path: Path | None = None
+        self._file: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._size: int = 0
+        self._count: int = 0
+
+    # -Dunder Methods
+    def __enter__(self) -> StreamRecorder:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # -Instance Methods: Private
+    def _open(self) -> None:
+        '''Open next segment (numbered after any existing ones)'''
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing: list[Path] = segments(self.directory, self.name)
+        number: int = int(existing[-1].suffixes[-2][1:]) + 1 if existing else 0
+        self.path = self.directory / f"{self.name}.{number:06d}.tds"
+        self._file = open(self.path, 'xb')
+        self._index = open(self.path.with_suffix(".idx"), 'xb')
+        self._file.write(MAGIC)
+        self._size = len(MAGIC)
+        self._count = 0
+
+    # -Instance Methods: Public
+    def attach(self, router: StreamRouter) -> None:
+        '''Record every raw frame the router receives'''
+        router.add_raw_handler(self.write)
+
+    def close(self) -> None:
+        '''Flush and close current segment'''
+        for file in (self._file, self._index):
+            if file is not None:
+                file.close()
+        self._file = self._index = None
+
+    def flush(self) -> None:
+        '''Flush buffered records to disk'''
+        for file in (self._file, self._index):
+            if file is not None:
+                file.flush()
+
+    def rotate(self) -> None:
+        '''Close current segment; the next write opens a new one'''
+        self.close()
+
+    def write(self, data: str | bytes, timestamp: float | None = None) -> None:
+        '''Append frame received at timestamp (default: now)'''
+        if timestamp is None:
+            timestamp = time.time()
+        flags: int = 0
+        payload: bytes
+        if isinstance(data, str):
+            payload = data.encode()
+            flags |= FLAG_TEXT
+        else:
+            payload = data
+        if self.compress and len(payload) >= self.compress_min:
+            payload = zlib.compress(payload, 1)
+            flags |= FLAG_ZLIB
+        if self._file is None or self._size >= self.max_bytes:
+            self.close()
+            self._open()
+        assert self._file is not None and self._index is not None
+        if self._count % self.index_interval == 0:
+            self._index.write(INDEX.pack(timestamp, self._size))
+        self._file.write(RECORD.pack(timestamp, len(payload), flags))
+        self._file.write(payload)
+        self._size += RECORD.size + len(payload)
+        self._count += 1
+        self.records += 1
+
+
+class StreamReplay:
+    """Memory-mapped reader feeding recorded frames back through a StreamRouter"""
+
+    # -Constructor
+    def __init__(self, directory: str | os.PathLike[str], name: str = "stream") -> None:
+        self.paths: list[Path] = segments(Path(directory), name)
+
+    # -Instance Methods: Private
+    def _segment(
+        self, path: Path, start: float | None, end: float | None
+    ) -> Iterator[tuple[float, str | bytes]]:
+        '''Yield frames of one segment, seeking to start via its index'''
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size <= len(MAGIC):
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                if view[:len(MAGIC)] != MAGIC:
+                    raise ValueError(f"not a stream segment: {path}")
+                offset: int = len(MAGIC)
+                if start is not None:
+                    offset = max(offset, seek(path.with_suffix(".idx"), start))
+                size: int = len(view)
+                unpack = RECORD.unpack_from
+                while offset + RECORD.size <= size:
+                    timestamp, length, flags = unpack(view, offset)
+                    offset += RECORD.size
+                    if offset + length > size:
+                        break  # -Truncated tail of a segment still being written
+                    if end is not None and timestamp > end:
+                        return
+                    if start is None or timestamp >= start:
+                        payload: bytes = view[offset:offset + length]
+                        if flags & FLAG_ZLIB:
+                            payload = zlib.decompress(payload)
+                        yield timestamp, payload.decode() if flags & FLAG_TEXT else payload
+                    offset += length
+
+    # -Instance Methods: Public
+    def frames(
+        self, start: float | None = None, end: float | None = None
+    ) -> Iterator[tuple[float, str | bytes]]:
+        '''Yield (timestamp, frame) of every segment within [start, end]'''
+        for path in self.paths:
+            yield from self._segment(path, start, end)
+
+    async def run(
+        self, router: StreamRouter, speed: float | None = 1.0, *,
+        start: float | None = None, end: float | None = None, yield_every: int = 256
+    ) -> int:
+        '''Dispatch frames through router at speed x real time (None: as fast as possible)'''
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        origin: tuple[float, float] | None = None
+        count: int = 0
+        for timestamp, frame in self.frames(start, end):
+            if speed:
+                if origin is None:
+                    origin = (timestamp, loop.time())
+                delay: float = origin[1] + (timestamp - origin[0]) / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif count % yield_every == 0:
+                await asyncio.sleep(0)
+            await router.dispatch_raw(frame)
+            count += 1
+        return count
+
+
+## Functions
+def segments(directory: Path, name: str) -> list[Path]:
+    """Return recorded segments of name in order"""
+    return sorted(directory.glob(f"{name}.[0-9][0-9][0-9][0-9][0-9][0-9].tds"))
+
+
+def seek(index_path: Path, timestamp: float) -> int:
+    """Return offset of the last indexed record at or before timestamp"""
+    try:
+        data: bytes = index_path.read_bytes()
+    except FileNotFoundError:
+        return 0
+    entries: array[float] = array('d')
+    entries.frombytes(data[:len(data) - len(data) % INDEX.size])
+    # -Entries interleave (timestamp, offset as raw u64 bits); bisect over timestamps
+    times: array[float] = entries[0::2]
+    position: int = bisect_right(times, timestamp) - 1
+    if position < 0:
+        return 0
+    offset: int = INDEX.unpack_from(data, position * INDEX.size)[1]
+    return offset
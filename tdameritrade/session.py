@@ -7,43 +7,114 @@
 ##-------------------------------##
 
 ## Imports
+import asyncio
+import time
 from collections.abc import Sequence
 from datetime import (
     date, datetime, timedelta, timezone
 )
+from email.utils import parsedate_to_datetime
 from typing import Any, Type
 from urllib.parse import unquote
+from zoneinfo import ZoneInfo
 
 import aiohttp
+from aiohttp import hdrs
 from yarl import URL
 
-from . import urls
+from . import codec, urls
+from .batching import BatchResult, chunked, gather_limited
+from .cache import ResponseCache
+from .metrics import Metrics, create_trace_config, endpoint
+from .options import OptionChain
+from .orders import Order, OrderTemplate
+from .ratelimit import Priority, RateLimiter
+from .tokens import TokenStore, merge_tokens
 from .typing import (
     ExpirationDict,
     Request_AuthorizationDict, Request_OrdersDict,
-    Response_AuthorizationDict
+    Response_AuthorizationDict, TokenDict
 )
 from .websocket import ClientWebSocket
 
 ## Constants
+DEFAULT_LIMITER: Any = object()
+EXCHANGE_TIMEZONE: ZoneInfo = ZoneInfo("America/New_York")
 FORMAT_DATE: str = "%Y-%m-%d"
 
 
+## Functions
+def _location_id(response: aiohttp.ClientResponse) -> int:
+    '''Return id of created resource from Location header'''
+    location: str | None = response.headers.get(hdrs.LOCATION)
+    if not location:
+        raise aiohttp.ClientResponseError(
+            response.request_info, response.history, status=response.status,
+            message=f"{response.method} {response.url} response has no Location header",
+            headers=response.headers
+        )
+    return int(location.rsplit('/', 1)[-1])
+
+
+def _retry_after(headers: Any, default: float) -> float:
+    '''Return Retry-After header delay in seconds'''
+    value: str | None = headers.get('Retry-After') if headers else None
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+def _watchlist_items(symbols: Sequence[str], asset_type: str) -> list[dict[str, Any]]:
+    """Watchlist items body of symbols"""
+    return [
+        {'instrument': {'symbol': symbol, 'assetType': asset_type}} for symbol in symbols
+    ]
+
+
 ## Classes
 class ClientSession(aiohttp.ClientSession):
     """TDAmeritrade Client Session"""
 
     # -Constructor
     def __init__(
-        self, id_: str, callback_address: tuple[str, int], **kwargs: Any
+        self, id_: str, callback_address: tuple[str, int], *,
+        rate_limiter: RateLimiter | None = DEFAULT_LIMITER, max_retries: int = 3,
+        cache: ResponseCache | None = None, token_store: TokenStore | None = None,
+        token_key: str | None = None, metrics: Metrics | None = None,
+        base_url: str = urls.base, **kwargs: Any
     ) -> None:
         if 'ws_response_class' not in kwargs:
             kwargs['ws_response_class'] = ClientWebSocket
-        super().__init__(urls.base, raise_for_status=True, **kwargs)
+        if metrics is not None:
+            kwargs['trace_configs'] = [
+                *kwargs.get('trace_configs', ()), create_trace_config(metrics)
+            ]
+        super().__init__(base_url, raise_for_status=True, **kwargs)
         self.id: str = id_
         self.callback_address: tuple[str, int] = callback_address
         self.refresh_token: str = None  #type: ignore
         self.expirations: ExpirationDict = {'access': None, 'refresh': None}  #type: ignore
+        self.refresher: asyncio.Task[None] | None = None
+        self._renewal: asyncio.Task[None] | None = None
+        self._renewal_refresh: bool = False
+        # -Default: own limiter; None: unthrottled
+        self.rate_limiter: RateLimiter | None = (
+            RateLimiter() if rate_limiter is DEFAULT_LIMITER else rate_limiter
+        )
+        self.max_retries: int = max_retries
+        self.cache: ResponseCache | None = cache
+        self.token_store: TokenStore | None = token_store
+        self.metrics: Metrics | None = metrics
+        self.token_key: str = token_key or id_
+        if token_store is not None:
+            self.load_tokens()
 
     # -Instance Methods: Private
     # --Internal
@@ -53,7 +124,140 @@ class ClientSession(aiohttp.ClientSession):
             url = self._base_url.join(url)
         return url
 
+    async def _delete(
+        self, url: str, priority: int = Priority.DEFAULT, **kwargs: Any
+    ) -> aiohttp.ClientResponse:
+        '''Prioritized DELETE request'''
+        return await self._request(hdrs.METH_DELETE, url, priority=priority, **kwargs)
+
+    async def _get(
+        self, url: str, priority: int = Priority.DEFAULT, cache: str | None = None,
+        **kwargs: Any
+    ) -> aiohttp.ClientResponse:
+        '''Prioritized GET request; cacheable endpoint kinds go through the response cache'''
+        if cache is None or self.cache is None:
+            return await self._request(hdrs.METH_GET, url, priority=priority, **kwargs)
+        params: Any = kwargs.get('params')
+        key: tuple[str, Any] = (
+            url, tuple(sorted(params.items())) if isinstance(params, dict) else params
+        )
+        return await self.cache.get(cache, key, lambda: self._request(
+            hdrs.METH_GET, url, priority=priority, **kwargs
+        ))
+
+    async def _place(
+        self, method: str, url: str, order: Order | OrderTemplate | bytes,
+        values: dict[str, float]
+    ) -> int:
+        '''Send serialized order body; return order id from Location header'''
+        if values and not isinstance(order, OrderTemplate):
+            raise TypeError(
+                f"slot values {sorted(values)} given for a {type(order).__name__}; "
+                "only an OrderTemplate takes values"
+            )
+        body: bytes
+        if isinstance(order, Order):
+            body = order.to_bytes()
+        elif isinstance(order, OrderTemplate):
+            body = order.render(**values)
+        else:
+            body = order
+        response: aiohttp.ClientResponse = await self._request(
+            method, url, priority=Priority.ORDER, data=body,
+            headers={hdrs.CONTENT_TYPE: "application/json"}
+        )
+        if self.cache is not None:
+            self.cache.invalidate("accounts")
+        return _location_id(response)
+
+    async def _request(
+        self, method: str, str_or_url: Any, **kwargs: Any
+    ) -> aiohttp.ClientResponse:
+        '''Wait on token renewal before requests; renew + retry once on 401'''
+        priority: int = kwargs.pop('priority', Priority.DEFAULT)
+        if str_or_url == urls.v1.oauth2:
+            return await super()._request(method, str_or_url, **kwargs)
+        if self.refresh_token is None:
+            return await self._send(method, str_or_url, priority, kwargs)
+        await self.ensure_tokens()
+        authorization: str | None = self.headers.get('AUTHORIZATION')
+        try:
+            return await self._send(method, str_or_url, priority, kwargs)
+        except aiohttp.ClientResponseError as error:
+            if error.status != 401:
+                raise
+        if self.metrics is not None:
+            self.metrics.increment(
+                "tdameritrade_rest_reauthorizations_total", endpoint=endpoint(URL(str_or_url).path)
+            )
+        # -Only renew if no other request renewed while this one was in flight
+        if self.headers.get('AUTHORIZATION') == authorization:
+            await self.renew_tokens()
+        else:
+            await self.ensure_tokens()
+        return await self._send(method, str_or_url, priority, kwargs)
+
+    async def _send(
+        self, method: str, str_or_url: Any, priority: int, kwargs: dict[str, Any]
+    ) -> aiohttp.ClientResponse:
+        '''Rate limited request; honors Retry-After on 429'''
+        limiter: RateLimiter | None = self.rate_limiter
+        if limiter is not None and URL(str_or_url).is_absolute():
+            limiter = None
+        metrics: Metrics | None = self.metrics
+        attempt: int = 0
+        while True:
+            if limiter is not None:
+                if metrics is None:
+                    await limiter.acquire(priority)
+                else:
+                    start: float = time.perf_counter()
+                    await limiter.acquire(priority)
+                    metrics.observe(
+                        "tdameritrade_ratelimit_wait_seconds", time.perf_counter() - start,
+                        priority=Priority(priority).name
+                    )
+            try:
+                if metrics is None:
+                    return await super()._request(method, str_or_url, **kwargs)
+                sent: float = time.perf_counter()
+                response: aiohttp.ClientResponse = await super()._request(
+                    method, str_or_url, **kwargs
+                )
+                # -Buffer the body so the observed time covers the whole call
+                await response.read()
+                metrics.observe(
+                    "tdameritrade_rest_seconds", time.perf_counter() - sent,
+                    endpoint=endpoint(URL(str_or_url).path)
+                )
+                return response
+            except aiohttp.ClientResponseError as error:
+                if error.status != 429 or attempt >= self.max_retries:
+                    raise
+                delay: float = _retry_after(error.headers, 2.0 ** attempt)
+                attempt += 1
+                if metrics is not None:
+                    metrics.increment(
+                        "tdameritrade_rest_retries_total", endpoint=endpoint(URL(str_or_url).path)
+                    )
+                if limiter is not None:
+                    limiter.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+
     # --Authorization
+    def _adopt_tokens(self, tokens: TokenDict) -> None:
+        '''Use persisted tokens'''
+        self.headers.update({'AUTHORIZATION': f"Bearer {tokens['access_token']}"})
+        self.expirations['access'] = datetime.fromtimestamp(
+            tokens['access_expiration'], timezone.utc
+        )
+        if tokens['refresh_token'] is not None:
+            self.refresh_token = tokens['refresh_token']
+            self.expirations['refresh'] = datetime.fromtimestamp(
+                tokens['refresh_expiration'] or 0.0, timezone.utc
+            )
+
     async def _authorize(self, auth_dict: Request_AuthorizationDict) -> None:
         '''Internal authorization endpoint call'''
         auth_dict['client_id'] = self.authorization_id
@@ -70,12 +274,88 @@ class ClientSession(aiohttp.ClientSession):
                 seconds=response_dict['expires_in']
             )
             # -Handle: Refresh Token
-            if 'refresh_token' not in response_dict:
-                return
-            self.refresh_token = response_dict['refresh_token']
-            self.expirations['refresh'] = dt_utc + timedelta(
-                seconds=response_dict['refresh_token_expires_in']
+            if 'refresh_token' in response_dict:
+                self.refresh_token = response_dict['refresh_token']
+                self.expirations['refresh'] = dt_utc + timedelta(
+                    seconds=response_dict['refresh_token_expires_in']
+                )
+        if self.token_store is not None:
+            await self._store_tokens(self.token_store)
+
+    def _merge_stored(self, tokens: TokenDict | None) -> bool:
+        '''Adopt stored tokens unless older than in-memory ones; return if access is valid'''
+        if tokens is None:
+            return False
+        # -Never replace newer in-memory tokens with older stored ones
+        self._adopt_tokens(merge_tokens(self._current_tokens(), tokens))
+        return self.expirations['access'] > datetime.now(timezone.utc)
+
+    async def _reload_tokens(self) -> bool:
+        '''load_tokens without blocking the event loop on (possibly locked) store I/O'''
+        if self.token_store is None:
+            return False
+        return self._merge_stored(
+            await asyncio.to_thread(self.token_store.load, self.token_key)
+        )
+
+    async def _refresh_tokens(
+        self, access_margin: timedelta, refresh_margin: timedelta
+    ) -> None:
+        '''Background loop renewing tokens shortly before they expire'''
+        while True:
+            # -Another session of the key may have renewed while this one slept
+            await self._reload_tokens()
+            now: datetime = datetime.now(timezone.utc)
+            renew_refresh_token: bool = (
+                self.expirations['refresh'] is not None
+                and self.expirations['refresh'] - refresh_margin <= now
             )
+            if self.expirations['access'] is None:
+                delay: float = access_margin.total_seconds()
+            else:
+                delay = (self.expirations['access'] - access_margin - now).total_seconds()
+            if delay > 0 and not renew_refresh_token:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self.renew_tokens(renew_refresh_token)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                await asyncio.sleep(access_margin.total_seconds() / 4)
+
+    async def _renew(self, renew_refresh_token: bool) -> None:
+        '''Internal token renewal call; adopts tokens another process already renewed'''
+        if self.token_store is not None:
+            access_token: str | None = self.headers.get('AUTHORIZATION')
+            refresh_expiration: datetime | None = self.expirations['refresh']
+            valid: bool = await self._reload_tokens()
+            if valid and self.headers.get('AUTHORIZATION') != access_token and (
+                not renew_refresh_token or self.expirations['refresh'] != refresh_expiration
+            ):
+                return
+        auth_dict: Request_AuthorizationDict = {
+            'grant_type': "refresh_token",
+            'refresh_token': self.refresh_token,
+        }
+        if renew_refresh_token:
+            auth_dict['access_type'] = "offline"
+        await self._authorize(auth_dict)
+
+    def _current_tokens(self) -> TokenDict:
+        '''Return in-memory tokens in persisted form'''
+        access: datetime | None = self.expirations['access']
+        refresh: datetime | None = self.expirations['refresh']
+        return {
+            'access_expiration': access.timestamp() if access else 0.0,
+            'access_token': self.headers.get('AUTHORIZATION', "").removeprefix("Bearer "),
+            'refresh_expiration': refresh.timestamp() if refresh else None,
+            'refresh_token': self.refresh_token,
+        }
+
+    async def _store_tokens(self, store: TokenStore) -> None:
+        '''Persist current tokens unless the store holds later ones; adopt what is stored'''
+        self._adopt_tokens(
+            await asyncio.to_thread(store.save, self.token_key, self._current_tokens())
+        )
 
     # --Accounts
     async def _account(
@@ -87,21 +367,72 @@ class ClientSession(aiohttp.ClientSession):
             fields.append("orders")
         if positions:
             fields.append("positions")
-        return await self.get(
-            url, params={'fields': ','.join(field for field in fields)}
+        return await self._get(
+            url, params={'fields': ','.join(field for field in fields)},
+            priority=Priority.ACCOUNT, cache="accounts"
+        )
+
+    # --Symbols
+    async def _option_chain(self, symbol: str, params: dict[str, Any]) -> OptionChain:
+        '''Internal option chain endpoint call'''
+        response: aiohttp.ClientResponse = await self.get_option_chain(symbol, **params)
+        return await OptionChain.from_response(response)
+
+    async def _quotes(self, symbols: Sequence[str]) -> dict[str, Any]:
+        '''Internal quotes endpoint call'''
+        response: aiohttp.ClientResponse = await self._get(
+            urls.v1.quotes(), params={'symbol': ','.join(symbol for symbol in symbols)},
+            priority=Priority.BULK
+        )
+        quotes: dict[str, Any] = await response.json(loads=codec.loads)
+        return quotes
+
+    # --Watchlist
+    async def _write_watchlist(
+        self, method: str, url: str, body: dict[str, Any]
+    ) -> aiohttp.ClientResponse:
+        '''Send watchlist body and invalidate cached watchlists'''
+        response: aiohttp.ClientResponse = await self._request(
+            method, url, data=codec.dumps(body),
+            headers={hdrs.CONTENT_TYPE: "application/json"}
         )
+        if self.cache is not None:
+            self.cache.invalidate("watchlists")
+        return response
 
     # -Instance Methods: Public
+    async def close(self) -> None:
+        '''Stop token refresher and close session'''
+        self.stop_token_refresher()
+        await super().close()
+
     # --Authorization
+    async def ensure_tokens(self) -> None:
+        '''Wait for in-flight renewal, or renew if the access token expired'''
+        if self._renewal is not None and not self._renewal.done():
+            await asyncio.shield(self._renewal)
+            return
+        expiration: datetime | None = self.expirations['access']
+        if expiration is not None and expiration <= datetime.now(timezone.utc):
+            await self.renew_tokens()
+
+    def load_tokens(self) -> bool:
+        '''Load persisted tokens; return if the access token is still valid'''
+        if self.token_store is None:
+            return False
+        return self._merge_stored(self.token_store.load(self.token_key))
+
     async def renew_tokens(self, renew_refresh_token: bool = False) -> None:
-        '''Renew access (and optionally refresh) tokens'''
-        auth_dict: Request_AuthorizationDict = {
-            'grant_type': "refresh_token",
-            'refresh_token': self.refresh_token,
-        }
-        if renew_refresh_token:
-            auth_dict['access_type'] = "offline"
-        await self._authorize(auth_dict)
+        '''Renew access (and optionally refresh) tokens; concurrent callers share one renewal'''
+        renewal: asyncio.Task[None] | None = self._renewal
+        if renewal is None or renewal.done() or (
+            renew_refresh_token and not self._renewal_refresh
+        ):
+            if renewal is not None and not renewal.done():
+                await asyncio.shield(renewal)
+            renewal = self._renewal = asyncio.create_task(self._renew(renew_refresh_token))
+            self._renewal_refresh = renew_refresh_token
+        await asyncio.shield(renewal)
 
     async def request_tokens(self, code: str, *, decode: bool = True) -> None:
         '''Request initial access + refresh tokens'''
@@ -113,6 +444,23 @@ class ClientSession(aiohttp.ClientSession):
         }
         await self._authorize(auth_dict)
 
+    def start_token_refresher(
+        self, access_margin: timedelta = timedelta(minutes=1),
+        refresh_margin: timedelta = timedelta(days=7)
+    ) -> asyncio.Task[None]:
+        '''Start background task renewing tokens before they expire'''
+        if self.refresher is None or self.refresher.done():
+            self.refresher = asyncio.create_task(
+                self._refresh_tokens(access_margin, refresh_margin)
+            )
+        return self.refresher
+
+    def stop_token_refresher(self) -> None:
+        '''Cancel background token refresher'''
+        if self.refresher is not None:
+            self.refresher.cancel()
+            self.refresher = None
+
     # --Accounts
     async def get_account(
         self, *, account_id: int | None, orders: bool = False, positions: bool = False
@@ -127,17 +475,21 @@ class ClientSession(aiohttp.ClientSession):
         return await self._account(urls.v1.accounts(), orders, positions)
 
     # --Orders
-    async def create_order(self, account_id: int, symbol: str) -> aiohttp.ClientResponse:
-        '''Place order and return HTTP response of order endpoint'''
-        raise NotImplementedError("ClientSession.create_order")
+    async def create_order(
+        self, account_id: int, order: Order | OrderTemplate | bytes, **values: float
+    ) -> int:
+        '''Place order (template slots filled from values) and return its order id'''
+        return await self._place(hdrs.METH_POST, urls.v1.orders(account_id), order, values)
 
     async def delete_order(self, account_id: int, order_id: int) -> None:
         '''Cancel order'''
-        await self.delete(urls.v1.orders(account_id, order_id))
+        await self._delete(urls.v1.orders(account_id, order_id), priority=Priority.ORDER)
+        if self.cache is not None:
+            self.cache.invalidate("accounts")
 
     async def get_order(self, account_id: int, order_id: int) -> aiohttp.ClientResponse:
         '''Return HTTP response of order endpoint'''
-        return await self.get(urls.v1.orders(account_id, order_id))
+        return await self._get(urls.v1.orders(account_id, order_id), priority=Priority.ORDER)
 
     async def get_orders(
         self, *, account_id: int | None = None, from_date: date | None = None,
@@ -158,22 +510,123 @@ class ClientSession(aiohttp.ClientSession):
             params['status'] = status
         if to_date:
             params['toEnteredTime'] = to_date.strftime(FORMAT_DATE)
-        return await self.get(urls.v1.orders(account_id), params=params)
+        return await self._get(
+            urls.v1.orders(account_id), params=params, priority=Priority.ORDER
+        )
+
+    async def replace_order(
+        self, account_id: int, order_id: int, order: Order | OrderTemplate | bytes,
+        **values: float
+    ) -> int:
+        '''Replace order (template slots filled from values) and return new order id'''
+        return await self._place(
+            hdrs.METH_PUT, urls.v1.orders(account_id, order_id), order, values
+        )
+
+    # --Transactions
+    async def get_transaction(
+        self, account_id: int, transaction_id: int
+    ) -> aiohttp.ClientResponse:
+        '''Return HTTP response of transaction endpoint'''
+        return await self._get(
+            urls.v1.transactions(account_id, transaction_id), priority=Priority.ACCOUNT
+        )
 
-    async def replace_order(self, account_id: int, order_id: int) -> aiohttp.ClientResponse:
-        '''Replace order and return HTTP response of order endpoint'''
-        raise NotImplementedError("ClientSession.replace_order")
+    async def get_transactions(
+        self, account_id: int, *, from_date: date | None = None,
+        symbol: str | None = None, to_date: date | None = None, type_: str | None = None
+    ) -> aiohttp.ClientResponse:
+    #-TODO: MAKE 'type_' ENUM
+    # -- ALL, TRADE, BUY_ONLY, SELL_ONLY, CASH_IN_OR_CASH_OUT, CHECKING, DIVIDEND,
+    # -- INTEREST, OTHER, ADVISOR_FEES
+        '''Return HTTP response of transactions endpoint'''
+        params: dict[str, str] = {}
+        if from_date:
+            params['startDate'] = from_date.strftime(FORMAT_DATE)
+        if symbol:
+            params['symbol'] = symbol
+        if to_date:
+            params['endDate'] = to_date.strftime(FORMAT_DATE)
+        if type_:
+            params['type'] = type_
+        return await self._get(
+            urls.v1.transactions(account_id), params=params, priority=Priority.BULK
+        )
 
     # --Symbols
+    async def get_instrument(self, cusip: str) -> aiohttp.ClientResponse:
+        '''Return HTTP response of instrument (CUSIP) endpoint'''
+        return await self._get(urls.v1.instruments(cusip), cache="instruments")
+
+    async def search_instruments(
+        self, symbols: str | Sequence[str], projection: str = "symbol-search"
+    ) -> aiohttp.ClientResponse:
+    #-TODO: MAKE 'projection' ENUM
+    # -- symbol-search, symbol-regex, desc-search, desc-regex, fundamental
+        '''Return HTTP response of instruments search endpoint'''
+        symbol: str = symbols if isinstance(symbols, str) else ','.join(symbols)
+        return await self._get(
+            urls.v1.instruments(), params={'symbol': symbol, 'projection': projection},
+            priority=Priority.BULK, cache="instruments"
+        )
+
+    async def get_option_chain(
+        self, symbol: str, *, contract_type: str | None = None,
+        from_date: date | None = None, include_quotes: bool = False,
+        range_: str | None = None, strike: float | None = None,
+        strike_count: int | None = None, to_date: date | None = None
+    ) -> aiohttp.ClientResponse:
+    #-TODO: MAKE 'contract_type' ENUM -- CALL, PUT, ALL
+    #-TODO: MAKE 'range_' ENUM -- ITM, NTM, OTM, SAK, SBK, SNK, ALL
+        '''Return HTTP response of option chains endpoint'''
+        params: dict[str, str | int | float] = {'symbol': symbol}
+        if contract_type:
+            params['contractType'] = contract_type
+        if from_date:
+            params['fromDate'] = from_date.strftime(FORMAT_DATE)
+        if include_quotes:
+            params['includeQuotes'] = "TRUE"
+        if range_:
+            params['range'] = range_
+        if strike is not None:
+            params['strike'] = strike
+        if strike_count:
+            params['strikeCount'] = strike_count
+        if to_date:
+            params['toDate'] = to_date.strftime(FORMAT_DATE)
+        return await self._get(urls.v1.options, params=params, priority=Priority.BULK)
+
+    async def get_option_chains(
+        self, symbols: Sequence[str], *, concurrency: int = 8, **params: Any
+    ) -> BatchResult[str, OptionChain]:
+        '''Return columnar option chains keyed by underlying, fetched concurrently'''
+        result: BatchResult[str, OptionChain] = BatchResult()
+        chains: list[OptionChain | BaseException] = await gather_limited(
+            lambda symbol: self._option_chain(symbol, params), symbols, concurrency
+        )
+        for symbol, chain in zip(symbols, chains):
+            if isinstance(chain, BaseException):
+                result.errors[(symbol,)] = chain
+            else:
+                result[symbol] = chain
+        return result
+
     async def get_quote(self, symbol: str) -> aiohttp.ClientResponse:
         '''Return HTTP response of quote endpoint'''
         return await self.get(urls.v1.quotes(symbol))
 
-    async def get_quotes(self, symbols: Sequence[str]) -> aiohttp.ClientResponse:
-        '''Return HTTP response of quotes endpoint'''
-        return await self.get(
-            urls.v1.quotes(), params={'symbol': ','.join(symbol for symbol in symbols)}
-        )
+    async def get_quotes(
+        self, symbols: Sequence[str], *, chunk_size: int = 300, concurrency: int = 8
+    ) -> BatchResult[str, dict[str, Any]]:
+        '''Return quotes keyed by symbol, fetched in concurrent chunks'''
+        chunks: list[Sequence[str]] = chunked(symbols, chunk_size)
+        result: BatchResult[str, dict[str, Any]] = BatchResult()
+        for chunk, quotes in zip(chunks, await gather_limited(self._quotes, chunks, concurrency)):
+            if isinstance(quotes, BaseException):
+                result.errors[tuple(chunk)] = quotes
+            else:
+                result.update(quotes)
+        return result
 
     async def get_price_history(
         self, symbol: str, frequency: tuple[str, int], *,
@@ -188,22 +641,50 @@ class ClientSession(aiohttp.ClientSession):
             'frequencyType': frequency[0],
         }
         if extended_hours:
-            params['needExtendedHoursData'] = extended_hours
+            params['needExtendedHoursData'] = "true"
+        # -Day bounds are exchange (ET) midnights, independent of the host timezone
         if from_date:
-            dt = datetime(from_date.year, from_date.month, from_date.day)
+            dt = datetime(
+                from_date.year, from_date.month, from_date.day, tzinfo=EXCHANGE_TIMEZONE
+            )
             params['startDate'] = int(dt.timestamp() * 1000)
         if period:
             params['period'] = period[1]
             params['periodType'] = period[0]
         if to_date:
-            dt = datetime(to_date.year, to_date.month, to_date.day)
+            dt = datetime(to_date.year, to_date.month, to_date.day, tzinfo=EXCHANGE_TIMEZONE)
             params['endDate'] = int(dt.timestamp() * 1000)
-        return await self.get(urls.v1.historicals(symbol), params=params)
+        return await self._get(
+            urls.v1.historicals(symbol), params=params, priority=Priority.BULK
+        )
+
+    async def get_market_hours(
+        self, markets: Sequence[str], day: date | None = None
+    ) -> aiohttp.ClientResponse:
+    #-TODO: MAKE 'markets' ENUM -- EQUITY, OPTION, FUTURE, BOND, FOREX
+        '''Return HTTP response of market hours endpoint'''
+        params: dict[str, str] = {'markets': ','.join(markets)}
+        if day:
+            params['date'] = day.strftime(FORMAT_DATE)
+        return await self._get(urls.v1.market_hours(), params=params, cache="market_hours")
+
+    async def get_movers(
+        self, index: str, *, change: str | None = None, direction: str | None = None
+    ) -> aiohttp.ClientResponse:
+    #-TODO: MAKE 'change' ENUM -- value, percent
+    #-TODO: MAKE 'direction' ENUM -- up, down
+        '''Return HTTP response of movers endpoint'''
+        params: dict[str, str] = {}
+        if change:
+            params['change'] = change
+        if direction:
+            params['direction'] = direction
+        return await self._get(urls.v1.movers(index), params=params)
 
     # --User Principals/Preferences
     async def get_preferences(self, account_id: int) -> aiohttp.ClientResponse:
         '''Return HTTP response of account preferences endpoint'''
-        return await self.get(urls.v1.preferences(account_id))
+        return await self._get(urls.v1.preferences(account_id), cache="preferences")
 
     async def get_streamer_keys(
         self, account_ids: Sequence[int] | None = None
@@ -212,8 +693,9 @@ class ClientSession(aiohttp.ClientSession):
         params: dict[str, str] = {}
         if account_ids:
             params['accountIds'] = ','.join(str(account_id) for account_id in account_ids)
-        return await self.get(
-            urls.v1.user_principals(subscription_keys=True), params=params
+        return await self._get(
+            urls.v1.user_principals(subscription_keys=True), params=params,
+            cache="user_principals"
         )
 
     async def get_user_principals(
@@ -230,9 +712,10 @@ class ClientSession(aiohttp.ClientSession):
             fields.append("streamerSubscriptionKeys")
         if surrogate_ids:
             fields.append("surrogateIds")
-        return await self.get(
+        return await self._get(
             urls.v1.user_principals(),
-            params={'fields': ','.join(field for field in fields)}
+            params={'fields': ','.join(field for field in fields)},
+            cache="user_principals"
         )
 
     async def update_preferences(self, account_id: int) -> None:
@@ -240,35 +723,86 @@ class ClientSession(aiohttp.ClientSession):
         raise NotImplementedError("Session.update_preferences")
 
     # --Watchlist
-    async def create_watchlist(self, account_id: int) -> aiohttp.ClientResponse:
-        '''Place order and return HTTP response of order endpoint'''
-        raise NotImplementedError("Session.create_watchlist")
+    async def create_watchlist(
+        self, account_id: int, name: str, symbols: Sequence[str] = (),
+        asset_type: str = "EQUITY"
+    ) -> int:
+        '''Create watchlist of symbols and return its watchlist id'''
+        response: aiohttp.ClientResponse = await self._write_watchlist(
+            hdrs.METH_POST, urls.v1.watchlists(account_id),
+            {'name': name, 'watchlistItems': _watchlist_items(symbols, asset_type)}
+        )
+        return _location_id(response)
 
     async def delete_watchlist(
         self, account_id: int, watchlist_id: int
     ) -> None:
         '''Delete watchlist'''
-        await self.delete(urls.v1.watchlists(account_id, watchlist_id))
+        await self._delete(urls.v1.watchlists(account_id, watchlist_id))
+        if self.cache is not None:
+            self.cache.invalidate("watchlists")
 
     async def get_watchlist(
         self, account_id: int, watchlist_id: int
     ) -> aiohttp.ClientResponse:
         '''Return HTTP response of watchlist endpoint'''
-        return await self.get(urls.v1.watchlists(account_id, watchlist_id))
+        return await self._get(urls.v1.watchlists(account_id, watchlist_id), cache="watchlists")
 
     async def get_watchlists(
         self, account_id: int | None = None
     ) -> aiohttp.ClientResponse:
         '''Return HTTP response of watchlists endpoint'''
-        return await self.get(urls.v1.watchlists(account_id))
+        return await self._get(urls.v1.watchlists(account_id), cache="watchlists")
 
-    async def replace_watchlist(self, account_id: int, watchlist_id: int):
-        '''Replace watchlist and return HTTP response of watchlist endpoint'''
-        raise NotImplementedError("Session.replace_watchlist")
+    async def replace_watchlist(
+        self, account_id: int, watchlist_id: int, name: str, symbols: Sequence[str],
+        asset_type: str = "EQUITY"
+    ) -> None:
+        '''Replace name + every item of watchlist'''
+        await self._write_watchlist(
+            hdrs.METH_PUT, urls.v1.watchlists(account_id, watchlist_id), {
+                'name': name, 'watchlistId': str(watchlist_id),
+                'watchlistItems': _watchlist_items(symbols, asset_type),
+            }
+        )
 
-    async def update_watchlist(self, account_id: int, watchlist_id: int):
-        '''Update watchlist and return HTTP response of watchlist endpoint'''
-        raise NotImplementedError("Session.update_watchlist")
+    async def update_watchlist(
+        self, account_id: int, watchlist_id: int, *, add: Sequence[str] = (),
+        remove: Sequence[str] = (), name: str | None = None, asset_type: str = "EQUITY"
+    ) -> None:
+        '''Apply bulk symbol changes as a single write (PATCH if only adding, else PUT)'''
+        response: aiohttp.ClientResponse = await self._request(
+            hdrs.METH_GET, urls.v1.watchlists(account_id, watchlist_id)
+        )
+        watchlist: dict[str, Any] = await response.json(loads=codec.loads)
+        items: list[dict[str, Any]] = watchlist.get('watchlistItems', [])
+        current: set[str] = {item['instrument']['symbol'] for item in items}
+        removed: set[str] = current.intersection(remove)
+        added: list[str] = list(dict.fromkeys(
+            symbol for symbol in add if symbol not in current or symbol in removed
+        ))
+        if not added and not removed and name is None:
+            return
+        url: str = urls.v1.watchlists(account_id, watchlist_id)
+        if not removed:
+            body: dict[str, Any] = {
+                'watchlistId': str(watchlist_id),
+                'watchlistItems': _watchlist_items(added, asset_type),
+            }
+            if name is not None:
+                body['name'] = name
+            await self._write_watchlist(hdrs.METH_PATCH, url, body)
+            return
+        # -Keep quantity/averagePrice/commission/purchasedDate; sequence ids are reassigned
+        kept: list[dict[str, Any]] = [
+            {key: value for key, value in item.items() if key != 'sequenceId'}
+            for item in items if item['instrument']['symbol'] not in removed
+        ]
+        await self._write_watchlist(hdrs.METH_PUT, url, {
+            'name': watchlist.get('name', "") if name is None else name,
+            'watchlistId': str(watchlist_id),
+            'watchlistItems': kept + _watchlist_items(added, asset_type),
+        })
 
     # -Properties
     @property
@@ -290,3 +824,7 @@ class ClientSession(aiohttp.ClientSession):
     @property
     def refresh_token_expiration(self) -> datetime | None:
         return self.expirations['refresh']
+
+    @property
+    def queue_depth(self) -> int:
+        return 0 if self.rate_limiter is None else self.rate_limiter.queue_depth
@@ -0,0 +1,258 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Real-time Quote/Book State    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from array import array
+from collections.abc import Awaitable, Callable, Sequence
+from inspect import isawaitable
+from typing import Any
+
+from .fields import NAN, SCHEMAS, ColumnBatch, ServiceSchema
+from .stream import StreamRouter
+
+## Constants
+QuoteHandler = Callable[["QuoteTable", list[int]], Awaitable[None] | None]
+BookHandler = Callable[["BookLadder"], Awaitable[None] | None]
+
+
+## Classes
+class QuoteTable:
+    """Latest full quote per symbol in preallocated columns, merged in place from deltas"""
+
+    # -Constructor
+    def __init__(self, service: str = "QUOTE", capacity: int = 1024) -> None:
+        self.schema: ServiceSchema = SCHEMAS[service]
+        self.capacity: int = capacity
+        self.index: dict[str, int] = {}
+        self.symbols: list[str] = []
+        self.columns: list[array[float]] = [
+            array('d', self.schema.blank(capacity)[:capacity]) for _ in self.schema.numeric
+        ]
+        self.updated: array[float] = array('d', bytes(8 * capacity))
+        self.text: list[dict[str, Any]] = []
+        self.handlers: list[QuoteHandler] = []
+        self._changed: list[int] = []
+
+    # -Dunder Methods
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    # -Instance Methods: Private
+    def _grow(self) -> None:
+        '''Double capacity into new arrays (previously returned views keep old data)'''
+        capacity: int = 2 * self.capacity
+        fill: array[float] = self.schema.blank(capacity)
+        columns: list[array[float]] = []
+        for column in self.columns:
+            grown: array[float] = array('d', fill[:capacity])
+            memoryview(grown)[:self.capacity] = memoryview(column)
+            columns.append(grown)
+        updated: array[float] = array('d', bytes(8 * capacity))
+        memoryview(updated)[:self.capacity] = memoryview(self.updated)
+        self.columns = columns
+        self.updated = updated
+        self.capacity = capacity
+
+    def _row(self, symbol: str) -> int:
+        '''Return (allocating if needed) row of symbol'''
+        row: int | None = self.index.get(symbol)
+        if row is None:
+            row = len(self.symbols)
+            if row == self.capacity:
+                self._grow()
+            self.index[symbol] = row
+            self.symbols.append(symbol)
+            self.text.append({})
+        return row
+
+    # -Instance Methods: Public
+    def add_handler(self, handler: QuoteHandler) -> None:
+        '''Register handler called with (reused) changed row list after every merged batch'''
+        self.handlers.append(handler)
+
+    async def apply(self, payload: ColumnBatch | dict[str, Any]) -> None:
+        '''Merge raw data entry (or decoded batch) and call handlers with changed rows'''
+        if isinstance(payload, ColumnBatch):
+            self.merge_batch(payload)
+        else:
+            self.merge(payload['content'], payload.get('timestamp', 0))
+        for handler in self.handlers:
+            result = handler(self, self._changed)
+            if isawaitable(result):
+                await result
+
+    def attach(self, router: StreamRouter) -> None:
+        '''Feed table from router data of its service'''
+        router.add_data_handler(self.schema.service, self.apply, decode=False)
+
+    def get(self, symbol: str, name: str) -> float:
+        '''Return current value of numeric field of symbol'''
+        return self.columns[self.schema.column(name)][self.index[symbol]]
+
+    def merge(self, content: Sequence[dict[str, Any]], timestamp: int = 0) -> list[int]:
+        '''Write only the fields present in raw delta content; return changed rows'''
+        index: dict[str, int] = self.schema.index
+        changed: list[int] = self._changed
+        changed.clear()
+        for item in content:
+            row: int = self._row(item['key'])
+            columns: list[array[float]] = self.columns
+            extra: dict[str, Any] | None = None
+            for field, value in item.items():
+                slot: int = index.get(field, -2)
+                if slot >= 0:
+                    columns[slot][row] = value
+                elif slot == -1:
+                    if extra is None:
+                        extra = self.text[row]
+                    extra[field] = value
+            self.updated[row] = timestamp
+            changed.append(row)
+        return changed
+
+    def merge_batch(self, batch: ColumnBatch) -> list[int]:
+        '''Merge decoded batch; NaN (missing) fields keep their previous value'''
+        columns: list[array[float]] = self.columns
+        source: list[array[float]] = batch.columns
+        width: int = len(columns)
+        updated: array[float] = self.updated
+        timestamp: float = float(batch.timestamp)
+        changed: list[int] = self._changed
+        changed.clear()
+        for i in range(batch.size):
+            row: int = self._row(batch.keys[i])
+            if columns is not self.columns:
+                columns = self.columns
+                updated = self.updated
+            for c in range(width):
+                value: float = source[c][i]
+                if value == value:
+                    columns[c][row] = value
+            extra: dict[str, Any] | None = batch.text[i]
+            if extra is not None:
+                self.text[row].update(extra)
+            updated[row] = timestamp
+            changed.append(row)
+        return changed
+
+    def ndarray(self, name: str) -> Any:
+        '''Zero-copy numpy array of numeric field (requires numpy)'''
+        import numpy  #type: ignore
+        return numpy.frombuffer(self.view(name), dtype=numpy.float64)
+
+    def snapshot(self, symbol: str) -> dict[str, Any]:
+        '''Return copy of full current quote of symbol'''
+        row: int = self.index[symbol]
+        quote: dict[str, Any] = {
+            name: column[row] for name, column in zip(self.schema.columns, self.columns)
+        }
+        names: tuple[str, ...] = self.schema.names
+        quote.update((names[int(field)], value) for field, value in self.text[row].items())
+        quote['symbol'] = symbol
+        return quote
+
+    def view(self, name: str) -> memoryview:
+        '''Zero-copy view of numeric field over every row; stale after table grows'''
+        return memoryview(self.columns[self.schema.column(name)])[:len(self.symbols)]
+
+
+class BookLadder:
+    """Fixed-depth price/size ladder of one symbol, overwritten per snapshot"""
+
+    __slots__ = (
+        "symbol", "depth", "time", "bids", "asks",
+        "bid_price", "bid_size", "ask_price", "ask_size",
+    )
+
+    # -Constructor
+    def __init__(self, symbol: str, depth: int = 10) -> None:
+        self.symbol: str = symbol
+        self.depth: int = depth
+        self.time: int = 0
+        self.bids: int = 0
+        self.asks: int = 0
+        self.bid_price: array[float] = array('d', bytes(8 * depth))
+        self.bid_size: array[float] = array('d', bytes(8 * depth))
+        self.ask_price: array[float] = array('d', bytes(8 * depth))
+        self.ask_size: array[float] = array('d', bytes(8 * depth))
+
+    # -Instance Methods: Private
+    def _fill(
+        self, levels: Sequence[dict[str, Any]], prices: array[float], sizes: array[float]
+    ) -> int:
+        count: int = min(len(levels), self.depth)
+        for i in range(count):
+            level: dict[str, Any] = levels[i]
+            prices[i] = level['0']
+            sizes[i] = level['1']
+        return count
+
+    # -Instance Methods: Public
+    def apply(self, content: dict[str, Any]) -> None:
+        '''Overwrite ladder with a book snapshot content entry'''
+        self.time = content.get('1', self.time)
+        self.bids = self._fill(content.get('2', ()), self.bid_price, self.bid_size)
+        self.asks = self._fill(content.get('3', ()), self.ask_price, self.ask_size)
+
+    # -Properties
+    @property
+    def best_ask(self) -> float:
+        return self.ask_price[0] if self.asks else NAN
+
+    @property
+    def best_bid(self) -> float:
+        return self.bid_price[0] if self.bids else NAN
+
+    @property
+    def spread(self) -> float:
+        return self.best_ask - self.best_bid
+
+
+class BookTable:
+    """Per-symbol depth ladders of a book service (NASDAQ_BOOK, LISTED_BOOK, ...)"""
+
+    # -Constructor
+    def __init__(self, service: str = "NASDAQ_BOOK", depth: int = 10) -> None:
+        self.service: str = service
+        self.depth: int = depth
+        self.ladders: dict[str, BookLadder] = {}
+        self.handlers: list[BookHandler] = []
+
+    # -Dunder Methods
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.ladders
+
+    def __getitem__(self, symbol: str) -> BookLadder:
+        return self.ladders[symbol]
+
+    # -Instance Methods
+    def add_handler(self, handler: BookHandler) -> None:
+        '''Register handler called with every updated ladder'''
+        self.handlers.append(handler)
+
+    async def apply(self, entry: dict[str, Any]) -> None:
+        '''Apply raw book data entry'''
+        for content in entry.get('content', ()):
+            symbol: str = content['key']
+            ladder: BookLadder | None = self.ladders.get(symbol)
+            if ladder is None:
+                ladder = self.ladders[symbol] = BookLadder(symbol, self.depth)
+            ladder.apply(content)
+            for handler in self.handlers:
+                result = handler(ladder)
+                if isawaitable(result):
+                    await result
+
+    def attach(self, router: StreamRouter) -> None:
+        '''Feed ladders from router data of its service'''
+        router.add_data_handler(self.service, self.apply)
@@ -0,0 +1,197 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TDAmeritrade Stream Router    ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from inspect import isawaitable
+from typing import Any
+
+from . import codec
+from .fields import SCHEMAS, ColumnBatch, ServiceSchema
+from .metrics import Metrics
+from .typing import Response_WebSocketDataDict, Response_WebSocketDict
+
+## Constants
+DataHandler = Callable[[Any], Awaitable[None] | None]
+ResponseHandler = Callable[[Response_WebSocketDict], Awaitable[None] | None]
+NotifyHandler = Callable[[dict[str, Any]], Awaitable[None] | None]
+RawHandler = Callable[[str | bytes], None]
+
+
+## Classes
+class StreamRouter:
+    """Routes decoded streamer frames to per-service handlers"""
+
+    # -Constructor
+    def __init__(self, queue_size: int = 1024) -> None:
+        self.data_handlers: dict[str, list[DataHandler]] = {}
+        self.response_handlers: dict[str, list[ResponseHandler]] = {}
+        self.notify_handlers: list[NotifyHandler] = []
+        self.raw_handlers: list[RawHandler] = []
+        self.batches: dict[str, ColumnBatch] = {}
+        self.metrics: Metrics | None = None
+        self.pending: dict[int, tuple[
+            asyncio.Future[Response_WebSocketDict], asyncio.TimerHandle | None
+        ]] = {}
+        # -(receive time, raw frame) pairs read by drain
+        self.queue: asyncio.Queue[tuple[float, str | bytes]] = asyncio.Queue(queue_size)
+
+    # -Instance Methods: Private
+    async def _route_data(
+        self, entries: list[Response_WebSocketDataDict], received: float | None = None
+    ) -> None:
+        '''Decode and route data/snapshot entries received at epoch seconds (default: now)'''
+        for entry in entries:
+            service: str = entry['service']
+            handlers: list[DataHandler] | None = self.data_handlers.get(service)
+            if not handlers:
+                continue
+            metrics: Metrics | None = self.metrics
+            start: float = 0.0
+            if metrics is not None:
+                start = time.perf_counter()
+                metrics.increment("tdameritrade_stream_messages_total", service=service)
+                # -Network lag only; time spent queued is covered by the queue depth gauge
+                arrival: float = time.time() if received is None else received
+                metrics.observe(
+                    "tdameritrade_stream_lag_seconds",
+                    max(0.0, arrival - entry['timestamp'] / 1000), service=service
+                )
+            payload: Any = entry
+            batch: ColumnBatch | None = self.batches.get(service)
+            if batch is not None:
+                payload = batch.decode(entry['content'], entry['timestamp'])
+            for handler in handlers:
+                result = handler(payload)
+                if isawaitable(result):
+                    await result
+            if metrics is not None:
+                metrics.observe(
+                    "tdameritrade_stream_handler_seconds", time.perf_counter() - start,
+                    service=service
+                )
+
+    def _expire(self, request_id: int) -> None:
+        '''Fail pending request future on timeout'''
+        future, _ = self.pending.pop(request_id, (None, None))
+        if future is not None and not future.done():
+            future.set_exception(asyncio.TimeoutError(f"request {request_id} timed out"))
+
+    async def _route_response(self, entries: list[Response_WebSocketDict]) -> None:
+        '''Resolve pending requests and route command response entries'''
+        for entry in entries:
+            future, timer = self.pending.pop(int(entry['requestid']), (None, None))
+            if timer is not None:
+                timer.cancel()
+            if future is not None and not future.done():
+                future.set_result(entry)
+            for handler in self.response_handlers.get(entry['service'], ()):
+                result = handler(entry)
+                if isawaitable(result):
+                    await result
+
+    async def _route_notify(self, entries: list[dict[str, Any]]) -> None:
+        '''Route heartbeat/notify entries'''
+        for entry in entries:
+            for handler in self.notify_handlers:
+                result = handler(entry)
+                if isawaitable(result):
+                    await result
+
+    # -Instance Methods: Public
+    def add_data_handler(
+        self, service: str, handler: DataHandler, *, decode: bool = True
+    ) -> None:
+        '''Register data handler; known services receive a reused ColumnBatch'''
+        self.data_handlers.setdefault(service, []).append(handler)
+        schema: ServiceSchema | None = SCHEMAS.get(service)
+        if decode and schema is not None and service not in self.batches:
+            self.batches[service] = schema.create_batch()
+
+    def add_notify_handler(self, handler: NotifyHandler) -> None:
+        '''Register heartbeat/notify handler'''
+        self.notify_handlers.append(handler)
+
+    def add_raw_handler(self, handler: RawHandler) -> None:
+        '''Register (sync) handler called with every raw frame before parsing'''
+        self.raw_handlers.append(handler)
+
+    def add_response_handler(self, service: str, handler: ResponseHandler) -> None:
+        '''Register command response handler'''
+        self.response_handlers.setdefault(service, []).append(handler)
+
+    def cancel_pending(self, exception: BaseException | None = None) -> None:
+        '''Fail every pending request future (eg: on disconnect)'''
+        pending = self.pending
+        self.pending = {}
+        for future, timer in pending.values():
+            if timer is not None:
+                timer.cancel()
+            if not future.done():
+                future.set_exception(exception or ConnectionResetError("stream closed"))
+
+    def expect(
+        self, request_id: int, timeout: float | None = None
+    ) -> asyncio.Future[Response_WebSocketDict]:
+        '''Return future resolved by the response frame for request id'''
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[Response_WebSocketDict] = loop.create_future()
+        timer: asyncio.TimerHandle | None = None
+        if timeout is not None:
+            timer = loop.call_later(timeout, self._expire, request_id)
+        # -Callers may discard the future (eg: login); keep cancel_pending from logging it
+        future.add_done_callback(_retrieve)
+        self.pending[request_id] = (future, timer)
+        return future
+
+    def remove_data_handler(self, service: str, handler: DataHandler) -> None:
+        '''Unregister data handler'''
+        handlers: list[DataHandler] = self.data_handlers.get(service, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def remove_raw_handler(self, handler: RawHandler) -> None:
+        '''Unregister raw frame handler'''
+        if handler in self.raw_handlers:
+            self.raw_handlers.remove(handler)
+
+    async def dispatch(self, frame: dict[str, Any], received: float | None = None) -> None:
+        '''Route a parsed streamer frame received at epoch seconds (default: now)'''
+        if 'data' in frame:
+            await self._route_data(frame['data'], received)
+        if 'snapshot' in frame:
+            await self._route_data(frame['snapshot'], received)
+        if 'response' in frame:
+            await self._route_response(frame['response'])
+        if 'notify' in frame:
+            await self._route_notify(frame['notify'])
+
+    async def dispatch_raw(self, data: str | bytes, received: float | None = None) -> None:
+        '''Parse and route a raw streamer frame received at epoch seconds (default: now)'''
+        for handler in self.raw_handlers:
+            handler(data)
+        await self.dispatch(codec.loads(data), received)
+
+    async def drain(self) -> None:
+        '''Dispatch queued raw frames until cancelled (or a handler raises)'''
+        queue: asyncio.Queue[tuple[float, str | bytes]] = self.queue
+        while True:
+            received, data = await queue.get()
+            try:
+                await self.dispatch_raw(data, received)
+            finally:
+                queue.task_done()
+
+
+## Functions
+def _retrieve(future: asyncio.Future[Any]) -> None:
+    """Mark exception of future as retrieved"""
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,139 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TDAmeritrade Resilient Stream ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from inspect import isawaitable
+
+import aiohttp
+
+from .profile import Profile
+from .stream import StreamRouter
+from .subscriptions import SubscriptionManager
+from .websocket import ClientWebSocket, ResponseFuture
+
+## Constants
+log: logging.Logger = logging.getLogger(__name__)
+NETWORK_ERRORS: tuple[type[BaseException], ...] = (
+    OSError, asyncio.TimeoutError, aiohttp.ClientError
+)
+ConnectHandler = Callable[[], Awaitable[None] | None]
+
+
+## Classes
+class Streamer:
+    """Self-healing streamer connection with session resume + resubscription"""
+
+    # -Constructor
+    def __init__(
+        self, profile: Profile, quality_of_service: int = 2, *,
+        heartbeat_timeout: float = 30.0, backoff: tuple[float, float] = (0.5, 30.0),
+        router: StreamRouter | None = None
+    ) -> None:
+        self.profile: Profile = profile
+        self.qos: int = quality_of_service
+        self.heartbeat_timeout: float = heartbeat_timeout
+        self.backoff: tuple[float, float] = backoff
+        self.router: StreamRouter = router or StreamRouter()
+        self.subscriptions: SubscriptionManager = SubscriptionManager()
+        self.websocket: ClientWebSocket | None = None
+        self.reconnects: int = 0
+        self.connected: asyncio.Event = asyncio.Event()
+        self.connect_handlers: list[ConnectHandler] = []
+        self._closing: bool = False
+
+    # -Instance Methods: Private
+    async def _connect(self) -> ClientWebSocket:
+        '''Login (reusing cached streamer info) and restore subscriptions'''
+        websocket: ClientWebSocket = await self.profile.create_websocket(
+            self.qos, router=self.router
+        )
+        try:
+            self.websocket = websocket
+            self.subscriptions.websocket = websocket
+            self.subscriptions.resubscribe()
+            await self.subscriptions.flush()
+            self.connected.set()
+            for handler in self.connect_handlers:
+                result = handler()
+                if isawaitable(result):
+                    await result
+        except BaseException:
+            self.connected.clear()
+            await websocket.close()
+            raise
+        return websocket
+
+    async def _watch(self, websocket: ClientWebSocket) -> None:
+        '''Return once the receive loop ends or heartbeats stop arriving'''
+        assert websocket.receiver is not None
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while not websocket.receiver.done():
+            remaining: float = (
+                websocket.last_received + self.heartbeat_timeout - loop.time()
+            )
+            if remaining <= 0:
+                break
+            await asyncio.wait({websocket.receiver}, timeout=remaining)
+
+    def _delay(self, attempt: int) -> float:
+        '''Full-jitter exponential backoff delay'''
+        return random.uniform(0, min(self.backoff[1], self.backoff[0] * 2 ** attempt))
+
+    # -Instance Methods: Public
+    def add_connect_handler(self, handler: ConnectHandler) -> None:
+        '''Register handler called after every (re)connect, eg: to resync state'''
+        self.connect_handlers.append(handler)
+
+    async def close(self) -> None:
+        '''Stop reconnecting and close the current websocket'''
+        self._closing = True
+        self.connected.clear()
+        if self.websocket is not None:
+            await self.websocket.close()
+
+    async def quality_of_service(self, qos: int) -> ResponseFuture | None:
+        '''Change data rate; restored on every reconnect'''
+        self.qos = qos
+        if self.websocket is None or self.websocket.closed:
+            return None
+        return await self.websocket.quality_of_service(qos)
+
+    async def run(self) -> None:
+        '''Connect and keep reconnecting until closed; non-network errors propagate'''
+        attempt: int = 0
+        while not self._closing:
+            try:
+                websocket: ClientWebSocket = await self._connect()
+            except NETWORK_ERRORS as error:
+                log.warning("streamer connect failed: %r", error)
+                await asyncio.sleep(self._delay(attempt))
+                attempt += 1
+                continue
+            attempt = 0
+            try:
+                await self._watch(websocket)
+            finally:
+                self.connected.clear()
+                self.router.cancel_pending()
+                if not websocket.closed:
+                    await websocket.close()
+            assert websocket.receiver is not None
+            if websocket.receiver.done() and not websocket.receiver.cancelled():
+                failure: BaseException | None = websocket.receiver.exception()
+                if failure is not None:
+                    # -Network errors mean reconnect; anything else is a bug to surface
+                    if not isinstance(failure, NETWORK_ERRORS):
+                        raise failure
+                    log.warning("streamer receiver failed: %r", failure)
+            if not self._closing:
+                self.reconnects += 1
+                await asyncio.sleep(self._delay(attempt))
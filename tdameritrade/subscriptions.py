@@ -0,0 +1,199 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Streamer Subscriptions        ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import logging
+from collections.abc import Iterable
+from functools import partial
+
+from .fields import SCHEMAS
+from .typing import Request_WebSocketDict
+from .websocket import ClientWebSocket, ResponseFuture
+
+## Constants
+log: logging.Logger = logging.getLogger(__name__)
+SubscriptionState = tuple[set[str], frozenset[int]]
+
+
+## Classes
+class Subscription:
+    """Current + target symbol/field sets of a single streamer service"""
+
+    # -Constructor
+    def __init__(self, service: str, fields: Iterable[int] | None = None) -> None:
+        if fields is None:
+            fields = range(len(SCHEMAS[service].names)) if service in SCHEMAS else (0,)
+        self.service: str = service
+        self.symbols: set[str] = set()
+        self.fields: frozenset[int] = frozenset()
+        self.target_symbols: set[str] = set()
+        self.target_fields: frozenset[int] = frozenset(fields) | {0}
+
+    # -Instance Methods
+    def diff(self, websocket: ClientWebSocket) -> list[Request_WebSocketDict]:
+        '''Return smallest SUBS/UNSUBS/VIEW/ADD request list reaching target and commit it
+        (see rollback)'''
+        requests: list[Request_WebSocketDict] = []
+        fields: str = ','.join(str(field) for field in sorted(self.target_fields))
+        if not self.target_symbols:
+            if self.symbols:
+                requests.append(websocket.create_message(
+                    self.service, "UNSUBS", keys=','.join(sorted(self.symbols))
+                ))
+        elif not self.symbols:
+            requests.append(websocket.create_message(
+                self.service, "SUBS", keys=','.join(sorted(self.target_symbols)),
+                fields=fields
+            ))
+        else:
+            removed: set[str] = self.symbols - self.target_symbols
+            added: set[str] = self.target_symbols - self.symbols
+            if removed:
+                requests.append(websocket.create_message(
+                    self.service, "UNSUBS", keys=','.join(sorted(removed))
+                ))
+            if self.fields != self.target_fields:
+                requests.append(websocket.create_message(
+                    self.service, "VIEW", fields=fields
+                ))
+            if added:
+                requests.append(websocket.create_message(
+                    self.service, "ADD", keys=','.join(sorted(added)), fields=fields
+                ))
+        self.symbols = set(self.target_symbols)
+        self.fields = self.target_fields
+        return requests
+
+    def rollback(self, state: SubscriptionState) -> None:
+        '''Restore state from before a diff whose requests failed; the next diff resends'''
+        self.symbols, self.fields = state
+
+    def reset(self) -> None:
+        '''Forget server-side state so the next diff resends a full SUBS'''
+        self.symbols = set()
+        self.fields = frozenset()
+
+    # -Properties
+    @property
+    def dirty(self) -> bool:
+        return self.symbols != self.target_symbols or (
+            bool(self.target_symbols) and self.fields != self.target_fields
+        )
+
+
+class SubscriptionManager:
+    """Per-service subscriptions with coalesced, batched updates"""
+
+    # -Constructor
+    def __init__(self, websocket: ClientWebSocket | None = None, delay: float = 0.05) -> None:
+        self.websocket: ClientWebSocket | None = websocket
+        self.delay: float = delay
+        self.subscriptions: dict[str, Subscription] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._flusher: asyncio.Task[list[ResponseFuture]] | None = None
+
+    # -Instance Methods: Private
+    def _flush_later(self) -> None:
+        '''Coalesce changes made within delay into one frame'''
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.delay, self._on_timer)
+
+    def _acknowledged(
+        self, websocket: ClientWebSocket, subscription: Subscription,
+        state: SubscriptionState, future: ResponseFuture
+    ) -> None:
+        '''Roll back subscription whose request was rejected or never answered'''
+        if future.cancelled():
+            error: object = "cancelled"
+        elif future.exception() is not None:
+            error = future.exception()
+        elif future.result().get('content', {}).get('code', 0) != 0:
+            error = future.result()['content'].get('msg')
+        else:
+            return
+        log.warning("%s subscription update failed: %s", subscription.service, error)
+        # -A reconnect already resubscribes everything from scratch
+        if self.websocket is websocket:
+            subscription.rollback(state)
+
+    def _flushed(self, task: asyncio.Task[list[ResponseFuture]]) -> None:
+        '''Log failed background flush and retry it'''
+        if task.cancelled() or task.exception() is None:
+            return
+        log.warning("subscription flush failed", exc_info=task.exception())
+        self._flush_later()
+
+    def _on_timer(self) -> None:
+        '''Flush coalesced changes'''
+        self._timer = None
+        self._flusher = asyncio.create_task(self.flush())
+        self._flusher.add_done_callback(self._flushed)
+
+    # -Instance Methods: Public
+    def subscription(self, service: str) -> Subscription:
+        '''Return (creating if needed) the subscription of service'''
+        if service not in self.subscriptions:
+            self.subscriptions[service] = Subscription(service)
+        return self.subscriptions[service]
+
+    def add(self, service: str, symbols: Iterable[str]) -> None:
+        '''Add symbols to service subscription'''
+        self.subscription(service).target_symbols.update(symbols)
+        self._flush_later()
+
+    def remove(self, service: str, symbols: Iterable[str]) -> None:
+        '''Remove symbols from service subscription'''
+        self.subscription(service).target_symbols.difference_update(symbols)
+        self._flush_later()
+
+    def set(self, service: str, symbols: Iterable[str]) -> None:
+        '''Replace symbol set of service subscription'''
+        self.subscription(service).target_symbols = set(symbols)
+        self._flush_later()
+
+    def set_fields(self, service: str, fields: Iterable[int]) -> None:
+        '''Replace field set of service subscription'''
+        self.subscription(service).target_fields = frozenset(fields) | {0}
+        self._flush_later()
+
+    def resubscribe(self) -> None:
+        '''Mark every subscription for a full SUBS (eg: after reconnect)'''
+        for subscription in self.subscriptions.values():
+            subscription.reset()
+        self._flush_later()
+
+    async def flush(self) -> list[ResponseFuture]:
+        '''Send pending changes of every service as one requests frame'''
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        websocket: ClientWebSocket | None = self.websocket
+        if websocket is None or websocket.closed:
+            return []
+        requests: list[Request_WebSocketDict] = []
+        owners: list[tuple[Subscription, SubscriptionState]] = []
+        for subscription in self.subscriptions.values():
+            if subscription.dirty:
+                state: SubscriptionState = (subscription.symbols, subscription.fields)
+                diff: list[Request_WebSocketDict] = subscription.diff(websocket)
+                requests.extend(diff)
+                owners.extend([(subscription, state)] * len(diff))
+        if not requests:
+            return []
+        try:
+            futures: list[ResponseFuture] = await websocket.send_requests(requests)
+        except BaseException:
+            for subscription, state in owners:
+                subscription.rollback(state)
+            raise
+        for future, (subscription, state) in zip(futures, owners):
+            future.add_done_callback(
+                partial(self._acknowledged, websocket, subscription, state)
+            )
+        return futures
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Persistent Token Store        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  #type: ignore
+
+from .typing import TokenDict
+
+
+## Classes
+class TokenStore(ABC):
+    """Token persistence interface shared by every session of a key"""
+
+    # -Instance Methods
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        '''Forget tokens of key'''
+
+    @abstractmethod
+    def load(self, key: str) -> TokenDict | None:
+        '''Return stored tokens of key'''
+
+    @abstractmethod
+    def save(self, key: str, tokens: TokenDict) -> TokenDict:
+        '''Atomically merge tokens into stored ones of key (later expirations win);
+        return the tokens now stored'''
+
+
+class FileTokenStore(TokenStore):
+    """JSON file store; atomic replace + advisory lock for multi-process use"""
+
+    # -Constructor
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path: Path = Path(path)
+
+    # -Instance Methods: Private
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        '''Hold exclusive lock on the side lock file (no-op without fcntl)'''
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(self.path.name + ".lock"), 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with open(self.path, 'r') as file:
+                data: dict[str, Any] = json.load(file)
+                return data
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: dict[str, Any]) -> None:
+        temp: Path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp, 'w') as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp, 0o600)
+        os.replace(temp, self.path)
+
+    # -Instance Methods: Public
+    def delete(self, key: str) -> None:
+        with self._locked():
+            data: dict[str, Any] = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+    def load(self, key: str) -> TokenDict | None:
+        # -Readers never see a partial file (writes are atomic renames)
+        tokens: TokenDict | None = self._read().get(key)
+        return tokens
+
+    def save(self, key: str, tokens: TokenDict) -> TokenDict:
+        with self._locked():
+            data: dict[str, Any] = self._read()
+            merged: TokenDict = merge_tokens(data.get(key), tokens)
+            if merged != data.get(key):
+                data[key] = merged
+                self._write(data)
+        return merged
+
+
+class SQLiteTokenStore(TokenStore):
+    """SQLite store (WAL); database locking serializes writers across processes"""
+
+    # -Constructor
+    def __init__(self, path: str | os.PathLike[str], timeout: float = 30.0) -> None:
+        self.path: Path = Path(path)
+        self.timeout: float = timeout
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "key TEXT PRIMARY KEY, access_token TEXT NOT NULL, "
+                "access_expiration REAL NOT NULL, refresh_token TEXT, "
+                "refresh_expiration REAL)"
+            )
+
+    # -Instance Methods: Private
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection: sqlite3.Connection = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _select(self, connection: sqlite3.Connection, key: str) -> TokenDict | None:
+        row: tuple[Any, ...] | None = connection.execute(
+            "SELECT access_token, access_expiration, refresh_token, refresh_expiration "
+            "FROM tokens WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'access_token': row[0], 'access_expiration': row[1],
+            'refresh_token': row[2], 'refresh_expiration': row[3],
+        }
+
+    # -Instance Methods: Public
+    def delete(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM tokens WHERE key = ?", (key,))
+
+    def load(self, key: str) -> TokenDict | None:
+        with self._connect() as connection:
+            return self._select(connection, key)
+
+    def save(self, key: str, tokens: TokenDict) -> TokenDict:
+        with self._connect() as connection:
+            # -Take the write lock before reading so the compare + write is atomic
+            connection.execute("BEGIN IMMEDIATE")
+            stored: TokenDict | None = self._select(connection, key)
+            merged: TokenDict = merge_tokens(stored, tokens)
+            if merged != stored:
+                connection.execute(
+                    "INSERT INTO tokens VALUES (?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                    "access_token = excluded.access_token, "
+                    "access_expiration = excluded.access_expiration, "
+                    "refresh_token = excluded.refresh_token, "
+                    "refresh_expiration = excluded.refresh_expiration",
+                    (
+                        key, merged['access_token'], merged['access_expiration'],
+                        merged['refresh_token'], merged['refresh_expiration'],
+                    )
+                )
+        return merged
+
+
+## Functions
+def merge_tokens(stored: TokenDict | None, tokens: TokenDict) -> TokenDict:
+    """Combine stored + new tokens, keeping whichever access/refresh token expires later"""
+    if stored is None:
+        return tokens
+    merged: TokenDict = tokens.copy()
+    if stored['access_expiration'] > tokens['access_expiration']:
+        merged['access_token'] = stored['access_token']
+        merged['access_expiration'] = stored['access_expiration']
+    if stored['refresh_token'] is not None and (
+        stored['refresh_expiration'] or 0.0
+    ) > (tokens['refresh_expiration'] or 0.0):
+        merged['refresh_token'] = stored['refresh_token']
+        merged['refresh_expiration'] = stored['refresh_expiration']
+    return merged
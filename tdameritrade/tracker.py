@@ -0,0 +1,275 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Order Status Tracker          ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timedelta, timezone
+from inspect import isawaitable
+from typing import Any
+from xml.etree import ElementTree
+
+import aiohttp
+
+from . import codec
+from .models import AccountOrder
+from .session import ClientSession
+from .streamer import Streamer
+
+## Constants
+SERVICE: str = "ACCT_ACTIVITY"
+ACTIVITY_STATUSES: dict[str, str] = {
+    'OrderEntryRequest': "QUEUED",
+    'OrderRoute': "WORKING",
+    'OrderActivation': "WORKING",
+    'OrderPartialFill': "WORKING",
+    'OrderFill': "FILLED",
+    'OrderCancelRequest': "PENDING_CANCEL",
+    'OrderCancelReplaceRequest': "PENDING_REPLACE",
+    'UROUT': "CANCELED",
+    'OrderRejection': "REJECTED",
+}
+FINAL_STATUSES: frozenset[str] = frozenset({
+    "FILLED", "CANCELED", "REJECTED", "EXPIRED", "REPLACED",
+})
+OrderHandler = Callable[["TrackedOrder"], Awaitable[None] | None]
+
+
+## Classes
+class TrackedOrder:
+    """Latest known state of a single order"""
+
+    __slots__ = (
+        "order_id", "account_id", "status", "symbol", "quantity", "filled_quantity",
+        "entered", "updated",
+    )
+
+    # -Constructor
+    def __init__(self, order_id: int, account_id: int | None = None) -> None:
+        self.order_id: int = order_id
+        self.account_id: int | None = account_id
+        self.status: str | None = None
+        self.symbol: str | None = None
+        self.quantity: float | None = None
+        self.filled_quantity: float = 0.0
+        self.entered: datetime | None = None
+        self.updated: datetime | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"TrackedOrder({self.order_id}, {self.status!r}, {self.symbol!r})"
+
+    # -Properties
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+
+class OrderTracker:
+    """In-memory order book kept current by ACCT_ACTIVITY; REST only after gaps"""
+
+    # -Constructor
+    def __init__(
+        self, session: ClientSession, streamer: Streamer, *,
+        account_id: int | None = None, lookback: timedelta = timedelta(days=1)
+    ) -> None:
+        self.session: ClientSession = session
+        self.streamer: Streamer = streamer
+        self.account_id: int | None = account_id
+        self.lookback: timedelta = lookback
+        self.orders: dict[int, TrackedOrder] = {}
+        self.statuses: dict[str, set[int]] = {}
+        self.handlers: list[OrderHandler] = []
+        self.reconciles: int = 0
+        self._synced: datetime | None = None
+        self._waiters: dict[int, list[tuple[frozenset[str], asyncio.Future[TrackedOrder]]]] = {}
+        self._reconciler: asyncio.Task[None] | None = None
+
+    # -Instance Methods: Private
+    def _on_connect(self) -> None:
+        '''Activity may have been missed while disconnected; reconcile in background'''
+        if self._reconciler is None or self._reconciler.done():
+            self._reconciler = asyncio.create_task(self.reconcile())
+
+    async def _on_activity(self, entry: dict[str, Any]) -> None:
+        '''Apply ACCT_ACTIVITY content entries to the order book'''
+        for content in entry.get('content', ()):
+            status: str | None = ACTIVITY_STATUSES.get(content.get('2', ""))
+            if status is None:
+                continue
+            try:
+                message: dict[str, str] = parse_activity(content.get('3', ""))
+                entered: datetime | None = (
+                    datetime.fromisoformat(message['OrderEnteredDateTime'])
+                    if 'OrderEnteredDateTime' in message else None
+                )
+            except (ElementTree.ParseError, ValueError):
+                continue
+            if entered is not None and entered.tzinfo is None:
+                # -Feed times without an offset are UTC; reconcile compares aware datetimes
+                entered = entered.replace(tzinfo=timezone.utc)
+            order_key: str | None = message.get('OrderKey') or message.get('orderId')
+            if order_key is None:
+                continue
+            account: str | None = content.get('1') or message.get('AccountKey')
+            if account and self.account_id is not None and int(account) != self.account_id:
+                continue
+            order: TrackedOrder = self._order(int(order_key))
+            if account and order.account_id is None:
+                order.account_id = int(account)
+            order.symbol = message.get('Symbol', order.symbol)
+            if 'OriginalQuantity' in message:
+                order.quantity = float(message['OriginalQuantity'])
+            if content['2'] == "OrderPartialFill" and 'Quantity' in message:
+                order.filled_quantity += float(message['Quantity'])
+            elif status == "FILLED" and order.quantity is not None:
+                order.filled_quantity = order.quantity
+            if order.entered is None:
+                order.entered = entered
+            await self._update(order, status)
+
+    def _order(self, order_id: int) -> TrackedOrder:
+        '''Return (creating if needed) tracked order of id'''
+        order: TrackedOrder | None = self.orders.get(order_id)
+        if order is None:
+            order = self.orders[order_id] = TrackedOrder(order_id)
+        return order
+
+    async def _update(self, order: TrackedOrder, status: str) -> None:
+        '''Move order to status, wake waiters and call handlers'''
+        if order.status is not None:
+            self.statuses[order.status].discard(order.order_id)
+        order.status = status
+        order.updated = datetime.now(timezone.utc)
+        self.statuses.setdefault(status, set()).add(order.order_id)
+        for statuses, future in self._waiters.get(order.order_id, ()):
+            if status in statuses and not future.done():
+                future.set_result(order)
+        for handler in self.handlers:
+            result = handler(order)
+            if isawaitable(result):
+                await result
+
+    async def _apply(self, orders: Iterable[AccountOrder]) -> None:
+        '''Apply REST orders (including child strategies) to the order book'''
+        for rest in orders:
+            if rest.order_id is not None:
+                order: TrackedOrder = self._order(int(rest.order_id))
+                if order.done:
+                    # -Streamed final states are authoritative; snapshots may be stale
+                    if rest.child_orders:
+                        await self._apply(rest.child_orders)
+                    continue
+                order.account_id = rest.account_id
+                order.filled_quantity = rest.filled_quantity or 0.0
+                order.entered = rest.entered_time
+                legs: list[dict[str, Any]] | None = rest.legs
+                order.quantity = rest.quantity
+                if legs:
+                    order.symbol = legs[0].get('instrument', {}).get('symbol')
+                    if order.quantity is None:
+                        order.quantity = legs[0].get('quantity')
+                if rest.status is not None and rest.status != order.status:
+                    await self._update(order, rest.status)
+            if rest.child_orders:
+                await self._apply(rest.child_orders)
+
+    # -Instance Methods: Public
+    def add_handler(self, handler: OrderHandler) -> None:
+        '''Register handler called on every order status change'''
+        self.handlers.append(handler)
+
+    def get(self, order_id: int) -> TrackedOrder | None:
+        '''Return tracked order of id'''
+        return self.orders.get(order_id)
+
+    def with_status(self, *statuses: str) -> list[TrackedOrder]:
+        '''Return tracked orders currently in any of statuses'''
+        return [
+            self.orders[order_id]
+            for status in statuses for order_id in self.statuses.get(status, ())
+        ]
+
+    async def reconcile(self, status: str | None = None) -> None:
+        '''Resync order book with one filtered get_orders call'''
+        now: datetime = datetime.now(timezone.utc)
+        since: datetime = self._synced or now - self.lookback
+        for order in self.orders.values():
+            if not order.done and order.entered is not None and order.entered < since:
+                since = order.entered
+        response: aiohttp.ClientResponse = await self.session.get_orders(
+            account_id=self.account_id, from_date=since.date(), status=status
+        )
+        await self._apply(AccountOrder.from_list(await response.json(loads=codec.loads)))
+        self._synced = now
+        self.reconciles += 1
+
+    async def start(self) -> None:
+        '''Subscribe to account activity and load current orders (now, or on first connect)'''
+        response: aiohttp.ClientResponse = await self.session.get_streamer_keys(
+            [self.account_id] if self.account_id is not None else None
+        )
+        keys: dict[str, Any] = await response.json(loads=codec.loads)
+        self.streamer.router.add_data_handler(SERVICE, self._on_activity)
+        self.streamer.subscriptions.add(SERVICE, [key['key'] for key in keys['keys']])
+        self.streamer.subscriptions.set_fields(SERVICE, range(4))
+        self.streamer.add_connect_handler(self._on_connect)
+        # -Otherwise the first connect reconciles
+        if self.streamer.connected.is_set():
+            await self.reconcile()
+
+    async def wait_for(
+        self, order_id: int, statuses: Iterable[str] = FINAL_STATUSES,
+        timeout: float | None = None
+    ) -> TrackedOrder:
+        '''Wait until order reaches any of statuses (default: a final status)'''
+        wanted: frozenset[str] = frozenset(statuses)
+        order: TrackedOrder | None = self.orders.get(order_id)
+        if order is not None and order.status in wanted:
+            return order
+        future: asyncio.Future[TrackedOrder] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(order_id, []).append((wanted, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            waiters = self._waiters.get(order_id)
+            if waiters is not None:
+                waiters[:] = [waiter for waiter in waiters if waiter[1] is not future]
+                if not waiters:
+                    del self._waiters[order_id]
+
+    # -Properties
+    @property
+    def open_orders(self) -> list[TrackedOrder]:
+        return [order for order in self.orders.values() if not order.done]
+
+
+## Functions
+def parse_activity(message: str) -> dict[str, str]:
+    """Flatten XML (or JSON) activity message to first value per local tag name"""
+    fields: dict[str, str] = {}
+    if message.lstrip().startswith('{'):
+        stack: list[Any] = [codec.loads(message)]
+        while stack:
+            node: Any = stack.pop(0)
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+                    elif key not in fields and value is not None:
+                        fields[key] = str(value)
+            elif isinstance(node, list):
+                stack.extend(node)
+        return fields
+    for element in ElementTree.fromstring(message).iter():
+        tag: str = element.tag.rpartition('}')[2]
+        if tag not in fields and element.text and element.text.strip():
+            fields[tag] = element.text.strip()
+    return fields
@@ -54,3 +54,34 @@ class Response_AuthorizationDict(TypedDict):
     refresh_token_expires_in: int
     scope: str
     token_type: str
+
+
+class Response_WebSocketContentDict(TypedDict):
+    """WebSocket response content structure"""
+    code: int
+    msg: str
+
+
+class Response_WebSocketDataDict(TypedDict):
+    """WebSocket data/snapshot frame entry structure"""
+    command: str
+    content: list[dict[str, Any]]
+    service: str
+    timestamp: int
+
+
+class Response_WebSocketDict(TypedDict):
+    """WebSocket response frame entry structure"""
+    command: str
+    content: Response_WebSocketContentDict
+    requestid: str
+    service: str
+    timestamp: int
+
+
+class TokenDict(TypedDict):
+    """Persisted session token structure (expirations as POSIX timestamps)"""
+    access_expiration: float
+    access_token: str
+    refresh_expiration: float | None
+    refresh_token: str | None
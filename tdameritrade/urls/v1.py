@@ -26,7 +26,7 @@ def historicals(symbol: str) -> str:
 
 def instruments(cusip: str | None = None) -> str:
     """Instrumental data endpoints"""
-    return f"{version}/instruments" + ('' if cusip is None else f"/{cusip}")
+    return f"{version}instruments" + ('' if cusip is None else f"/{cusip}")
 
 
 def orders(account_id: int | None = None, order_id: int | None = None) -> str:
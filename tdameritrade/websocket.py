@@ -7,13 +7,21 @@
 ##-------------------------------##
 
 ## Imports
+import asyncio
+import time
+from collections.abc import Awaitable
 from datetime import datetime
 from typing import Any
 from urllib.parse import urlencode
 
 import aiohttp
 
-from .typing import Request_WebSocketDict
+from . import codec
+from .stream import StreamRouter
+from .typing import Request_WebSocketDict, Response_WebSocketDict
+
+## Constants
+ResponseFuture = asyncio.Future[Response_WebSocketDict]
 
 
 ## Classes
@@ -26,6 +34,10 @@ class ClientWebSocket(aiohttp.ClientWebSocketResponse):
         self.id: str = None  #type: ignore
         self.source: int = None  #type: ignore
         self.request_counter: int = 0
+        self.router: StreamRouter = StreamRouter()
+        self.receiver: asyncio.Task[None] | None = None
+        self.timeout: float | None = 10.0
+        self.last_received: float = 0.0
 
     # -Instance Methods: Public - Handle
     def create_message(
@@ -49,17 +61,79 @@ class ClientWebSocket(aiohttp.ClientWebSocketResponse):
         '''Send formatted message request or list of requests'''
         if not isinstance(requests, list):
             requests = [requests]
-        await self.send_json({'requests': requests})
- 
+        await self.send_json({'requests': requests}, dumps=codec.dumps)
+
+    async def send_requests(
+        self, requests: Request_WebSocketDict | list[Request_WebSocketDict],
+        timeout: float | None = None
+    ) -> list[ResponseFuture]:
+        '''Send request(s) and return futures resolved by their responses'''
+        if not isinstance(requests, list):
+            requests = [requests]
+        timeout = self.timeout if timeout is None else timeout
+        futures: list[ResponseFuture] = [
+            self.router.expect(request['requestid'], timeout) for request in requests
+        ]
+        try:
+            await self.send_messages(requests)
+        except BaseException:
+            for request in requests:
+                self.router.pending.pop(request['requestid'], None)
+            raise
+        return futures
+
+    # -Instance Methods: Public - Receive
+    async def receive_messages(self) -> None:
+        '''Receive frames into the router queue until the websocket closes; handler errors
+        raise here'''
+        router: StreamRouter = self.router
+        queue: asyncio.Queue[tuple[float, str | bytes]] = router.queue
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.last_received = loop.time()
+        dispatcher: asyncio.Task[None] = asyncio.create_task(router.drain())
+        try:
+            async for message in self:
+                self.last_received = loop.time()
+                if dispatcher.done():
+                    dispatcher.result()
+                if router.metrics is not None:
+                    router.metrics.set("tdameritrade_stream_queue_depth", queue.qsize())
+                    router.metrics.set("tdameritrade_stream_pending_requests", len(router.pending))
+                if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    # -Stamp arrival here so stream lag excludes time spent queued
+                    item: tuple[float, str | bytes] = (time.time(), message.data)
+                    if queue.full():
+                        # -Backpressure: stop reading until handlers catch up (or fail)
+                        await _first(queue.put(item), dispatcher)
+                    else:
+                        queue.put_nowait(item)
+                elif message.type == aiohttp.WSMsgType.ERROR:
+                    router.cancel_pending(self.exception())
+                    raise self.exception() or ConnectionError("websocket error")
+            await _first(queue.join(), dispatcher)
+        finally:
+            dispatcher.cancel()
+            # -Frames of a failed connection must not reach the next one
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+        router.cancel_pending()
+
+    def start_receiving(self) -> asyncio.Task[None]:
+        '''Start receive loop as background task'''
+        if self.receiver is None or self.receiver.done():
+            self.receiver = asyncio.create_task(self.receive_messages())
+        return self.receiver
+
     # -Instance Methods: Public - TDAmeritrade
     # --Admin
     async def login(
         self, id_: str, source_id: int, token: str,
         company: str, segment: str, domain: str, user_group: str, access_level: str,
         dt: datetime, acl: str, qos: int = 2
-    ) -> None:
+    ) -> ResponseFuture:
     # -TODO: MAKE 'qos'  ENUM -- Check quality_of_service method
-        '''Login request'''
+        '''Login request; returned future resolves with the LOGIN response'''
         self.id = id_
         self.source = source_id
         msg: Request_WebSocketDict = self.create_message(
@@ -78,16 +152,28 @@ class ClientWebSocket(aiohttp.ClientWebSocketResponse):
                 'userid': source_id,
             })
         )
-        await self.send_messages(msg)
+        return (await self.send_requests(msg))[0]
 
-    async def logout(self) -> None:
-        '''Logout request'''
+    async def logout(self) -> ResponseFuture:
+        '''Logout request; returned future resolves with the LOGOUT response'''
         msg: Request_WebSocketDict = self.create_message("ADMIN", "LOGOUT")
-        await self.send_messages(msg)
+        return (await self.send_requests(msg))[0]
 
-    async def quality_of_service(self, qos: int) -> None:
+    async def quality_of_service(self, qos: int) -> ResponseFuture:
     #-TODO: MAKE 'qos' ENUM -- EXPRESS=0, REALTIME=1, FAST=2, MODERATE=3, SLOW=4, DELAYED=5
     # EXPRESS=500ms, REALTIME=750ms, FAST=1000ms, MODERATE=1500ms, SLOW=3000ms, DELAYED=5000ms
-        '''Data rate speed change request'''
+        '''Data rate speed change request; returned future resolves with the QOS response'''
         msg: Request_WebSocketDict = self.create_message("ADMIN", "QOS", qoslevel=qos)
-        await self.send_messages(msg)
+        return (await self.send_requests(msg))[0]
+
+
+## Functions
+async def _first(awaitable: Awaitable[Any], dispatcher: asyncio.Task[None]) -> None:
+    """Await awaitable unless dispatcher fails first (its error is raised)"""
+    task: asyncio.Future[Any] = asyncio.ensure_future(awaitable)
+    try:
+        await asyncio.wait({task, dispatcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        task.cancel()
+    if dispatcher.done():
+        dispatcher.result()
@@ -0,0 +1,255 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Multi-Process Stream Fan-out  ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import struct
+import zlib
+from collections.abc import Callable
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from . import codec
+from .stream import StreamRouter
+from .typing import Response_WebSocketDataDict
+
+## Constants
+log: logging.Logger = logging.getLogger(__name__)
+HEADER: struct.Struct = struct.Struct("<QQQQ")  # -head, tail, frames in, frames out
+LENGTH: struct.Struct = struct.Struct("<I")
+WorkerSetup = Callable[[StreamRouter, int], None]
+
+
+## Classes
+class RingBuffer:
+    """Single-producer/single-consumer byte ring in shared memory"""
+
+    # -Constructor
+    def __init__(self, name: str | None = None, capacity: int = 1 << 22) -> None:
+        self.capacity: int = capacity
+        if name is None:
+            self.memory: SharedMemory = SharedMemory(create=True, size=HEADER.size + capacity)
+        else:
+            self.memory = SharedMemory(name)
+        assert self.memory.buf is not None
+        self.buffer: memoryview = self.memory.buf
+        if name is None:
+            HEADER.pack_into(self.buffer, 0, 0, 0, 0, 0)
+        self.stalls: int = 0
+
+    # -Instance Methods: Private
+    def _read(self, position: int, size: int) -> bytes:
+        start: int = HEADER.size + position % self.capacity
+        first: int = min(size, HEADER.size + self.capacity - start)
+        buffer: memoryview = self.buffer
+        if first == size:
+            return bytes(buffer[start:start + size])
+        return bytes(buffer[start:start + first]) + bytes(
+            buffer[HEADER.size:HEADER.size + size - first]
+        )
+
+    def _write(self, position: int, data: bytes) -> None:
+        start: int = HEADER.size + position % self.capacity
+        first: int = min(len(data), HEADER.size + self.capacity - start)
+        buffer: memoryview = self.buffer
+        buffer[start:start + first] = data[:first]
+        if first < len(data):
+            buffer[HEADER.size:HEADER.size + len(data) - first] = data[first:]
+
+    # -Instance Methods: Public
+    def close(self, unlink: bool = False) -> None:
+        '''Detach (and optionally destroy) shared memory'''
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+    def get(self) -> bytes | None:
+        '''Consumer: pop next frame, if any'''
+        head, tail, _, frames_out = HEADER.unpack_from(self.buffer, 0)
+        if head == tail:
+            return None
+        size: int = LENGTH.unpack(self._read(tail, LENGTH.size))[0]
+        data: bytes = self._read(tail + LENGTH.size, size)
+        # -Release space (tail) last so the producer never overwrites unread bytes
+        struct.pack_into("<Q", self.buffer, 24, frames_out + 1)
+        struct.pack_into("<Q", self.buffer, 8, tail + LENGTH.size + size)
+        return data
+
+    def put(self, data: bytes) -> bool:
+        '''Producer: push frame; False if the ring is full'''
+        size: int = LENGTH.size + len(data)
+        if size > self.capacity:
+            raise ValueError(f"frame of {len(data)} bytes exceeds ring capacity")
+        head, tail, frames_in, _ = HEADER.unpack_from(self.buffer, 0)
+        if self.capacity - (head - tail) < size:
+            self.stalls += 1
+            return False
+        self._write(head, LENGTH.pack(len(data)) + data)
+        # -Publish (head) last so the consumer never reads a partial frame
+        struct.pack_into("<Q", self.buffer, 16, frames_in + 1)
+        struct.pack_into("<Q", self.buffer, 0, head + size)
+        return True
+
+    # -Properties
+    @property
+    def backlog(self) -> int:
+        head, tail, _, _ = HEADER.unpack_from(self.buffer, 0)
+        return int(head - tail)
+
+    @property
+    def pending(self) -> int:
+        _, _, frames_in, frames_out = HEADER.unpack_from(self.buffer, 0)
+        return int(frames_in - frames_out)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+
+class WorkerPool:
+    """Worker processes decoding + handling frames read from per-shard rings"""
+
+    # -Constructor
+    def __init__(
+        self, setup: WorkerSetup, workers: int = 0, *, capacity: int = 1 << 22,
+        start_method: str | None = None
+    ) -> None:
+        self.setup: WorkerSetup = setup
+        self.workers: int = workers or multiprocessing.cpu_count()
+        self.capacity: int = capacity
+        self.context: Any = multiprocessing.get_context(start_method)
+        self.rings: list[RingBuffer] = []
+        self.processes: list[Any] = []
+        self.stop: Any = None
+        self._shards: dict[str, int] = {}
+
+    # -Dunder Methods
+    async def __aenter__(self) -> WorkerPool:
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    # -Instance Methods: Public
+    async def close(self, timeout: float = 10.0) -> None:
+        '''Let workers drain their rings, then stop them and free shared memory'''
+        if self.stop is not None:
+            self.stop.set()
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        for process in self.processes:
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                process.terminate()
+        for ring in self.rings:
+            ring.close(unlink=True)
+        self.rings.clear()
+        self.processes.clear()
+
+    def shard(self, key: str) -> int:
+        '''Return (cached, stable) worker index of symbol'''
+        index: int | None = self._shards.get(key)
+        if index is None:
+            index = self._shards[key] = zlib.crc32(key.encode()) % self.workers
+        return index
+
+    def start(self) -> None:
+        '''Create rings and spawn workers'''
+        self.stop = self.context.Event()
+        for index in range(self.workers):
+            ring: RingBuffer = RingBuffer(capacity=self.capacity)
+            process: Any = self.context.Process(
+                target=_worker, args=(ring.name, self.capacity, self.setup, index, self.stop),
+                name=f"tdameritrade-worker-{index}", daemon=True
+            )
+            process.start()
+            self.rings.append(ring)
+            self.processes.append(process)
+
+    def stats(self) -> list[dict[str, int]]:
+        '''Per-worker backpressure: queued frames/bytes + producer stalls'''
+        return [
+            {'pending': ring.pending, 'backlog': ring.backlog, 'stalls': ring.stalls}
+            for ring in self.rings
+        ]
+
+    async def submit(self, index: int, frame: bytes) -> None:
+        '''Push frame to worker, waiting (backpressure) while its ring is full; raise
+        RuntimeError if the worker exited and can no longer drain it'''
+        ring: RingBuffer = self.rings[index]
+        delay: float = 0.0001
+        while not ring.put(frame):
+            process: Any = self.processes[index]
+            if not process.is_alive():
+                raise RuntimeError(
+                    f"worker {index} exited (code {process.exitcode}) with a full ring"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.01)
+
+
+class ShardedRouter(StreamRouter):
+    """Router sending data/snapshot content to workers by symbol; responses stay local"""
+
+    # -Constructor
+    def __init__(self, pool: WorkerPool) -> None:
+        super().__init__()
+        self.pool: WorkerPool = pool
+
+    # -Instance Methods: Private
+    async def _route_data(
+        self, entries: list[Response_WebSocketDataDict], received: float | None = None
+    ) -> None:
+        '''Split entries by symbol shard and forward one frame per worker'''
+        shards: dict[int, list[dict[str, Any]]] = {}
+        for entry in entries:
+            parts: dict[int, list[dict[str, Any]]] = {}
+            for content in entry['content']:
+                parts.setdefault(self.pool.shard(content.get('key', "")), []).append(content)
+            for index, part in parts.items():
+                shards.setdefault(index, []).append({**entry, 'content': part})
+        for index, data in shards.items():
+            await self.pool.submit(index, codec.dumps({'data': data}).encode())
+
+
+## Functions
+def _worker(
+    name: str, capacity: int, setup: WorkerSetup, index: int, stop: Any
+) -> None:
+    """Worker process entry point"""
+    ring: RingBuffer = RingBuffer(name, capacity)
+    router: StreamRouter = StreamRouter()
+    setup(router, index)
+    try:
+        asyncio.run(_consume(ring, router, stop))
+    finally:
+        ring.close()
+
+
+async def _consume(ring: RingBuffer, router: StreamRouter, stop: Any) -> None:
+    """Dispatch frames from ring until stopped and drained; handler errors skip the frame"""
+    idle: int = 0
+    while True:
+        # -Read stop before the ring: frames put before stop was set are then always drained
+        stopping: bool = stop.is_set()
+        frame: bytes | None = ring.get()
+        if frame is None:
+            if stopping:
+                return
+            idle += 1
+            await asyncio.sleep(0 if idle < 64 else 0.0005)
+            continue
+        idle = 0
+        try:
+            await router.dispatch_raw(frame)
+        except Exception:
+            log.exception("worker failed to handle frame")
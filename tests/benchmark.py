@@ -0,0 +1,175 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Offline Benchmark Suite       ##
+##-------------------------------##
+## usage: python -m tests.benchmark [--requests N] [--symbols N] ...
+
+## Imports
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from tdameritrade import codec
+from tdameritrade.fields import ColumnBatch
+from tdameritrade.profile import Profile
+from tdameritrade.session import ClientSession
+from tdameritrade.stream import StreamRouter
+from tdameritrade.subscriptions import SubscriptionManager
+from tdameritrade.websocket import ClientWebSocket
+
+from .mock import MockServer, create_session
+from .test_imports import bench_import
+
+
+## Functions
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Return nearest-rank percentile of samples"""
+    ordered: list[float] = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def synthetic_frame(service: str, symbols: Sequence[str]) -> str:
+    """Build a raw QUOTE-style data frame for symbols"""
+    now: int = int(time.time() * 1000)
+    return codec.dumps({'data': [{
+        'service': service, 'timestamp': now, 'command': "SUBS",
+        'content': [{
+            'key': symbol, '1': 100.0 + i, '2': 100.01 + i, '3': 100.0 + i,
+            '4': 100, '5': 200, '8': 1000 + i, '9': 10, '50': now, '51': now,
+        } for i, symbol in enumerate(symbols)],
+    }]})
+
+
+async def bench_rest(
+    server: MockServer, requests: int, concurrency: int
+) -> dict[str, float]:
+    """REST requests/sec + latency percentiles"""
+    latencies: list[float] = []
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+    session: ClientSession = await create_session(server)
+    calls: list[Callable[[], Awaitable[Any]]] = [
+        lambda: session.get_quotes(["AAPL", "MSFT", "SPY"]),
+        lambda: session.get_account(account_id=1, positions=True),
+    ]
+
+    async def run(i: int) -> None:
+        async with semaphore:
+            start: float = time.perf_counter()
+            await calls[i % len(calls)]()
+            latencies.append(time.perf_counter() - start)
+
+    try:
+        start: float = time.perf_counter()
+        await asyncio.gather(*(run(i) for i in range(requests)))
+        elapsed: float = time.perf_counter() - start
+    finally:
+        await session.close()
+    return {
+        'rest_requests_per_sec': requests / elapsed,
+        'rest_p50_ms': percentile(latencies, 0.50) * 1000,
+        'rest_p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def bench_decode(symbols: int, frames: int) -> dict[str, float]:
+    """Offline streamer frame decode + dispatch throughput"""
+    router: StreamRouter = StreamRouter()
+    ticks: list[int] = [0]
+
+    def handler(batch: ColumnBatch) -> None:
+        ticks[0] += len(batch)
+
+    router.add_data_handler("QUOTE", handler)
+    raw: str = synthetic_frame("QUOTE", [f"S{i}" for i in range(symbols)])
+    start: float = time.perf_counter()
+    for _ in range(frames):
+        await router.dispatch_raw(raw)
+    elapsed: float = time.perf_counter() - start
+    return {
+        'decode_frames_per_sec': frames / elapsed,
+        'decode_ticks_per_sec': ticks[0] / elapsed,
+    }
+
+
+async def bench_stream(server: MockServer, symbols: int, seconds: float) -> dict[str, float]:
+    """End-to-end streamer ticks/sec through the mock websocket"""
+    ticks: list[int] = [0]
+
+    def handler(batch: ColumnBatch) -> None:
+        ticks[0] += len(batch)
+
+    session: ClientSession = await create_session(server)
+    try:
+        profile: Profile = Profile(session)
+        profile.streamer_scheme = "ws"
+        websocket: ClientWebSocket = await profile.create_websocket()
+        websocket.router.add_data_handler("QUOTE", handler)
+        manager: SubscriptionManager = SubscriptionManager(websocket)
+        manager.add("QUOTE", [f"S{i}" for i in range(symbols)])
+        await asyncio.gather(*await manager.flush())
+        start: float = time.perf_counter()
+        await asyncio.sleep(seconds)
+        elapsed: float = time.perf_counter() - start
+        await websocket.close()
+    finally:
+        await session.close()
+    return {'stream_ticks_per_sec': ticks[0] / elapsed}
+
+
+async def bench_memory(symbols: int) -> dict[str, float]:
+    """Bytes of client-side state per subscribed symbol"""
+    names: list[str] = [f"S{i}" for i in range(symbols)]
+    raw: str = synthetic_frame("QUOTE", names)
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    router: StreamRouter = StreamRouter()
+    router.add_data_handler("QUOTE", lambda batch: None)
+    manager: SubscriptionManager = SubscriptionManager()
+    manager.subscription("QUOTE").target_symbols.update(names)
+    await router.dispatch_raw(raw)
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {'memory_bytes_per_symbol': (after - before) / symbols}
+
+
+async def run(args: argparse.Namespace) -> dict[str, float]:
+    """Run every benchmark against a fresh mock server"""
+    results: dict[str, float] = {}
+    async with MockServer(tick_rate=args.tick_rate) as server:
+        results.update(await bench_rest(server, args.requests, args.concurrency))
+        results.update(await bench_stream(server, args.symbols, args.seconds))
+    results.update(await bench_decode(args.symbols, args.frames))
+    results.update(await bench_memory(args.symbols))
+    results.update(await bench_import(args.import_runs))
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command line entry point"""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark",
+        description="Offline REST + streamer benchmarks against the mock TD server"
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--symbols", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--tick-rate", type=float, default=50.0)
+    parser.add_argument("--import-runs", type=int, default=5)
+    results: dict[str, float] = asyncio.run(run(parser.parse_args(argv)))
+    width: int = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,561 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Offline Mock TD Server        ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import random
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import count, cycle
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+from tdameritrade import codec
+from tdameritrade.fields import SCHEMAS
+from tdameritrade.session import EXCHANGE_TIMEZONE, ClientSession
+
+## Constants
+ACCOUNT_ID: int = 123456789
+FORMAT_TIMESTAMP: str = "%Y-%m-%dT%H:%M:%S+0000"
+
+
+## Classes
+class MockServer:
+    """Local stand-in for the TD REST API, OAuth endpoint and streamer"""
+
+    # -Constructor
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 0, *,
+        tick_rate: float = 100.0, frames: Iterable[str | bytes] | None = None,
+        latency: float = 0.0, heartbeat: float = 10.0
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.tick_rate: float = tick_rate
+        self.frames: list[str | bytes] | None = None if frames is None else list(frames)
+        self.latency: float = latency
+        self.heartbeat: float = heartbeat
+        self.requests: int = 0
+        self.grants: list[str] = []
+        self.access_tokens: set[str] = set()
+        self.accept_tokens: bool = True
+        self.unauthorized: int = 0
+        self.orders: dict[int, dict[str, Any]] = {}
+        self.watchlists: dict[int, dict[str, Any]] = {}
+        self.watchlist_writes: list[str] = []
+        self._ids: count[int] = count(1000)
+        self._prices: dict[str, float] = {}
+        self._sockets: dict[web.WebSocketResponse, dict[str, set[str]]] = {}
+        self._runner: web.AppRunner | None = None
+        self.app: web.Application = self._create_app()
+
+    # -Dunder Methods
+    async def __aenter__(self) -> "MockServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    # -Instance Methods: Private
+    def _create_app(self) -> web.Application:
+        '''Build route table mirroring urls.v1'''
+        app: web.Application = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/v1/oauth2/token", self._oauth2)
+        app.router.add_get("/v1/accounts", self._accounts)
+        app.router.add_get("/v1/accounts/{account_id}", self._account)
+        app.router.add_get("/v1/orders", self._orders)
+        app.router.add_get("/v1/accounts/{account_id}/orders", self._orders)
+        app.router.add_post("/v1/accounts/{account_id}/orders", self._create_order)
+        app.router.add_get("/v1/accounts/{account_id}/orders/{order_id}", self._order)
+        app.router.add_put("/v1/accounts/{account_id}/orders/{order_id}", self._replace_order)
+        app.router.add_delete("/v1/accounts/{account_id}/orders/{order_id}", self._delete_order)
+        app.router.add_get("/v1/accounts/{account_id}/savedorders", self._empty_list)
+        app.router.add_get("/v1/accounts/{account_id}/transactions", self._transactions)
+        app.router.add_get("/v1/accounts/{account_id}/preferences", self._preferences)
+        app.router.add_get("/v1/accounts/watchlists", self._watchlists)
+        app.router.add_get("/v1/accounts/{account_id}/watchlists", self._watchlists)
+        app.router.add_post("/v1/accounts/{account_id}/watchlists", self._create_watchlist)
+        app.router.add_get("/v1/accounts/{account_id}/watchlists/{watchlist_id}", self._watchlist)
+        app.router.add_put("/v1/accounts/{account_id}/watchlists/{watchlist_id}", self._put_watchlist)
+        app.router.add_patch("/v1/accounts/{account_id}/watchlists/{watchlist_id}", self._put_watchlist)
+        app.router.add_delete("/v1/accounts/{account_id}/watchlists/{watchlist_id}", self._delete_watchlist)
+        app.router.add_get("/v1/marketdata/quotes", self._quotes)
+        app.router.add_get("/v1/marketdata/chains", self._chains)
+        app.router.add_get("/v1/marketdata/hours", self._hours)
+        app.router.add_get("/v1/marketdata/{market}/hours", self._hours)
+        app.router.add_get("/v1/marketdata/{symbol}/quotes", self._quotes)
+        app.router.add_get("/v1/marketdata/{symbol}/pricehistory", self._price_history)
+        app.router.add_get("/v1/marketdata/{index}/movers", self._movers)
+        app.router.add_get("/v1/instruments", self._instruments)
+        app.router.add_get("/v1/instruments/{cusip}", self._instruments)
+        app.router.add_get("/v1/userprincipals", self._user_principals)
+        app.router.add_get("/v1/userprincipals/streamersubscriptionkeys", self._streamer_keys)
+        app.router.add_get("/ws", self._websocket)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        '''Count requests, reject unknown access tokens and add artificial latency'''
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        authorization: str | None = request.headers.get('Authorization')
+        if authorization is not None and (
+            not self.accept_tokens
+            or authorization.removeprefix("Bearer ") not in self.access_tokens
+        ):
+            self.unauthorized += 1
+            raise web.HTTPUnauthorized()
+        response: web.StreamResponse = await handler(request)
+        return response
+
+    def _price(self, symbol: str) -> float:
+        '''Random walk price of symbol'''
+        price: float = self._prices.get(symbol) or random.uniform(10.0, 500.0)
+        price = round(max(0.01, price * (1.0 + random.gauss(0.0, 0.0005))), 2)
+        self._prices[symbol] = price
+        return price
+
+    def _quote(self, symbol: str) -> dict[str, Any]:
+        '''Synthetic REST quote'''
+        price: float = self._price(symbol)
+        now: int = int(time.time() * 1000)
+        return {
+            'symbol': symbol, 'assetType': "EQUITY", 'description': f"{symbol} Mock",
+            'bidPrice': round(price - 0.01, 2), 'bidSize': 100,
+            'askPrice': round(price + 0.01, 2), 'askSize': 100,
+            'lastPrice': price, 'lastSize': 10, 'mark': price,
+            'openPrice': price, 'highPrice': price, 'lowPrice': price, 'closePrice': price,
+            'netChange': 0.0, 'totalVolume': random.randint(0, 10 ** 7),
+            'quoteTimeInLong': now, 'tradeTimeInLong': now,
+        }
+
+    def _streamer_content(self, service: str, symbol: str) -> dict[str, Any]:
+        '''Synthetic streamer content entry'''
+        price: float = self._price(symbol)
+        now: int = int(time.time() * 1000)
+        if service.startswith("TIMESALE"):
+            return {'key': symbol, '1': now, '2': price, '3': 100.0, '4': next(self._ids)}
+        if service.startswith("CHART"):
+            return {
+                'key': symbol, '1': price, '2': price, '3': price, '4': price,
+                '5': 1000.0, '6': next(self._ids), '7': now, '8': now // 86400000,
+            }
+        return {
+            'key': symbol, '1': round(price - 0.01, 2), '2': round(price + 0.01, 2),
+            '3': price, '4': 100, '5': 100, '8': random.randint(0, 10 ** 7), '9': 10,
+            '50': now, '51': now,
+        }
+
+    async def _activity(self, message_type: str, order: dict[str, Any], **extra: Any) -> None:
+        '''Push ACCT_ACTIVITY message of order to subscribed websockets'''
+        legs: list[dict[str, Any]] = order.get('orderLegCollection') or [{}]
+        fields: str = ''.join(f"<{name}>{value}</{name}>" for name, value in extra.items())
+        message: str = (
+            f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<{message_type}Message xmlns="urn:xmlns:beb.ameritrade.com">'
+            f'<OrderGroupID><AccountKey>{order["accountId"]}</AccountKey></OrderGroupID>'
+            f'<Order><OrderKey>{order["orderId"]}</OrderKey>'
+            f'<Security><Symbol>{legs[0].get("instrument", {}).get("symbol", "")}</Symbol></Security>'
+            f'<OriginalQuantity>{legs[0].get("quantity", 0)}</OriginalQuantity>'
+            f'<OrderEnteredDateTime>{order["enteredTime"]}</OrderEnteredDateTime>'
+            f'</Order>{fields}</{message_type}Message>'
+        )
+        frame: str = codec.dumps({'data': [{
+            'service': "ACCT_ACTIVITY", 'timestamp': int(time.time() * 1000), 'command': "SUBS",
+            'content': [{'key': "mock-key", '1': str(order['accountId']), '2': message_type, '3': message}],
+        }]})
+        for websocket, subscriptions in list(self._sockets.items()):
+            if subscriptions.get("ACCT_ACTIVITY") and not websocket.closed:
+                await websocket.send_str(frame)
+
+    # --REST
+    async def _oauth2(self, request: web.Request) -> web.Response:
+        data: Any = await request.post()
+        self.grants.append(data.get('grant_type'))
+        access_token: str = f"mock-access-{next(self._ids)}"
+        self.access_tokens.add(access_token)
+        body: dict[str, Any] = {
+            'access_token': access_token, 'expires_in': 1800,
+            'scope': "PlaceTrades AccountAccess MoveMoney", 'token_type': "Bearer",
+        }
+        if data.get('access_type') == "offline":
+            body['refresh_token'] = f"mock-refresh-{next(self._ids)}"
+            body['refresh_token_expires_in'] = 7776000
+        return web.json_response(body, dumps=codec.dumps)
+
+    def _securities_account(self, account_id: int) -> dict[str, Any]:
+        return {'securitiesAccount': {
+            'type': "MARGIN", 'accountId': str(account_id), 'roundTrips': 0,
+            'isDayTrader': False, 'currentBalances': {'cashBalance': 100000.0},
+            'positions': [{
+                'longQuantity': 10.0, 'shortQuantity': 0.0, 'averagePrice': 100.0,
+                'marketValue': 1000.0, 'instrument': {'assetType': "EQUITY", 'symbol': "MOCK"},
+            }],
+            'orderStrategies': list(self.orders.values()),
+        }}
+
+    async def _accounts(self, request: web.Request) -> web.Response:
+        return web.json_response([self._securities_account(ACCOUNT_ID)], dumps=codec.dumps)
+
+    async def _account(self, request: web.Request) -> web.Response:
+        account_id: int = int(request.match_info['account_id'])
+        return web.json_response(self._securities_account(account_id), dumps=codec.dumps)
+
+    async def _orders(self, request: web.Request) -> web.Response:
+        status: str | None = request.query.get('status')
+        first: str = request.query.get('fromEnteredTime', "")
+        last: str = request.query.get('toEnteredTime', "9999-12-31")
+        orders: list[dict[str, Any]] = [
+            order for order in self.orders.values()
+            if (status is None or order['status'] == status)
+            and first <= order['enteredTime'][:10] <= last
+        ]
+        return web.json_response(orders, dumps=codec.dumps)
+
+    async def _order(self, request: web.Request) -> web.Response:
+        order: dict[str, Any] | None = self.orders.get(int(request.match_info['order_id']))
+        if order is None:
+            raise web.HTTPNotFound()
+        return web.json_response(order, dumps=codec.dumps)
+
+    async def _create_order(self, request: web.Request) -> web.Response:
+        order: dict[str, Any] = await request.json(loads=codec.loads)
+        order_id: int = next(self._ids)
+        order.update({
+            'orderId': order_id, 'accountId': int(request.match_info['account_id']),
+            'status': "WORKING", 'filledQuantity': 0.0,
+            'enteredTime': datetime.now(timezone.utc).strftime(FORMAT_TIMESTAMP),
+        })
+        self.orders[order_id] = order
+        await self._activity("OrderEntryRequest", order)
+        return web.Response(status=201, headers={
+            'Location': f"{request.url.origin()}{request.path}/{order_id}"
+        })
+
+    async def _replace_order(self, request: web.Request) -> web.Response:
+        old: dict[str, Any] | None = self.orders.get(int(request.match_info['order_id']))
+        if old is None:
+            raise web.HTTPNotFound()
+        old['status'] = "REPLACED"
+        return await self._create_order(request)
+
+    async def _delete_order(self, request: web.Request) -> web.Response:
+        order: dict[str, Any] | None = self.orders.get(int(request.match_info['order_id']))
+        if order is None:
+            raise web.HTTPNotFound()
+        order['status'] = "CANCELED"
+        await self._activity("UROUT", order)
+        return web.Response()
+
+    async def _empty_list(self, request: web.Request) -> web.Response:
+        return web.json_response([])
+
+    async def _transactions(self, request: web.Request) -> web.Response:
+        start: datetime = datetime.strptime(
+            request.query.get('startDate', "2020-01-01"), "%Y-%m-%d"
+        ).replace(tzinfo=timezone.utc)
+        end: datetime = datetime.strptime(
+            request.query.get('endDate', datetime.now(timezone.utc).strftime("%Y-%m-%d")),
+            "%Y-%m-%d"
+        ).replace(tzinfo=timezone.utc)
+        transactions: list[dict[str, Any]] = []
+        day: datetime = start
+        while day <= end:
+            transactions.append({
+                'transactionId': int(day.timestamp()) // 86400, 'type': "TRADE",
+                'transactionDate': day.strftime(FORMAT_TIMESTAMP), 'netAmount': -100.0,
+            })
+            day += timedelta(days=1)
+        return web.json_response(transactions, dumps=codec.dumps)
+
+    async def _preferences(self, request: web.Request) -> web.Response:
+        return web.json_response({'expressTrading': False, 'defaultEquityOrderType': "LIMIT"})
+
+    async def _watchlists(self, request: web.Request) -> web.Response:
+        return web.json_response(list(self.watchlists.values()), dumps=codec.dumps)
+
+    async def _watchlist(self, request: web.Request) -> web.Response:
+        watchlist: dict[str, Any] | None = self.watchlists.get(
+            int(request.match_info['watchlist_id'])
+        )
+        if watchlist is None:
+            raise web.HTTPNotFound()
+        return web.json_response(watchlist, dumps=codec.dumps)
+
+    async def _create_watchlist(self, request: web.Request) -> web.Response:
+        watchlist: dict[str, Any] = await request.json(loads=codec.loads)
+        watchlist_id: int = next(self._ids)
+        watchlist.update({
+            'watchlistId': str(watchlist_id), 'accountId': request.match_info['account_id']
+        })
+        self.watchlists[watchlist_id] = watchlist
+        return web.Response(status=201, headers={
+            'Location': f"{request.url.origin()}{request.path}/{watchlist_id}"
+        })
+
+    async def _put_watchlist(self, request: web.Request) -> web.Response:
+        watchlist_id: int = int(request.match_info['watchlist_id'])
+        if watchlist_id not in self.watchlists:
+            raise web.HTTPNotFound()
+        update: dict[str, Any] = await request.json(loads=codec.loads)
+        self.watchlist_writes.append(request.method)
+        watchlist: dict[str, Any] = self.watchlists[watchlist_id]
+        if request.method == "PUT":
+            watchlist['watchlistItems'] = update.get('watchlistItems', [])
+        else:
+            items: list[dict[str, Any]] = watchlist.setdefault('watchlistItems', [])
+            items.extend(update.get('watchlistItems', []))
+        if 'name' in update:
+            watchlist['name'] = update['name']
+        return web.Response(status=204)
+
+    async def _delete_watchlist(self, request: web.Request) -> web.Response:
+        if self.watchlists.pop(int(request.match_info['watchlist_id']), None) is None:
+            raise web.HTTPNotFound()
+        return web.Response(status=204)
+
+    async def _quotes(self, request: web.Request) -> web.Response:
+        symbols: list[str] = (
+            [request.match_info['symbol']] if 'symbol' in request.match_info
+            else request.query.get('symbol', "").split(',')
+        )
+        return web.json_response(
+            {symbol: self._quote(symbol) for symbol in symbols if symbol}, dumps=codec.dumps
+        )
+
+    async def _chains(self, request: web.Request) -> web.Response:
+        symbol: str = request.query.get('symbol', "MOCK")
+        underlying: float = self._price(symbol)
+        expirations: list[str] = [
+            (datetime.now(timezone.utc).date() + timedelta(days=7 * i)).isoformat() + f":{7 * i}"
+            for i in range(1, 5)
+        ]
+        strikes: list[float] = [round(underlying * (0.9 + 0.02 * i), 1) for i in range(11)]
+
+        def side(put_call: str) -> dict[str, Any]:
+            return {expiration: {str(strike): [{
+                'putCall': put_call, 'symbol': f"{symbol}_{expiration[:10]}{put_call[0]}{strike}",
+                'bid': 1.0, 'ask': 1.1, 'last': 1.05, 'mark': 1.05, 'totalVolume': 10,
+                'openInterest': 100, 'volatility': 25.0, 'delta': 0.5, 'gamma': 0.05,
+                'theta': -0.02, 'vega': 0.1, 'rho': 0.01, 'strikePrice': strike,
+                'expirationDate': 0, 'daysToExpiration': int(expiration.split(':')[1]),
+            }] for strike in strikes} for expiration in expirations}
+
+        return web.json_response({
+            'symbol': symbol, 'status': "SUCCESS", 'underlyingPrice': underlying,
+            'callExpDateMap': side("CALL"), 'putExpDateMap': side("PUT"),
+        }, dumps=codec.dumps)
+
+    async def _hours(self, request: web.Request) -> web.Response:
+        markets: list[str] = (
+            [request.match_info['market']] if 'market' in request.match_info
+            else request.query.get('markets', "EQUITY").split(',')
+        )
+        day: str = request.query.get('date', datetime.now(timezone.utc).date().isoformat())
+        hours: dict[str, Any] = {}
+        for market in markets:
+            hours[market.lower()] = {market[:3]: {
+                'date': day, 'marketType': market, 'product': market[:3], 'isOpen': True,
+                'sessionHours': {
+                    'preMarket': [{'start': f"{day}T07:00:00-05:00", 'end': f"{day}T09:30:00-05:00"}],
+                    'regularMarket': [{'start': f"{day}T09:30:00-05:00", 'end': f"{day}T16:00:00-05:00"}],
+                    'postMarket': [{'start': f"{day}T16:00:00-05:00", 'end': f"{day}T20:00:00-05:00"}],
+                },
+            }}
+        return web.json_response(hours, dumps=codec.dumps)
+
+    async def _price_history(self, request: web.Request) -> web.Response:
+        symbol: str = request.match_info['symbol']
+        frequency: int = int(request.query.get('frequency', 1))
+        now: int = int(time.time() * 1000)
+        start: int = int(request.query.get('startDate', now - 86400000))
+        end: int = min(int(request.query.get('endDate', now)), now)
+        step: int = 60000 * frequency
+        candles: list[dict[str, Any]] = []
+        for timestamp in range(start - start % step, end, step):
+            # -Exchanges are closed on weekends
+            if datetime.fromtimestamp(timestamp / 1000, EXCHANGE_TIMEZONE).weekday() >= 5:
+                continue
+            price: float = self._price(symbol)
+            candles.append({
+                'open': price, 'high': price, 'low': price, 'close': price,
+                'volume': 100, 'datetime': timestamp,
+            })
+        return web.json_response(
+            {'candles': candles, 'symbol': symbol, 'empty': not candles}, dumps=codec.dumps
+        )
+
+    async def _movers(self, request: web.Request) -> web.Response:
+        return web.json_response([{
+            'symbol': f"MV{i}", 'change': random.uniform(-5, 5), 'direction': "up",
+            'last': self._price(f"MV{i}"), 'totalVolume': random.randint(0, 10 ** 7),
+        } for i in range(10)], dumps=codec.dumps)
+
+    async def _instruments(self, request: web.Request) -> web.Response:
+        symbol: str = request.match_info.get('cusip') or request.query.get('symbol', "MOCK")
+
+        def instrument(name: str) -> dict[str, Any]:
+            return {
+                'cusip': f"{zlib.crc32(name.encode()) % 10 ** 9:09d}", 'symbol': name,
+                'description': f"{name} Mock", 'exchange': "NASDAQ", 'assetType': "EQUITY",
+            }
+
+        if 'cusip' in request.match_info:
+            return web.json_response([instrument(symbol)], dumps=codec.dumps)
+        return web.json_response({
+            name: instrument(name) for name in symbol.split(',') if name
+        }, dumps=codec.dumps)
+
+    async def _user_principals(self, request: web.Request) -> web.Response:
+        now: datetime = datetime.now(timezone.utc)
+        return web.json_response({
+            'userId': "mock", 'primaryAccountId': str(ACCOUNT_ID),
+            'tokenExpirationTime': (now + timedelta(days=1)).strftime(FORMAT_TIMESTAMP),
+            'streamerInfo': {
+                'streamerSocketUrl': f"{self.host}:{self.port}", 'token': "mock-token",
+                'tokenTimestamp': now.strftime(FORMAT_TIMESTAMP), 'userGroup': "ACCT",
+                'accessLevel': "ACCT", 'acl': "AK", 'appId': "mock",
+            },
+            'streamerSubscriptionKeys': {'keys': [{'key': "mock-key"}]},
+            'accounts': [{
+                'accountId': str(ACCOUNT_ID), 'company': "AMER", 'segment': "AMER",
+                'accountCdDomainId': "A000000000000000",
+            }],
+        }, dumps=codec.dumps)
+
+    async def _streamer_keys(self, request: web.Request) -> web.Response:
+        return web.json_response({'keys': [{'key': "mock-key"}]})
+
+    # --Streamer
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        websocket: web.WebSocketResponse = web.WebSocketResponse()
+        await websocket.prepare(request)
+        subscriptions: dict[str, set[str]] = self._sockets.setdefault(websocket, {})
+        tasks: list[asyncio.Task[None]] = [
+            asyncio.create_task(self._stream(websocket, subscriptions)),
+            asyncio.create_task(self._heartbeat(websocket)),
+        ]
+        try:
+            async for message in websocket:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                responses: list[dict[str, Any]] = [
+                    self._command(request_, subscriptions)
+                    for request_ in codec.loads(message.data).get('requests', ())
+                ]
+                await websocket.send_str(codec.dumps({'response': responses}))
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._sockets.pop(websocket, None)
+        return websocket
+
+    def _command(
+        self, request: dict[str, Any], subscriptions: dict[str, set[str]]
+    ) -> dict[str, Any]:
+        '''Apply streamer command and build its response entry'''
+        service: str = request['service']
+        command: str = request['command']
+        keys: list[str] = [
+            key for key in request.get('parameters', {}).get('keys', "").split(',') if key
+        ]
+        if command == "SUBS":
+            subscriptions[service] = set(keys)
+        elif command == "ADD":
+            subscriptions.setdefault(service, set()).update(keys)
+        elif command == "UNSUBS":
+            subscriptions.setdefault(service, set()).difference_update(keys)
+        return {
+            'service': service, 'requestid': str(request['requestid']), 'command': command,
+            'timestamp': int(time.time() * 1000),
+            'content': {'code': 0, 'msg': f"{command} command succeeded"},
+        }
+
+    async def _heartbeat(self, websocket: web.WebSocketResponse) -> None:
+        while not websocket.closed:
+            await asyncio.sleep(self.heartbeat)
+            await websocket.send_str(codec.dumps(
+                {'notify': [{'heartbeat': str(int(time.time() * 1000))}]}
+            ))
+
+    async def _stream(
+        self, websocket: web.WebSocketResponse, subscriptions: dict[str, set[str]]
+    ) -> None:
+        '''Send recorded frames, or synthetic ticks for subscribed symbols'''
+        interval: float = 1.0 / self.tick_rate
+        frames: Iterator[str | bytes] | None = None if self.frames is None else cycle(self.frames)
+        deadline: float = time.monotonic()
+        while not websocket.closed:
+            if frames is not None:
+                frame: str | bytes = next(frames)
+                await (websocket.send_bytes(frame) if isinstance(frame, bytes)
+                       else websocket.send_str(frame))
+            else:
+                data: list[dict[str, Any]] = [{
+                    'service': service, 'timestamp': int(time.time() * 1000),
+                    'command': "SUBS",
+                    'content': [self._streamer_content(service, symbol) for symbol in symbols],
+                } for service, symbols in subscriptions.items() if symbols and service in SCHEMAS]
+                if data:
+                    await websocket.send_str(codec.dumps({'data': data}))
+            deadline += interval
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+
+    # -Instance Methods: Public
+    async def fill(self, order_id: int, quantity: float | None = None) -> None:
+        '''Fill (or partially fill) order and push its activity'''
+        order: dict[str, Any] = self.orders[order_id]
+        total: float = float((order.get('orderLegCollection') or [{}])[0].get('quantity', 0))
+        filled: float = min(total, order['filledQuantity'] + (quantity or total))
+        order['filledQuantity'] = filled
+        if filled < total:
+            await self._activity("OrderPartialFill", order, Quantity=quantity)
+        else:
+            order['status'] = "FILLED"
+            await self._activity("OrderFill", order, Quantity=quantity or total)
+
+    async def start(self) -> None:
+        '''Start listening'''
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site: web.TCPSite = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+
+    def revoke(self) -> None:
+        '''Invalidate every issued access token (requests get 401 until renewal)'''
+        self.access_tokens.clear()
+
+    async def stop(self) -> None:
+        '''Stop listening'''
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # -Properties
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+
+## Functions
+async def create_session(server: MockServer, id_: str = "MOCK", **kwargs: Any) -> ClientSession:
+    """Authenticated, unthrottled session against the mock server"""
+    kwargs.setdefault('rate_limiter', None)
+    session: ClientSession = ClientSession(
+        id_, ("https://127.0.0.1", 8080), base_url=server.base_url, **kwargs
+    )
+    await session.request_tokens("code")
+    return session
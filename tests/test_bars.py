@@ -0,0 +1,82 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Bar Aggregation Tests         ##
+##-------------------------------##
+
+## Imports
+from tdameritrade.bars import BarAggregator, BarBuffer
+
+## Constants
+NAN: float = float('nan')
+
+
+## Functions
+def test_trades_aggregate_into_bars() -> None:
+    buffer = BarBuffer("AAPL", 60)
+    assert buffer.add_trade(60_000, 10.0, 1)
+    assert not buffer.add_trade(70_000, 12.0, 1)
+    assert not buffer.add_trade(80_000, 9.0, 2)
+    assert buffer.add_trade(120_000, 11.0, 4)
+    assert buffer.bars() == [
+        (60_000, 10.0, 12.0, 9.0, 9.0, 4.0),
+        (120_000, 11.0, 11.0, 11.0, 11.0, 4.0),
+    ]
+    assert list(buffer.last('vwap')) == [10.0, 11.0]
+
+
+def test_late_trades_keep_close() -> None:
+    buffer = BarBuffer("AAPL", 60)
+    buffer.add_trade(60_000, 10.0, 1)
+    buffer.add_trade(120_000, 11.0, 1)
+    buffer.add_trade(90_000, 20.0, 1)
+    assert buffer.bars()[0] == (60_000, 10.0, 20.0, 10.0, 10.0, 2.0)
+    buffer.add_trade(0, 5.0, 1)
+    assert buffer.late == 1
+
+
+def test_ring_wraps_at_capacity() -> None:
+    buffer = BarBuffer("AAPL", 60, capacity=2)
+    for minute in range(1, 5):
+        buffer.add_trade(minute * 60_000, float(minute), 1)
+    assert len(buffer) == 2
+    assert list(buffer.last('close')) == [3.0, 4.0]
+
+
+def test_non_finite_data_is_skipped() -> None:
+    buffer = BarBuffer("AAPL", 60)
+    buffer.add_trade(60_000, 10.0, 1)
+    assert not buffer.add_trade(61_000, NAN, 5)
+    assert not buffer.add_trade(62_000, 11.0, float('inf'))
+    assert not buffer.add_bar((120_000, 1.0, NAN, 1.0, 1.0, 1.0))
+    assert buffer.invalid == 3
+    assert buffer.bars() == [(60_000, 10.0, 10.0, 10.0, 10.0, 1.0)]
+
+
+def test_prepend_drops_overlap() -> None:
+    buffer = BarBuffer("AAPL", 60)
+    buffer.add_trade(120_000, 5.0, 1)
+    buffer.prepend([
+        (0, 1.0, 1.0, 1.0, 1.0, 1.0), (60_000, 2.0, 2.0, 2.0, 2.0, 1.0),
+        (120_000, 3.0, 3.0, 3.0, 3.0, 1.0),
+    ])
+    assert [bar[0] for bar in buffer.bars()] == [0, 60_000, 120_000]
+    assert buffer.bars()[-1][4] == 5.0
+
+
+async def test_aggregator_applies_stream_payloads() -> None:
+    aggregator = BarAggregator((60, 300))
+    await aggregator.apply_timesale({'content': [
+        {'key': "AAPL", '1': 60_000, '2': 10.0, '3': 1},
+        {'key': "AAPL", '1': 61_000, '2': None, '3': 2},
+        {'key': "AAPL", '1': 62_000, '3': 2},
+        {'key': "AAPL", '1': 63_000, '2': 12.0, '3': 1},
+    ]})
+    assert aggregator.get("AAPL").bars() == [(60_000, 10.0, 12.0, 10.0, 12.0, 2.0)]
+    assert aggregator.get("AAPL", 300).bars() == [(0, 10.0, 12.0, 10.0, 12.0, 2.0)]
+    closed: list[BarBuffer] = []
+    aggregator.add_handler(closed.append)
+    await aggregator.apply_timesale({'content': [{'key': "AAPL", '1': 120_000, '2': 11.0, '3': 1}]})
+    assert [buffer.seconds for buffer in closed] == [60]
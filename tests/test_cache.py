@@ -0,0 +1,124 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Response Cache Tests          ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from tdameritrade.cache import ResponseCache
+
+
+## Classes
+class FakeResponse:
+    """Stand-in response with a readable body"""
+
+    # -Constructor
+    def __init__(self, body: int) -> None:
+        self.body: int = body
+
+    # -Instance Methods
+    async def read(self) -> bytes:
+        return str(self.body).encode()
+
+
+class Fetcher:
+    """Counting fetch callable, optionally held until released"""
+
+    # -Constructor
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.release: asyncio.Event = asyncio.Event()
+        self.release.set()
+
+    # -Dunder Methods
+    async def __call__(self) -> Any:
+        self.calls += 1
+        body: int = self.calls
+        await self.release.wait()
+        return FakeResponse(body)
+
+
+## Functions
+def getter(cache: ResponseCache, fetch: Fetcher) -> Callable[..., Awaitable[Any]]:
+    """Return get of watchlists keyed by key"""
+    return lambda key=None: cache.get("watchlists", key, fetch)
+
+
+async def test_concurrent_gets_coalesce() -> None:
+    cache = ResponseCache()
+    fetch = Fetcher()
+    fetch.release.clear()
+    get = getter(cache, fetch)
+    tasks = [asyncio.create_task(get()) for _ in range(10)]
+    await asyncio.sleep(0)
+    fetch.release.set()
+    responses = await asyncio.gather(*tasks)
+    assert fetch.calls == 1 and len({id(response) for response in responses}) == 1
+    assert (cache.misses, cache.coalesced, cache.hits) == (1, 9, 0)
+    assert await get() is responses[0] and cache.hits == 1
+
+
+async def test_entries_expire() -> None:
+    cache = ResponseCache({'watchlists': 0.05})
+    fetch = Fetcher()
+    get = getter(cache, fetch)
+    first = await get()
+    assert await get() is first
+    await asyncio.sleep(0.06)
+    assert (await get()).body == 2 and fetch.calls == 2
+
+
+async def test_least_recently_used_is_evicted() -> None:
+    cache = ResponseCache(maxsize=2)
+    fetch = Fetcher()
+    get = getter(cache, fetch)
+    await get("a")
+    await get("b")
+    await get("a")
+    await get("c")
+    assert len(cache) == 2 and fetch.calls == 3
+    await get("a")
+    assert fetch.calls == 3
+    await get("b")
+    assert fetch.calls == 4
+
+
+async def test_uncached_kinds_pass_through() -> None:
+    cache = ResponseCache({})
+    fetch = Fetcher()
+    await cache.get("watchlists", None, fetch)
+    await cache.get("watchlists", None, fetch)
+    assert fetch.calls == 2 and len(cache) == 0
+
+
+async def test_invalidate_discards_inflight_read() -> None:
+    cache = ResponseCache()
+    fetch = Fetcher()
+    fetch.release.clear()
+    get = getter(cache, fetch)
+    stale = asyncio.create_task(get())
+    await asyncio.sleep(0)
+    cache.invalidate("watchlists")
+    # -Reads after the mutation do not join the request that started before it
+    fresh = asyncio.create_task(get())
+    await asyncio.sleep(0)
+    fetch.release.set()
+    assert (await stale).body == 1 and (await fresh).body == 2
+    assert (await get()).body == 2 and fetch.calls == 2
+
+
+async def test_clear_drops_everything() -> None:
+    cache = ResponseCache()
+    fetch = Fetcher()
+    await cache.get("accounts", None, fetch)
+    await cache.get("watchlists", None, fetch)
+    cache.clear()
+    assert len(cache) == 0
+    await cache.get("accounts", None, fetch)
+    assert fetch.calls == 3
@@ -0,0 +1,53 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Codec + Field Schema Tests    ##
+##-------------------------------##
+
+## Imports
+import math
+
+from tdameritrade import codec
+from tdameritrade.fields import QUOTE, SCHEMAS
+
+
+## Functions
+def test_codec_round_trip() -> None:
+    data = {'data': [{'service': "QUOTE", 'content': [{'key': "AAPL", '1': 1.5}]}]}
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumps(data).encode()) == data
+
+
+def test_schema_columns() -> None:
+    assert SCHEMAS['QUOTE'] is QUOTE
+    assert "bid_price" in QUOTE.columns
+    # -Text fields never get a numeric column
+    assert "description" not in QUOTE.columns
+    assert QUOTE.index['25'] == -1
+
+
+def test_decode_missing_fields_are_nan() -> None:
+    batch = QUOTE.create_batch(2)
+    batch.decode([
+        {'key': "AAPL", '1': 100.0, '2': 100.5, '25': "Apple Inc"},
+        {'key': "MSFT", '2': 300.0},
+    ], timestamp=5)
+    assert len(batch) == 2 and batch.timestamp == 5
+    assert batch.keys == ["AAPL", "MSFT"]
+    assert batch.get(0, "bid_price") == 100.0
+    assert math.isnan(batch.get(1, "bid_price"))
+    assert list(batch.view("ask_price")) == [100.5, 300.0]
+    assert batch.text == [{'25': "Apple Inc"}, None]
+
+
+def test_decode_reuses_and_grows_storage() -> None:
+    batch = QUOTE.create_batch(1)
+    batch.decode([{'key': f"S{i}", '1': float(i)} for i in range(5)])
+    assert batch.capacity >= 5
+    assert list(batch.view("bid_price")) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    # -Rows of the previous frame must not leak into the next one
+    batch.decode([{'key': "S9", '2': 1.0}])
+    assert len(batch) == 1 and batch.keys == ["S9"]
+    assert math.isnan(batch.get(0, "bid_price"))
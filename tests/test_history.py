@@ -0,0 +1,71 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Price History Cache Tests     ##
+##-------------------------------##
+
+## Imports
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from tdameritrade.history import CandleCache, CandleSeries, HistoryDownloader
+from tdameritrade.session import EXCHANGE_TIMEZONE
+
+from .mock import MockServer, create_session
+
+## Constants
+MINUTE: tuple[str, int] = ("minute", 1)
+
+
+## Functions
+def test_cache_keys_session_hours(tmp_path: Path) -> None:
+    cache = CandleCache(tmp_path)
+    day = date(2024, 1, 2)
+    assert cache.path("AAPL", MINUTE, day) != cache.path("AAPL", MINUTE, day, True)
+    series = CandleSeries.from_candles([{
+        'datetime': 1, 'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 10
+    }])
+    cache.store("AAPL", MINUTE, day, series, extended_hours=True)
+    assert cache.has("AAPL", MINUTE, day, True) and not cache.has("AAPL", MINUTE, day)
+    loaded = cache.load("AAPL", MINUTE, day, True)
+    assert loaded is not None and loaded.to_bytes() == series.to_bytes()
+
+
+async def test_downloader_caches_completed_days(tmp_path: Path) -> None:
+    # -Thursday through Tuesday, spanning a weekend
+    start: date = date(2024, 1, 4)
+    end: date = date(2024, 1, 9)
+    async with MockServer() as server, await create_session(server) as session:
+        cache = CandleCache(tmp_path)
+        downloader = HistoryDownloader(session, cache)
+        result = await downloader.fetch(["AAPL"], MINUTE, start, end)
+        assert not result.errors and len(result["AAPL"]) == 4
+        assert server.requests == 2
+        # -Every completed day is persisted; the weekend as empty markers
+        for offset in range(6):
+            assert cache.has("AAPL", MINUTE, start + timedelta(days=offset))
+        weekend = cache.load("AAPL", MINUTE, date(2024, 1, 6))
+        assert weekend is not None and len(weekend) == 0
+        cached = await downloader.fetch(["AAPL"], MINUTE, start, end)
+        assert server.requests == 2
+        assert [series.to_bytes() for series in cached["AAPL"]] == [
+            series.to_bytes() for series in result["AAPL"]
+        ]
+        # -Extended hours data is cached separately
+        await downloader.fetch(["AAPL"], MINUTE, start, start, extended_hours=True)
+        assert server.requests == 3
+        assert cache.has("AAPL", MINUTE, start, True)
+
+
+async def test_downloader_skips_today(tmp_path: Path) -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        cache = CandleCache(tmp_path)
+        downloader = HistoryDownloader(session, cache)
+        today: date = datetime.now(EXCHANGE_TIMEZONE).date()
+        await downloader.fetch(["AAPL"], MINUTE, today, today)
+        # -Today may still grow
+        assert not cache.has("AAPL", MINUTE, today)
+        await downloader.fetch(["AAPL"], MINUTE, today, today)
+        assert server.requests == 3
@@ -0,0 +1,85 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Lazy Import Tests             ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+import tdameritrade
+
+## Constants
+IMPORT_TARGETS: tuple[str, ...] = (
+    "tdameritrade", "tdameritrade.urls", "tdameritrade.typing", "tdameritrade.session",
+)
+
+
+## Functions
+async def bench_import(runs: int) -> dict[str, float]:
+    """Median cold import time of package entry points, each in a fresh interpreter"""
+    results: dict[str, float] = {}
+    for target in IMPORT_TARGETS:
+        code: str = (
+            "import time; start = time.perf_counter(); "
+            f"import {target}; print(time.perf_counter() - start)"
+        )
+        samples: list[float] = []
+        for _ in range(runs):
+            process: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(
+                sys.executable, "-c", code, stdout=asyncio.subprocess.PIPE
+            )
+            output: bytes = (await process.communicate())[0]
+            samples.append(float(output))
+        results[f"import_{target.replace('.', '_')}_ms"] = statistics.median(samples) * 1000
+    return results
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Return modules loaded after running code in a fresh interpreter"""
+    output: str = subprocess.run(
+        [sys.executable, "-c", f"{code}; import sys; print(' '.join(sys.modules))"],
+        capture_output=True, check=True, text=True
+    ).stdout
+    return set(output.split())
+
+
+def test_package_import_is_lazy() -> None:
+    modules: set[str] = loaded_modules("import tdameritrade")
+    assert "aiohttp" not in modules
+    assert "tdameritrade.session" not in modules
+    assert "tdameritrade.urls" not in modules
+
+
+def test_attribute_access_imports_submodule() -> None:
+    modules: set[str] = loaded_modules("import tdameritrade; tdameritrade.Order")
+    assert "tdameritrade.orders" in modules
+    assert "tdameritrade.streamer" not in modules
+
+
+def test_public_names_resolve() -> None:
+    from tdameritrade.session import ClientSession
+    assert tdameritrade.ClientSession is ClientSession
+    # -Resolved names are cached as module globals
+    assert vars(tdameritrade)['ClientSession'] is ClientSession
+    for name in tdameritrade.__all__:
+        assert getattr(tdameritrade, name).__name__ == name
+    assert set(tdameritrade.__all__) <= set(dir(tdameritrade))
+
+
+def test_unknown_name_raises() -> None:
+    with pytest.raises(AttributeError, match="Missing"):
+        tdameritrade.Missing
+
+
+async def test_lazy_import_is_faster() -> None:
+    results: dict[str, float] = await bench_import(3)
+    assert set(results) == {f"import_{target.replace('.', '_')}_ms" for target in IMPORT_TARGETS}
+    assert results['import_tdameritrade_ms'] < results['import_tdameritrade_session_ms']
@@ -0,0 +1,73 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Instrument Index Tests        ##
+##-------------------------------##
+
+## Imports
+from pathlib import Path
+from typing import Any
+
+from tdameritrade.instruments import InstrumentIndex
+
+from .mock import ACCOUNT_ID, MockServer, create_session
+
+
+## Functions
+def instrument(symbol: str, cusip: str) -> dict[str, Any]:
+    """Minimal instrument record"""
+    return {'symbol': symbol, 'cusip': cusip, 'assetType': "EQUITY"}
+
+
+def symbols(watchlist: dict[str, Any]) -> list[str]:
+    """Symbols of watchlist items in order"""
+    return [item['instrument']['symbol'] for item in watchlist['watchlistItems']]
+
+
+def test_resolve_and_search(tmp_path: Path) -> None:
+    index = InstrumentIndex(tmp_path / "instruments.db")
+    assert index.store([instrument("AAPL", "037833100"), instrument("AMZN", "023135106")]) == 2
+    assert index.store([instrument("AA", "013872106"), instrument("AAPL", "037833100")]) == 1
+    assert index.resolve("037833100")['symbol'] == "AAPL"
+    assert index.resolve("000000000") is None
+    assert [found['symbol'] for found in index.search("a")] == ["AA", "AAPL", "AMZN"]
+    assert [found['symbol'] for found in index.search("AA")] == ["AA", "AAPL"]
+    assert [found['symbol'] for found in index.search("A", limit=1)] == ["AA"]
+    assert index.search("B") == [] and index.search("ZZZ") == []
+    assert index.validate(["AMZN", "MSFT"]) == (["AMZN"], ["MSFT"])
+    # -Reopening loads the persisted index
+    reopened = InstrumentIndex(tmp_path / "instruments.db")
+    assert reopened.symbols == ["AA", "AAPL", "AMZN"]
+    assert reopened.resolve("023135106")['symbol'] == "AMZN"
+
+
+async def test_warm_fetches_only_missing(tmp_path: Path) -> None:
+    index = InstrumentIndex(tmp_path / "instruments.db")
+    index.store([instrument("AAPL", "037833100")])
+    async with MockServer() as server, await create_session(server) as session:
+        requests: int = server.requests
+        result = await index.warm(session, ["AAPL", "MSFT", "SPY"], chunk_size=1)
+        assert server.requests - requests == 2
+    assert dict(result) == {'MSFT': True, 'SPY': True} and not result.errors
+    assert index.get("MSFT")['description'] == "MSFT Mock"
+
+
+async def test_watchlist_patch_or_put() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        watchlist_id: int = await session.create_watchlist(ACCOUNT_ID, "Tech", ["AAPL", "MSFT"])
+        server.watchlists[watchlist_id]['watchlistItems'][0]['quantity'] = 10.0
+        # -Only additions: PATCH of the new symbols
+        await session.update_watchlist(ACCOUNT_ID, watchlist_id, add=["MSFT", "NVDA"])
+        assert server.watchlist_writes == ["PATCH"]
+        assert symbols(server.watchlists[watchlist_id]) == ["AAPL", "MSFT", "NVDA"]
+        # -Nothing changes: no write
+        await session.update_watchlist(ACCOUNT_ID, watchlist_id, add=["AAPL"], remove=["SPY"])
+        assert server.watchlist_writes == ["PATCH"]
+        # -Removal: one PUT keeping the remaining items' details
+        await session.update_watchlist(ACCOUNT_ID, watchlist_id, add=["AMD"], remove=["MSFT"])
+        assert server.watchlist_writes == ["PATCH", "PUT"]
+        watchlist: dict[str, Any] = server.watchlists[watchlist_id]
+        assert symbols(watchlist) == ["AAPL", "NVDA", "AMD"] and watchlist['name'] == "Tech"
+        assert watchlist['watchlistItems'][0]['quantity'] == 10.0
@@ -0,0 +1,69 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Ledger Store Tests            ##
+##-------------------------------##
+
+## Imports
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from tdameritrade.ledger import LedgerStore, date_windows
+
+from .mock import ACCOUNT_ID, FORMAT_TIMESTAMP, MockServer, create_session
+
+
+## Functions
+def order(order_id: int, day: date, status: str) -> dict[str, Any]:
+    """Minimal order entered at noon of day"""
+    entered: datetime = datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc)
+    return {
+        'orderId': order_id, 'status': status, 'enteredTime': entered.strftime(FORMAT_TIMESTAMP)
+    }
+
+
+def test_date_windows() -> None:
+    assert list(date_windows(date(2024, 1, 1), date(2024, 1, 5), 2)) == [
+        (date(2024, 1, 1), date(2024, 1, 2)), (date(2024, 1, 3), date(2024, 1, 4)),
+        (date(2024, 1, 5), date(2024, 1, 5)),
+    ]
+
+
+async def test_sync_resumes_from_mark(tmp_path: Path) -> None:
+    store = LedgerStore(tmp_path / "ledger.db")
+    today: date = datetime.now(timezone.utc).date()
+    async with MockServer() as server, await create_session(server) as session:
+        requests: int = server.requests
+        assert await store.sync(session, ACCOUNT_ID, start=today - timedelta(days=59)) == 60
+        assert server.requests - requests == 2
+        assert store.mark("transactions", ACCOUNT_ID) == today - timedelta(days=1)
+        # -Second run only re-reads from the mark; nothing is written twice
+        requests = server.requests
+        assert await store.sync(session, ACCOUNT_ID) == 0
+        assert server.requests - requests == 1
+    assert store.count("transactions", ACCOUNT_ID) == 60
+    dates: list[str] = [record['transactionDate'] for record in store.records(
+        "transactions", ACCOUNT_ID
+    )]
+    assert dates == sorted(dates)
+
+
+async def test_sync_refreshes_open_orders(tmp_path: Path) -> None:
+    store = LedgerStore(tmp_path / "ledger.db")
+    today: date = datetime.now(timezone.utc).date()
+    old: date = today - timedelta(days=100)
+    store.append("orders", ACCOUNT_ID, [order(1, old, "WORKING"), order(2, old, "FILLED")])
+    store.set_mark("orders", ACCOUNT_ID, today - timedelta(days=1))
+    async with MockServer() as server, await create_session(server) as session:
+        # -Both filled since; outside the synced windows, only the open one is re-fetched
+        server.orders = {1: order(1, old, "FILLED"), 2: order(2, old, "FILLED")}
+        requests: int = server.requests
+        assert await store.sync(session, ACCOUNT_ID, "orders") == 1
+        assert server.requests - requests == 2
+    assert [record['status'] for record in store.records("orders", ACCOUNT_ID)] == [
+        "FILLED", "FILLED"
+    ]
+    assert store.open_orders(ACCOUNT_ID, today) == []
@@ -0,0 +1,60 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Market Calendar Tests         ##
+##-------------------------------##
+
+## Imports
+from datetime import date, datetime, timezone
+
+from tdameritrade.markets import MarketCalendar
+
+from .mock import MockServer, create_session
+
+## Constants
+OPEN: datetime = datetime(2024, 3, 4, 14, 30, tzinfo=timezone.utc)
+CLOSE: datetime = datetime(2024, 3, 4, 21, tzinfo=timezone.utc)
+NEXT_OPEN: datetime = datetime(2024, 3, 5, 14, 30, tzinfo=timezone.utc)
+NEXT_CLOSE: datetime = datetime(2024, 3, 5, 21, tzinfo=timezone.utc)
+
+
+## Functions
+async def test_session_boundaries() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        calendar = MarketCalendar(session, ("EQUITY",))
+        await calendar.refresh(date(2024, 3, 4))
+    opened: float = OPEN.timestamp()
+    closed: float = CLOSE.timestamp()
+    # -Sessions are half open: open at their start, closed at their end
+    assert not calendar.is_open(at=opened - 0.001)
+    assert calendar.is_open(at=opened)
+    assert calendar.is_open(at=closed - 0.001)
+    assert not calendar.is_open(at=closed)
+    assert calendar.next_open(at=opened - 0.001) == OPEN
+    assert calendar.next_close(at=opened - 0.001) == CLOSE
+    assert calendar.next_open(at=opened) == NEXT_OPEN
+    assert calendar.next_close(at=opened) == CLOSE
+    assert calendar.next_open(at=closed) == NEXT_OPEN
+    assert calendar.next_close(at=closed) == NEXT_CLOSE
+    # -Past the loaded days nothing is known
+    assert calendar.next_open(at=NEXT_OPEN.timestamp()) is None
+    assert calendar.next_close(at=NEXT_CLOSE.timestamp()) is None
+    # -Post market starts exactly where the regular session ends
+    assert calendar.is_open(session="postMarket", at=closed)
+    assert not calendar.is_open("BOND", at=opened) and calendar.next_open("BOND") is None
+
+
+async def test_refresh_replaces_day() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        calendar = MarketCalendar(session, ("EQUITY",), days=1)
+        await calendar.refresh(date(2024, 3, 4))
+        await calendar.refresh(date(2024, 3, 4))
+        await calendar.refresh(date(2024, 3, 7))
+    # -Reloading a day does not duplicate it; days before yesterday are dropped
+    assert calendar.loaded == {date(2024, 3, 7)}
+    assert calendar.boundaries[("EQUITY", "EQU", "regularMarket")].tolist() == [
+        datetime(2024, 3, 7, 14, 30, tzinfo=timezone.utc).timestamp(),
+        datetime(2024, 3, 7, 21, tzinfo=timezone.utc).timestamp(),
+    ]
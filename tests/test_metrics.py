@@ -0,0 +1,78 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Metrics Tests                 ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import time
+
+from tdameritrade import codec
+from tdameritrade.metrics import Histogram, Metrics, endpoint
+from tdameritrade.stream import StreamRouter
+
+## Constants
+LAG: str = "tdameritrade_stream_lag_seconds"
+
+
+## Functions
+def test_histogram_buckets() -> None:
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    # -Bounds are inclusive upper limits; larger values land in +Inf
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4 and histogram.sum == 2.65
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float('inf')
+
+
+def test_prometheus_text() -> None:
+    metrics = Metrics((0.1, 1.0))
+    metrics.increment("requests_total", endpoint="/v1/quotes")
+    metrics.increment("requests_total", 2.0, endpoint="/v1/quotes")
+    metrics.set("queue_depth", 3)
+    metrics.observe("rest_seconds", 0.5, endpoint='a"b\\c\nd')
+    assert metrics.prometheus() == (
+        '# TYPE requests_total counter\n'
+        'requests_total{endpoint="/v1/quotes"} 3.0\n'
+        '# TYPE queue_depth gauge\n'
+        'queue_depth 3\n'
+        '# TYPE rest_seconds histogram\n'
+        'rest_seconds_bucket{endpoint="a\\"b\\\\c\\nd",le="0.1"} 0\n'
+        'rest_seconds_bucket{endpoint="a\\"b\\\\c\\nd",le="1.0"} 1\n'
+        'rest_seconds_bucket{endpoint="a\\"b\\\\c\\nd",le="+Inf"} 1\n'
+        'rest_seconds_sum{endpoint="a\\"b\\\\c\\nd"} 0.5\n'
+        'rest_seconds_count{endpoint="a\\"b\\\\c\\nd"} 1\n'
+    )
+
+
+def test_endpoint_normalisation() -> None:
+    assert endpoint("/v1/accounts/123456789/orders/42") == "/v1/accounts/{id}/orders/{id}"
+    assert endpoint("/v1/marketdata/AAPL/pricehistory") == "/v1/marketdata/{symbol}/pricehistory"
+    assert endpoint("/v1/marketdata/$SPX.X/movers") == "/v1/marketdata/{symbol}/movers"
+    assert endpoint("/v1/marketdata/quotes") == "/v1/marketdata/quotes"
+    assert endpoint("/v1/instruments/037833100") == "/v1/instruments/{cusip}"
+    assert endpoint("/v1/instruments") == "/v1/instruments"
+
+
+async def test_stream_lag_excludes_queueing() -> None:
+    router = StreamRouter()
+    router.metrics = Metrics()
+    router.add_data_handler("QUOTE", lambda batch: None)
+    received: float = time.time()
+    router.queue.put_nowait((received, codec.dumps({'data': [{
+        'service': "QUOTE", 'timestamp': int((received - 0.5) * 1000), 'command': "SUBS",
+        'content': [{'key': "AAPL", '1': 1.0}]
+    }]})))
+    # -Frame waits in the queue before being dispatched
+    await asyncio.sleep(0.3)
+    drain: asyncio.Task[None] = asyncio.create_task(router.drain())
+    await router.queue.join()
+    drain.cancel()
+    lag = router.metrics.histograms[(LAG, (('service', "QUOTE"),))]
+    assert lag.count == 1 and 0.49 <= lag.sum < 0.6
@@ -0,0 +1,29 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Option Chain Tests            ##
+##-------------------------------##
+
+## Imports
+from tdameritrade.options import OptionChain
+
+from .mock import MockServer, create_session
+
+
+## Functions
+async def test_rows_filter_and_copy() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        chain: OptionChain = (await session.get_option_chains(["AAPL"]))["AAPL"]
+    expiration: str = chain.expirations[0]
+    strike: float = chain.strikes[0]
+    rows: list[int] = chain.rows(expiration)
+    assert len(rows) == 2 * len(chain.strikes)
+    assert len(chain.rows(expiration, strike)) == 2
+    assert len(chain.rows(expiration, strike, "PUT")) == 1
+    # -Results are copies; mutating them leaves the index intact
+    rows.clear()
+    chain.rows(strike=strike).clear()
+    assert len(chain.rows(expiration)) == 2 * len(chain.strikes)
+    assert len(chain.rows(strike=strike)) == 2 * len(chain.expirations)
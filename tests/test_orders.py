@@ -0,0 +1,60 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Order Builder Tests           ##
+##-------------------------------##
+
+## Imports
+import pytest
+
+from tdameritrade import codec
+from tdameritrade.orders import Order, OrderTemplate, Slot
+
+from .mock import ACCOUNT_ID, MockServer, create_session
+
+
+## Functions
+def bracket(quantity: float | Slot, entry: float | Slot, target: float | Slot) -> Order:
+    """Limit entry triggering a limit exit"""
+    return Order.trigger(
+        Order.equity("BUY", "AAPL", quantity, entry),
+        Order.equity("SELL", "AAPL", quantity, target, duration="GOOD_TILL_CANCEL"),
+    )
+
+
+def test_render_matches_order() -> None:
+    template = OrderTemplate(bracket(Slot("qty"), Slot("entry"), Slot("target")))
+    assert sorted(template.slots) == ["entry", "qty", "qty", "target"]
+    for qty, entry, target in ((10, 150.25, 160.0), (1.5, 0.01, 1e6)):
+        body: bytes = template.render(qty=qty, entry=entry, target=target)
+        assert codec.loads(body) == codec.loads(bracket(qty, entry, target).to_bytes())
+
+
+@pytest.mark.parametrize("values, error, match", [
+    ({'qty': 1, 'entry': 1.0}, TypeError, "missing value of slot target"),
+    ({'qty': "1", 'entry': 1.0, 'target': 2.0}, TypeError, "slot qty requires a number"),
+    ({'qty': True, 'entry': 1.0, 'target': 2.0}, TypeError, "slot qty requires a number"),
+    ({'qty': 1, 'entry': float('nan'), 'target': 2.0}, ValueError, "finite number"),
+    ({'qty': 1, 'entry': 1.0, 'target': float('inf')}, ValueError, "finite number"),
+    ({'qty': 0, 'entry': 1.0, 'target': 2.0}, ValueError, "invalid quantity of slot qty"),
+])
+def test_render_validates_slots(values: dict[str, float], error: type, match: str) -> None:
+    template = OrderTemplate(bracket(Slot("qty"), Slot("entry"), Slot("target")))
+    with pytest.raises(error, match=match):
+        template.render(**values)
+
+
+def test_template_validates_order() -> None:
+    with pytest.raises(ValueError, match="LIMIT order requires a price"):
+        OrderTemplate(Order("LIMIT", Order.equity("BUY", "AAPL", Slot("qty")).legs))
+
+
+async def test_create_order_from_template() -> None:
+    template = OrderTemplate(Order.equity("BUY", "AAPL", Slot("qty"), Slot("price")))
+    async with MockServer() as server, await create_session(server) as session:
+        order_id: int = await session.create_order(ACCOUNT_ID, template, qty=5, price=101.5)
+        order = server.orders[order_id]
+        assert order['price'] == 101.5
+        assert order['orderLegCollection'][0]['quantity'] == 5
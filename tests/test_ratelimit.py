@@ -0,0 +1,70 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Rate Limiter Tests            ##
+##-------------------------------##
+
+## Imports
+import asyncio
+
+from tdameritrade.ratelimit import Priority, RateLimiter
+
+
+## Functions
+async def test_bucket_serves_burst_then_throttles() -> None:
+    limiter = RateLimiter(rate=20.0, capacity=5.0)
+    loop = asyncio.get_running_loop()
+    start: float = loop.time()
+    for _ in range(5):
+        await limiter.acquire()
+    assert loop.time() - start < 0.02
+    await limiter.acquire()
+    assert loop.time() - start >= 0.04
+    assert limiter.acquired == 6
+
+
+async def test_order_is_served_before_queued_bulk() -> None:
+    limiter = RateLimiter(rate=50.0, capacity=1.0)
+    await limiter.acquire()
+    served: list[Priority] = []
+
+    async def request(priority: Priority) -> None:
+        await limiter.acquire(priority)
+        served.append(priority)
+
+    tasks = [asyncio.create_task(request(Priority.BULK)) for _ in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request(Priority.ORDER)))
+    await asyncio.sleep(0)
+    assert limiter.queue_depths()[Priority.BULK] == 3
+    assert limiter.queue_depths()[Priority.ORDER] == 1
+    await asyncio.gather(*tasks)
+    assert served == [Priority.ORDER, Priority.BULK, Priority.BULK, Priority.BULK]
+
+
+async def test_cancelled_waiter_does_not_block() -> None:
+    limiter = RateLimiter(rate=50.0, capacity=1.0)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert limiter.queue_depth == 0 and not limiter._waiters
+    await asyncio.sleep(0.03)
+    await limiter.acquire()
+    assert limiter.acquired == 2 and limiter.wait_time == 0.0
+
+
+async def test_pause_holds_requests() -> None:
+    limiter = RateLimiter(rate=1000.0, capacity=10.0)
+    loop = asyncio.get_running_loop()
+    await limiter.acquire()
+    limiter.pause(0.1)
+    start: float = loop.time()
+    await limiter.acquire(Priority.ORDER)
+    assert loop.time() - start >= 0.09
+    # -Only a single probe is let through when the pause ends
+    assert limiter.tokens < 1.0
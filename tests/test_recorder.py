@@ -0,0 +1,64 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Stream Recorder Tests         ##
+##-------------------------------##
+
+## Imports
+from pathlib import Path
+from typing import Any
+
+from tdameritrade import codec
+from tdameritrade.recorder import StreamRecorder, StreamReplay, segments
+from tdameritrade.stream import StreamRouter
+
+
+## Functions
+def test_frames_round_trip(tmp_path: Path) -> None:
+    large: str = codec.dumps({'data': [{'content': "x" * 2048}]})
+    with StreamRecorder(tmp_path, compress=True, compress_min=512) as recorder:
+        recorder.write('{"notify":[]}', 1.0)
+        recorder.write(b'\x00binary', 2.0)
+        recorder.write(large, 3.0)
+    # -The large frame is stored compressed
+    assert (tmp_path / "stream.000000.tds").stat().st_size < len(large)
+    assert list(StreamReplay(tmp_path).frames()) == [
+        (1.0, '{"notify":[]}'), (2.0, b'\x00binary'), (3.0, large)
+    ]
+
+
+def test_seek_and_rotate(tmp_path: Path) -> None:
+    recorder = StreamRecorder(tmp_path, max_bytes=256, index_interval=4)
+    for second in range(100):
+        recorder.write(f'{{"n":{second}}}', float(second))
+    recorder.rotate()
+    recorder.write('{"n":100}', 100.0)
+    recorder.close()
+    assert len(segments(tmp_path, "stream")) > 2
+    replay = StreamReplay(tmp_path)
+    assert [timestamp for timestamp, _ in replay.frames(41.5, 45.0)] == [42.0, 43.0, 44.0, 45.0]
+    assert len(list(replay.frames())) == 101
+    # -Reopening continues numbering after existing segments
+    with StreamRecorder(tmp_path) as recorder:
+        recorder.write('{"n":101}', 101.0)
+    assert recorder.path == segments(tmp_path, "stream")[-1]
+
+
+async def test_replay_dispatches_through_router(tmp_path: Path) -> None:
+    with StreamRecorder(tmp_path) as recorder:
+        for second in range(3):
+            recorder.write(codec.dumps({'data': [{
+                'service': "QUOTE", 'timestamp': second, 'command': "SUBS",
+                'content': [{'key': "AAPL", '1': float(second)}]
+            }]}), float(second))
+    router = StreamRouter()
+    seen: list[float] = []
+
+    async def handler(entry: dict[str, Any]) -> None:
+        seen.append(entry['content'][0]['1'])
+
+    router.add_data_handler("QUOTE", handler, decode=False)
+    assert await StreamReplay(tmp_path).run(router, None) == 3
+    assert seen == [0.0, 1.0, 2.0]
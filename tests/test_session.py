@@ -0,0 +1,56 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Client Session Tests          ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+import pytest
+
+from .mock import MockServer, create_session
+
+
+## Functions
+async def test_expired_token_renews_once() -> None:
+    async with MockServer(latency=0.01) as server, await create_session(server) as session:
+        session.expirations['access'] = datetime.now(timezone.utc) - timedelta(seconds=1)
+        responses = await asyncio.gather(*(session.get_accounts() for _ in range(10)))
+        assert all(response.status == 200 for response in responses)
+        assert server.grants == ["authorization_code", "refresh_token"]
+        assert server.unauthorized == 0
+
+
+async def test_unauthorized_request_is_retried_once() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        server.revoke()
+        requests: int = server.requests
+        response = await session.get_accounts()
+        assert response.status == 200
+        # -401, renewal, retry
+        assert server.unauthorized == 1 and server.requests == requests + 3
+        assert server.grants == ["authorization_code", "refresh_token"]
+
+
+async def test_concurrent_unauthorized_requests_share_renewal() -> None:
+    async with MockServer(latency=0.01) as server, await create_session(server) as session:
+        server.revoke()
+        responses = await asyncio.gather(*(session.get_accounts() for _ in range(10)))
+        assert all(response.status == 200 for response in responses)
+        assert server.unauthorized == 10
+        assert server.grants == ["authorization_code", "refresh_token"]
+
+
+async def test_unauthorized_retry_is_not_repeated() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        # -Renewed tokens are rejected too
+        server.accept_tokens = False
+        with pytest.raises(aiohttp.ClientResponseError) as error:
+            await session.get_accounts()
+        assert error.value.status == 401
+        assert server.unauthorized == 2
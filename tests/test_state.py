@@ -0,0 +1,84 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Quote/Book State Tests        ##
+##-------------------------------##
+
+## Imports
+import math
+from typing import Any
+
+from tdameritrade.fields import QUOTE, ColumnBatch
+from tdameritrade.state import BookTable, QuoteTable
+from tdameritrade.stream import StreamRouter
+
+
+## Functions
+def quote_entry(timestamp: int, *content: dict[str, Any]) -> dict[str, Any]:
+    """QUOTE data frame of content"""
+    return {'data': [{
+        'service': "QUOTE", 'timestamp': timestamp, 'command': "SUBS", 'content': list(content)
+    }]}
+
+
+def book_entry(*content: dict[str, Any]) -> dict[str, Any]:
+    """NASDAQ_BOOK data frame of content"""
+    return {'data': [{
+        'service': "NASDAQ_BOOK", 'timestamp': 0, 'command': "SUBS", 'content': list(content)
+    }]}
+
+
+async def test_partial_deltas_keep_earlier_fields() -> None:
+    router = StreamRouter()
+    table = QuoteTable(capacity=1)
+    table.attach(router)
+    changed: list[list[str]] = []
+    table.add_handler(lambda table, rows: changed.append([table.symbols[row] for row in rows]))
+    await router.dispatch(quote_entry(
+        1, {'key': "AAPL", '1': 100.0, '2': 100.5, '25': "Apple"}, {'key': "MSFT", '1': 300.0}
+    ))
+    await router.dispatch(quote_entry(2, {'key': "AAPL", '2': 101.0}))
+    assert table.get("AAPL", 'bid_price') == 100.0
+    assert table.get("AAPL", 'ask_price') == 101.0
+    assert math.isnan(table.get("AAPL", 'total_volume'))
+    assert table.snapshot("AAPL")['description'] == "Apple"
+    assert table.updated[table.index["AAPL"]] == 2 and table.updated[table.index["MSFT"]] == 1
+    # -Second symbol grew the table past capacity without losing the first
+    assert table.capacity == 2 and list(table.view('bid_price')) == [100.0, 300.0]
+    assert changed == [["AAPL", "MSFT"], ["AAPL"]]
+
+
+def test_batch_merge_skips_missing_fields() -> None:
+    table = QuoteTable()
+    batch = ColumnBatch(QUOTE)
+    table.merge_batch(batch.decode([{'key': "AAPL", '1': 100.0, '2': 100.5, '25': "Apple"}], 1))
+    table.merge_batch(batch.decode([{'key': "AAPL", '1': 99.0}], 2))
+    snapshot: dict[str, Any] = table.snapshot("AAPL")
+    assert snapshot['bid_price'] == 99.0 and snapshot['ask_price'] == 100.5
+    assert snapshot['description'] == "Apple" and snapshot['symbol'] == "AAPL"
+
+
+async def test_book_snapshots_replace_levels() -> None:
+    router = StreamRouter()
+    books = BookTable(depth=2)
+    books.attach(router)
+    await router.dispatch(book_entry({
+        'key': "AAPL", '1': 5,
+        '2': [{'0': 100.0, '1': 300}, {'0': 99.9, '1': 100}, {'0': 99.8, '1': 50}],
+        '3': [{'0': 100.1, '1': 200}],
+    }))
+    ladder = books["AAPL"]
+    # -Levels beyond depth are dropped
+    assert (ladder.bids, ladder.asks, ladder.time) == (2, 1, 5)
+    assert list(ladder.bid_price) == [100.0, 99.9] and list(ladder.bid_size) == [300, 100]
+    assert round(ladder.spread, 2) == 0.1
+    await router.dispatch(book_entry({
+        'key': "AAPL", '1': 6, '2': [{'0': 100.05, '1': 10}], '3': [],
+    }))
+    # -Next snapshot replaces levels; removed ones no longer count
+    assert books["AAPL"] is ladder
+    assert (ladder.bids, ladder.asks, ladder.time) == (1, 0, 6)
+    assert ladder.best_bid == 100.05
+    assert math.isnan(ladder.best_ask) and math.isnan(ladder.spread)
@@ -0,0 +1,40 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Stream Router Tests           ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import gc
+from typing import Any
+
+import pytest
+
+from tdameritrade.stream import StreamRouter
+
+
+## Functions
+async def test_discarded_futures_are_not_reported() -> None:
+    errors: list[dict[str, Any]] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+    router = StreamRouter()
+    # -eg: login/logout/quality_of_service futures nobody awaits
+    router.expect(1)
+    router.expect(2, timeout=0.01)
+    await asyncio.sleep(0.05)
+    router.cancel_pending()
+    gc.collect()
+    assert errors == []
+
+
+async def test_awaited_futures_still_raise() -> None:
+    router = StreamRouter()
+    future = router.expect(1)
+    router.cancel_pending()
+    with pytest.raises(ConnectionResetError):
+        await future
+    with pytest.raises(asyncio.TimeoutError):
+        await router.expect(2, timeout=0.01)
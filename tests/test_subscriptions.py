@@ -0,0 +1,118 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Subscription Manager Tests    ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from typing import Any
+
+from tdameritrade.subscriptions import Subscription, SubscriptionManager
+
+
+## Classes
+class FakeWebSocket:
+    """Records sent request frames and answers each request with code"""
+
+    # -Constructor
+    def __init__(self) -> None:
+        self.closed: bool = False
+        self.sent: list[list[dict[str, Any]]] = []
+        self.failures: int = 0
+        self.code: int = 0
+        self._request_id: int = 0
+
+    # -Instance Methods
+    def create_message(self, service: str, command: str, **parameters: Any) -> dict[str, Any]:
+        self._request_id += 1
+        return {
+            'service': service, 'command': command, 'requestid': self._request_id,
+            'parameters': parameters
+        }
+
+    async def send_requests(self, requests: list[dict[str, Any]]) -> list[asyncio.Future[Any]]:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("send failed")
+        self.sent.append(requests)
+        futures: list[asyncio.Future[Any]] = []
+        for _ in requests:
+            future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            future.set_result({'content': {'code': self.code, 'msg': "rejected"}})
+            futures.append(future)
+        return futures
+
+    # -Properties
+    @property
+    def commands(self) -> list[list[str]]:
+        return [[request['command'] for request in frame] for frame in self.sent]
+
+
+## Functions
+def test_diff_sends_minimal_requests() -> None:
+    websocket = FakeWebSocket()
+    subscription = Subscription("QUOTE", (1, 2))
+    subscription.target_symbols = {"AAPL", "MSFT"}
+    requests = subscription.diff(websocket)
+    assert [request['command'] for request in requests] == ["SUBS"]
+    assert requests[0]['parameters'] == {'keys': "AAPL,MSFT", 'fields': "0,1,2"}
+    assert not subscription.dirty
+    subscription.target_symbols = {"MSFT", "TSLA"}
+    subscription.target_fields = frozenset((0, 1))
+    requests = subscription.diff(websocket)
+    assert [request['command'] for request in requests] == ["UNSUBS", "VIEW", "ADD"]
+    assert requests[0]['parameters'] == {'keys': "AAPL"}
+    assert requests[2]['parameters'] == {'keys': "TSLA", 'fields': "0,1"}
+    subscription.target_symbols = set()
+    requests = subscription.diff(websocket)
+    assert [request['command'] for request in requests] == ["UNSUBS"]
+    assert subscription.diff(websocket) == []
+
+
+async def test_changes_coalesce_into_one_frame() -> None:
+    websocket = FakeWebSocket()
+    manager = SubscriptionManager(websocket, 0.01)
+    manager.add("QUOTE", ["AAPL"])
+    manager.add("QUOTE", ["MSFT"])
+    manager.add("CHART_EQUITY", ["AAPL"])
+    await asyncio.sleep(0.05)
+    assert websocket.commands == [["SUBS", "SUBS"]]
+
+
+async def test_failed_send_rolls_back_and_retries() -> None:
+    websocket = FakeWebSocket()
+    websocket.failures = 1
+    manager = SubscriptionManager(websocket, 0.01)
+    manager.add("QUOTE", ["AAPL"])
+    await asyncio.sleep(0.1)
+    assert websocket.commands == [["SUBS"]]
+    assert manager.subscription("QUOTE").symbols == {"AAPL"}
+
+
+async def test_rejected_request_rolls_back() -> None:
+    websocket = FakeWebSocket()
+    manager = SubscriptionManager(websocket, 0.01)
+    manager.add("QUOTE", ["AAPL"])
+    await manager.flush()
+    websocket.code = 3
+    manager.add("QUOTE", ["MSFT"])
+    await manager.flush()
+    await asyncio.sleep(0)
+    assert manager.subscription("QUOTE").symbols == {"AAPL"}
+    assert manager.subscription("QUOTE").dirty
+    websocket.code = 0
+    await manager.flush()
+    assert websocket.commands == [["SUBS"], ["ADD"], ["ADD"]]
+
+
+async def test_resubscribe_resends_full_subs() -> None:
+    websocket = FakeWebSocket()
+    manager = SubscriptionManager(websocket, 0.01)
+    manager.add("QUOTE", ["AAPL", "MSFT"])
+    await manager.flush()
+    manager.resubscribe()
+    await manager.flush()
+    assert websocket.commands == [["SUBS"], ["SUBS"]]
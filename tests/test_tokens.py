@@ -0,0 +1,127 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Token Store Tests             ##
+##-------------------------------##
+
+## Imports
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from tdameritrade.session import ClientSession
+from tdameritrade.tokens import FileTokenStore, SQLiteTokenStore, TokenStore, merge_tokens
+from tdameritrade.typing import TokenDict
+
+from .mock import MockServer, create_session
+
+
+## Classes
+class SlowTokenStore(SQLiteTokenStore):
+    """SQLite store whose reads block as if another process held the write lock"""
+
+    # -Instance Methods
+    def load(self, key: str) -> TokenDict | None:
+        time.sleep(0.2)
+        return super().load(key)
+
+
+## Functions
+def tokens(
+    access: str, access_expiration: float, refresh: str | None = None,
+    refresh_expiration: float | None = None
+) -> TokenDict:
+    """Build a token dict"""
+    return {
+        'access_token': access, 'access_expiration': access_expiration,
+        'refresh_token': refresh, 'refresh_expiration': refresh_expiration,
+    }
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> TokenStore:
+    """Empty store of each backend"""
+    if request.param == "file":
+        return FileTokenStore(tmp_path / "tokens.json")
+    return SQLiteTokenStore(tmp_path / "tokens.db")
+
+
+def test_merge_keeps_later_expirations() -> None:
+    new = tokens("new", 200.0, "new-refresh", 1000.0)
+    assert merge_tokens(None, new) == new
+    assert merge_tokens(tokens("old", 100.0, "old-refresh", 500.0), new) == new
+    # -A renewal without a refresh token keeps the stored one
+    assert merge_tokens(tokens("old", 100.0, "old-refresh", 500.0), tokens("new", 200.0)) == (
+        tokens("new", 200.0, "old-refresh", 500.0)
+    )
+    # -A slower writer never rolls back what a faster one stored
+    assert merge_tokens(new, tokens("old", 100.0, "old-refresh", 500.0)) == new
+    assert merge_tokens(tokens("old", 100.0, "late-refresh", 2000.0), new) == (
+        tokens("new", 200.0, "late-refresh", 2000.0)
+    )
+
+
+def test_store_round_trip(store: TokenStore) -> None:
+    assert store.load("key") is None
+    saved = tokens("a", 100.0, "r", 1000.0)
+    assert store.save("key", saved) == saved
+    assert store.load("key") == saved
+    assert store.load("other") is None
+    store.delete("key")
+    assert store.load("key") is None
+
+
+def test_store_save_merges(store: TokenStore) -> None:
+    store.save("key", tokens("new", 200.0, "r", 1000.0))
+    merged = store.save("key", tokens("old", 100.0))
+    assert merged == tokens("new", 200.0, "r", 1000.0)
+    assert store.load("key") == merged
+
+
+def test_file_store_is_private(tmp_path: Path) -> None:
+    store = FileTokenStore(tmp_path / "tokens.json")
+    store.save("key", tokens("a", 100.0))
+    assert (tmp_path / "tokens.json").stat().st_mode & 0o777 == 0o600
+
+
+async def test_second_session_adopts_stored_tokens(store: TokenStore) -> None:
+    async with MockServer() as server:
+        async with await create_session(server, "APP", token_store=store) as first:
+            second = ClientSession(
+                "APP", ("https://127.0.0.1", 8080), base_url=server.base_url,
+                rate_limiter=None, token_store=store
+            )
+            async with second:
+                # -No login of its own: the stored tokens are adopted on construction
+                assert second.headers['AUTHORIZATION'] == first.headers['AUTHORIZATION']
+                assert second.refresh_token == first.refresh_token
+                await second.get_accounts()
+                assert server.grants == ["authorization_code"]
+                # -A renewal by the first session is picked up instead of renewing again
+                await first.renew_tokens()
+                await second.renew_tokens()
+                assert server.grants == ["authorization_code", "refresh_token"]
+                assert second.headers['AUTHORIZATION'] == first.headers['AUTHORIZATION']
+
+
+async def test_store_io_does_not_block_event_loop(tmp_path: Path) -> None:
+    store = SlowTokenStore(tmp_path / "tokens.db")
+    async with MockServer() as server, await create_session(
+        server, token_store=store
+    ) as session:
+        ticks: int = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker: asyncio.Task[None] = asyncio.create_task(tick())
+        await session.renew_tokens()
+        ticker.cancel()
+        assert ticks >= 10
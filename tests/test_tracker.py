@@ -0,0 +1,85 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Order Tracker Tests           ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from tdameritrade.orders import Order
+from tdameritrade.profile import Profile
+from tdameritrade.streamer import Streamer
+from tdameritrade.tracker import OrderTracker
+
+from .mock import ACCOUNT_ID, MockServer, create_session
+
+
+## Functions
+async def test_tracker_follows_account_activity() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        existing: int = await session.create_order(
+            ACCOUNT_ID, Order.equity("BUY", "MSFT", 3, 1.0)
+        )
+        profile = Profile(session)
+        profile.streamer_scheme = "ws"
+        streamer = Streamer(profile)
+        runner: asyncio.Task[None] = asyncio.create_task(streamer.run())
+        try:
+            tracker = OrderTracker(session, streamer, account_id=ACCOUNT_ID)
+            await tracker.start()
+            # -Not connected yet: only the first connect reconciles
+            assert tracker.reconciles == 0
+            await asyncio.wait_for(streamer.connected.wait(), 5)
+            await asyncio.sleep(0.3)
+            assert tracker.reconciles == 1
+            assert tracker.get(existing) is not None
+            assert tracker.get(existing).status == "WORKING"
+            requests: int = server.requests
+            order_id: int = await session.create_order(
+                ACCOUNT_ID, Order.equity("BUY", "AAPL", 10, 1.0)
+            )
+            await server.fill(order_id, 4)
+            await asyncio.sleep(0.1)
+            tracked = tracker.get(order_id)
+            assert tracked is not None and tracked.filled_quantity == 4
+            waiter = asyncio.create_task(tracker.wait_for(order_id, timeout=5))
+            await asyncio.sleep(0)
+            await server.fill(order_id)
+            filled = await waiter
+            assert filled.status == "FILLED" and filled.filled_quantity == 10
+            # -Streamed updates need no REST calls beyond placing the order
+            assert server.requests == requests + 1
+            # -A stale snapshot never reopens a streamed final state
+            server.orders[order_id]['status'] = "WORKING"
+            await tracker.reconcile()
+            assert tracker.get(order_id).status == "FILLED"
+            assert filled in tracker.with_status("FILLED")
+        finally:
+            await streamer.close()
+            runner.cancel()
+
+
+async def test_naive_entered_time_is_utc() -> None:
+    async with MockServer() as server, await create_session(server) as session:
+        profile = Profile(session)
+        tracker = OrderTracker(session, Streamer(profile), account_id=ACCOUNT_ID)
+        entered: datetime = datetime.now(timezone.utc) - timedelta(days=3)
+        message: str = (
+            '<OrderRouteMessage xmlns="urn:xmlns:beb.ameritrade.com">'
+            '<Order><OrderKey>42</OrderKey><OriginalQuantity>5</OriginalQuantity>'
+            f'<OrderEnteredDateTime>{entered.replace(tzinfo=None).isoformat()}'
+            '</OrderEnteredDateTime></Order></OrderRouteMessage>'
+        )
+        await tracker._on_activity({'content': [
+            {'key': "key", '1': str(ACCOUNT_ID), '2': "OrderRoute", '3': message}
+        ]})
+        tracked = tracker.get(42)
+        assert tracked is not None and tracked.status == "WORKING"
+        assert tracked.entered == entered
+        # -Open orders entered before the sync window widen it; this compared naive + aware
+        await tracker.reconcile()
+        assert tracker.reconciles == 1
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+##-------------------------------##
+## TDAmeritrade PyAPI            ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Worker Fan-out Tests          ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tdameritrade import codec
+from tdameritrade.stream import StreamRouter
+from tdameritrade.workers import RingBuffer, ShardedRouter, WorkerPool, _consume
+
+
+## Classes
+class LateStop:
+    """Stop event set while the producer slips in its final frame"""
+
+    # -Constructor
+    def __init__(self, ring: RingBuffer, frame: bytes) -> None:
+        self.ring: RingBuffer = ring
+        self.frame: bytes | None = frame
+
+    # -Instance Methods: Public
+    def is_set(self) -> bool:
+        if self.frame is not None:
+            self.ring.put(self.frame)
+            self.frame = None
+        return True
+
+
+## Functions
+def record_keys(directory: Path, router: StreamRouter, index: int) -> None:
+    """Worker setup: append received QUOTE keys to a per-worker file; BAD raises"""
+    def handler(entry: dict[str, Any]) -> None:
+        keys: list[str] = [content['key'] for content in entry['content']]
+        if "BAD" in keys:
+            raise ValueError("bad frame")
+        with open(directory / f"worker-{index}.txt", 'a') as file:
+            file.write(''.join(f"{key}\n" for key in keys))
+
+    router.add_data_handler("QUOTE", handler, decode=False)
+
+
+def fail_setup(router: StreamRouter, index: int) -> None:
+    """Worker setup that kills the worker"""
+    raise SystemExit(3)
+
+
+def quote_frame(*keys: str) -> bytes:
+    """Raw QUOTE data frame of keys"""
+    return codec.dumps({'data': [{
+        'service': "QUOTE", 'timestamp': 0, 'command': "SUBS",
+        'content': [{'key': key, '1': 1.0} for key in keys]
+    }]}).encode()
+
+
+def test_ring_wraps_around() -> None:
+    ring = RingBuffer(capacity=64)
+    try:
+        for i in range(10):
+            frame: bytes = bytes([i]) * 25
+            assert ring.put(frame)
+            assert ring.pending == 1 and ring.backlog == 29
+            assert ring.get() == frame
+        assert ring.get() is None and ring.backlog == 0
+    finally:
+        ring.close(unlink=True)
+
+
+def test_full_ring_rejects_frames() -> None:
+    ring = RingBuffer(capacity=64)
+    try:
+        assert ring.put(b"a" * 28) and ring.put(b"b" * 28)
+        assert not ring.put(b"c")
+        assert ring.stalls == 1
+        with pytest.raises(ValueError):
+            ring.put(b"x" * 64)
+        assert ring.get() == b"a" * 28
+        assert ring.put(b"c" * 28)
+        assert ring.get() == b"b" * 28 and ring.get() == b"c" * 28
+    finally:
+        ring.close(unlink=True)
+
+
+async def test_frames_reach_their_shard(tmp_path: Path) -> None:
+    keys: list[str] = [f"S{i}" for i in range(20)]
+    async with WorkerPool(partial(record_keys, tmp_path), 2) as pool:
+        router = ShardedRouter(pool)
+        await router.dispatch_raw(quote_frame(*keys[:10]))
+        # -A failing handler skips its frame without killing the worker
+        await router.dispatch_raw(quote_frame("BAD"))
+        await router.dispatch_raw(quote_frame(*keys[10:]))
+    for index in range(2):
+        received: list[str] = (tmp_path / f"worker-{index}.txt").read_text().split()
+        assert received == [key for key in keys if pool.shard(key) == index]
+
+
+async def test_consume_drains_frames_put_before_stop() -> None:
+    ring = RingBuffer(capacity=256)
+    received: list[str] = []
+    router = StreamRouter()
+    router.add_data_handler(
+        "QUOTE", lambda entry: received.extend(c['key'] for c in entry['content']), decode=False
+    )
+    try:
+        await asyncio.wait_for(_consume(ring, router, LateStop(ring, quote_frame("LAST"))), 5)
+    finally:
+        ring.close(unlink=True)
+    assert received == ["LAST"]
+
+
+async def test_submit_to_dead_worker_raises() -> None:
+    pool = WorkerPool(fail_setup, 1, capacity=256)
+    pool.start()
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, pool.processes[0].join, 10)
+        assert not pool.processes[0].is_alive()
+        with pytest.raises(RuntimeError, match="worker 0 exited"):
+            for _ in range(100):
+                await asyncio.wait_for(pool.submit(0, b"x" * 60), 5)
+    finally:
+        await pool.close()